@@ -1,7 +1,9 @@
 """
 Stock Agent API — FastAPI 진입점
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
@@ -16,8 +18,21 @@ from routers.stock_report import router as stock_report_router
 from routers.strategy_config import router as strategy_config_router
 from routers.telegram_user import router as telegram_user_router
 from routers.ticker import router as ticker_router
+from core.market_data import start_market_indices_refresher
+from core.db import get_pool_stats
+from core.adb import close_adb_pool, get_adb_pool_stats
+from core.query_metrics import get_query_stats, query_scope
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 시장 지수는 요청 시 yfinance 를 부르지 않고 백그라운드에서 주기적으로 갱신한다.
+    start_market_indices_refresher()
+    yield
+    await close_adb_pool()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +45,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def count_db_queries(request: Request, call_next):
+    """요청 단위 쿼리 수 집계 (라우트 경로별, N+1 의심 시 경고 로그) + X-DB-Queries 헤더"""
+    with query_scope() as scope:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        scope.name = f"{request.method} {route.path}" if route else "(unmatched)"
+        response.headers["X-DB-Queries"] = str(scope.queries)
+    return response
+
+
 app.include_router(admin_router)
 app.include_router(contents_router)
 app.include_router(daily_summary_router)
@@ -43,4 +69,19 @@ app.include_router(ticker_router)
 
 @app.get("/")
 def read_root():
-    return {"status": "ok", "service": "Stock Agent API"}
+    return {
+        "status": "ok",
+        "service": "Stock Agent API",
+        "db_pool": get_pool_stats(),
+        "adb_pool": get_adb_pool_stats(),
+    }
+
+
+@app.get("/metrics/db")
+def db_metrics(top: int = 20):
+    """쿼리 지문별 소요 시간·행 수, 라우트별 요청당 쿼리 수, 커넥션 풀 지표"""
+    return {
+        **get_query_stats(top=top),
+        "db_pool": get_pool_stats(),
+        "adb_pool": get_adb_pool_stats(),
+    }
@@ -0,0 +1,95 @@
+"""
+비동기 DB 연결 관리 모듈 (aiomysql) — API 의 async 조회 라우트 전용
+
+get_db() 와 같은 (conn, cursor) 형태를 async with 로 쓴다. 이벤트 루프 안에서
+바로 쿼리하므로 Starlette 스레드풀 한도에 줄 서지 않는다. 워커·저장 경로는
+기존 동기 get_db() 를 그대로 쓴다.
+
+- 풀 크기: ADB_POOL_SIZE (기본 10)
+- 대기 한도: DB_POOL_TIMEOUT 초 (기본 10, 동기 풀과 공용)
+- 풀은 첫 사용 시 현재 이벤트 루프에 만들고, 앱 종료 시 close_adb_pool() 로 닫는다.
+- aiomysql 은 풀 생성 시점에 import (워커 import 비용에 포함되지 않도록)
+- 커서는 query_metrics.AsyncInstrumentedCursor 로 감싸 get_db() 와 같이 계측한다.
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from core.config import DB_CONFIG
+from core.query_metrics import AsyncInstrumentedCursor
+
+if TYPE_CHECKING:
+    import aiomysql
+
+POOL_SIZE = int(os.getenv("ADB_POOL_SIZE", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+_pool: "aiomysql.Pool | None" = None
+_pool_lock: asyncio.Lock | None = None
+
+
+async def _get_pool() -> "aiomysql.Pool":
+    """공용 비동기 커넥션 풀 (최초 사용 시 생성)"""
+    global _pool, _pool_lock
+    if _pool is None:
+        if _pool_lock is None:
+            _pool_lock = asyncio.Lock()
+        async with _pool_lock:
+            if _pool is None:
+                import aiomysql
+
+                _pool = await aiomysql.create_pool(
+                    minsize=1,
+                    maxsize=POOL_SIZE,
+                    pool_recycle=3600,
+                    host=DB_CONFIG["host"],
+                    port=DB_CONFIG["port"],
+                    user=DB_CONFIG["user"],
+                    password=DB_CONFIG["password"],
+                    db=DB_CONFIG["database"],
+                    charset=DB_CONFIG["charset"],
+                    autocommit=True,
+                )
+    return _pool
+
+
+async def close_adb_pool():
+    """비동기 풀 종료 (앱 lifespan 종료 시)"""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        await _pool.wait_closed()
+        _pool = None
+
+
+def get_adb_pool_stats() -> dict:
+    """비동기 풀 사용 지표 스냅샷 (풀 생성 전이면 size 만)"""
+    if _pool is None:
+        return {"size": POOL_SIZE, "open": 0, "free": 0}
+    return {"size": POOL_SIZE, "open": _pool.size, "free": _pool.freesize}
+
+
+@asynccontextmanager
+async def get_adb():
+    """
+    비동기 DB 연결 관리. async with 블록을 벗어나면 커서를 닫고 연결을 풀에 반납합니다.
+    풀이 모두 사용 중이면 POOL_TIMEOUT 초까지 반납을 기다린다.
+
+    사용법:
+        async with get_adb() as (conn, cursor):
+            await cursor.execute("SELECT ...")
+            result = await cursor.fetchall()
+    """
+    import aiomysql
+
+    pool = await _get_pool()
+    conn = await asyncio.wait_for(pool.acquire(), timeout=POOL_TIMEOUT)
+    try:
+        cursor = AsyncInstrumentedCursor(await conn.cursor(aiomysql.DictCursor))
+        try:
+            yield conn, cursor
+        finally:
+            await cursor.close()
+    finally:
+        pool.release(conn)
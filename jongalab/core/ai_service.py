@@ -3,11 +3,14 @@ AI 분석 서비스 모듈 - AI 클라이언트와 콘텐츠 분석 파이프라
 """
 import logging
 from dataclasses import dataclass, field
-from ollama import Client
+from typing import TYPE_CHECKING
 
 from core.config import OLLAMA_HOST, OLLAMA_MODEL
 from core.ai_utils import parse_ai_json
 
+if TYPE_CHECKING:
+    from ollama import Client
+
 
 @dataclass
 class AnalysisResult:
@@ -18,11 +21,15 @@ class AnalysisResult:
     related_companies: list = field(default_factory=list)
 
 
-_client = Client(host=OLLAMA_HOST)
+_client = None
 
 
-def get_ai_client() -> Client:
-    """공유 AI 클라이언트 인스턴스 반환"""
+def get_ai_client() -> "Client":
+    """공유 AI 클라이언트 인스턴스 반환 (lazy init — ollama 는 최초 분석 시 import)"""
+    global _client
+    if _client is None:
+        from ollama import Client
+        _client = Client(host=OLLAMA_HOST)
     return _client
 
 
@@ -37,7 +44,7 @@ def analyze_content(prompt: str, model: str | None = None, **chat_options) -> An
         if chat_options:
             kwargs["options"] = chat_options
 
-        response = _client.chat(**kwargs)
+        response = get_ai_client().chat(**kwargs)
         raw_content = response["message"]["content"]
         data = parse_ai_json(raw_content)
 
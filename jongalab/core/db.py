@@ -1,13 +1,101 @@
 """
 DB 연결 관리 모듈 - context manager로 연결 누수 방지
+
+get_db() 는 프로세스 공용 커넥션 풀(mysql.connector.pooling)에서 연결을 빌려 쓰고
+with 블록이 끝나면 풀에 반납한다. FastAPI 앱·상주 워커(telegram_listener 등)가
+요청/메시지마다 새 TCP 연결·인증을 하지 않도록 하기 위함.
+
+- 풀 크기: DB_POOL_SIZE (기본 8, mysql.connector 상한 32)
+- 대기 한도: DB_POOL_TIMEOUT 초 (기본 10) — 모두 사용 중이면 반납을 기다린다
+- 대여 시 is_connected()(ping)로 끊긴 연결을 재접속, 반납 시 세션 리셋
+- 대기 지표: get_pool_stats()
+- 커서는 query_metrics.InstrumentedCursor 로 감싸 문장별 시간·행 수를 기록한다.
 """
+import os
+import threading
+import time
 from contextlib import contextmanager
+
 import mysql.connector
+from mysql.connector import pooling
+from mysql.connector.errors import PoolError
+
 from core.config import DB_CONFIG
+from core.query_metrics import InstrumentedCursor
+
+POOL_SIZE = min(int(os.getenv("DB_POOL_SIZE", "8")), pooling.CNX_POOL_MAXSIZE)
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+_pool: pooling.MySQLConnectionPool | None = None
+_pool_lock = threading.Lock()
+# 풀 자체는 소진 시 대기 없이 PoolError 를 내므로 세마포어로 대기열을 만든다.
+_slots = threading.BoundedSemaphore(POOL_SIZE)
+
+_stats_lock = threading.Lock()
+_stats = {"checkouts": 0, "waits": 0, "timeouts": 0, "wait_total_ms": 0.0, "wait_max_ms": 0.0, "in_use": 0}
+
+
+def _get_pool() -> pooling.MySQLConnectionPool:
+    """공용 커넥션 풀 (최초 사용 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name=f"stock_agent_{os.getpid()}",
+                    pool_size=POOL_SIZE,
+                    pool_reset_session=True,
+                    **DB_CONFIG,
+                )
+    return _pool
+
+
+def _checkout():
+    """풀에서 연결 대여 (빈 슬롯이 없으면 POOL_TIMEOUT 까지 대기) + 대기 지표 기록"""
+    started = time.perf_counter()
+    if not _slots.acquire(timeout=POOL_TIMEOUT):
+        with _stats_lock:
+            _stats["timeouts"] += 1
+        raise PoolError(f"DB 커넥션 풀 대기 시간 초과 ({POOL_TIMEOUT}s, size={POOL_SIZE})")
+    try:
+        # get_connection 은 is_connected()(ping) 실패 시 재접속한 연결을 돌려준다.
+        conn = _get_pool().get_connection()
+    except Exception:
+        _slots.release()
+        raise
+    waited = (time.perf_counter() - started) * 1000
+    with _stats_lock:
+        _stats["checkouts"] += 1
+        _stats["in_use"] += 1
+        _stats["wait_total_ms"] += waited
+        _stats["wait_max_ms"] = max(_stats["wait_max_ms"], waited)
+        if waited >= 1:
+            _stats["waits"] += 1
+    return conn
+
+
+def _release(conn):
+    try:
+        conn.close()  # 풀 연결의 close() 는 반납
+    finally:
+        with _stats_lock:
+            _stats["in_use"] -= 1
+        _slots.release()
+
+
+def get_pool_stats() -> dict:
+    """커넥션 풀 사용·대기 지표 스냅샷"""
+    with _stats_lock:
+        s = dict(_stats)
+    s["size"] = POOL_SIZE
+    s["wait_avg_ms"] = round(s["wait_total_ms"] / s["checkouts"], 3) if s["checkouts"] else 0.0
+    s["wait_total_ms"] = round(s["wait_total_ms"], 3)
+    s["wait_max_ms"] = round(s["wait_max_ms"], 3)
+    return s
 
 
 def get_connection():
-    """단순 DB 연결 반환 (수동 close 필요)"""
+    """단순 DB 연결 반환 (수동 close 필요, 풀 미사용)"""
     return mysql.connector.connect(**DB_CONFIG)
 
 
@@ -15,17 +103,23 @@ def get_connection():
 def get_db():
     """
     Context manager로 안전한 DB 연결 관리.
-    with 블록을 벗어나면 자동으로 커서와 연결을 닫아줍니다.
+    with 블록을 벗어나면 자동으로 커서를 닫고 연결을 풀에 반납합니다.
     
     사용법:
         with get_db() as (conn, cursor):
             cursor.execute("SELECT ...")
             result = cursor.fetchall()
     """
-    conn = mysql.connector.connect(**DB_CONFIG)
-    cursor = conn.cursor(dictionary=True)
+    conn = _checkout()
+    try:
+        cursor = InstrumentedCursor(conn.cursor(dictionary=True))
+    except Exception:
+        _release(conn)
+        raise
     try:
         yield conn, cursor
     finally:
-        cursor.close()
-        conn.close()
+        try:
+            cursor.close()
+        finally:
+            _release(conn)
@@ -6,10 +6,16 @@ shape** 으로 미러링한다. 키움 연동이 별도 서버(localhost :8001)
 이 클라이언트를 KiwoomRestAPI 자리에 그대로 주입받아 내부 로직 변경 없이 동작한다.
 
 서버가 요청마다 토큰을 보장하므로 ensure_token() 은 no-op 이다.
+
+PaperOrderClient 는 주문/계좌 TR(kt10000·kt00001·kt00018)만 로컬에서 모의 체결하고
+시세 조회는 그대로 서버로 보낸다 — OrderExecutor 리허설·검증용.
 """
 import logging
+import threading
+from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from core.config import KIWOOM_BASE_URL
 
@@ -17,14 +23,18 @@ logger = logging.getLogger("KiwoomClient")
 
 # 키움 분봉 페이지네이션 등은 서버 측에서 수 초 걸릴 수 있어 넉넉히 잡는다.
 _TIMEOUT = 30
+# 동시 조회(gap_check 등) 시 스레드별 keep-alive 연결을 재사용할 수 있도록 풀을 넉넉히 둔다.
+_POOL_SIZE = 16
 
 
 class KiwoomRestClient:
     def __init__(self, base_url: str | None = None):
         self.base_url = (base_url or KIWOOM_BASE_URL).rstrip("/")
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_SIZE))
 
     def _post(self, path: str, body: dict):
-        resp = requests.post(f"{self.base_url}{path}", json=body, timeout=_TIMEOUT)
+        resp = self.session.post(f"{self.base_url}{path}", json=body, timeout=_TIMEOUT)
         resp.raise_for_status()
         return resp.json()
 
@@ -36,6 +46,9 @@ class KiwoomRestClient:
     def get_stock_basic_info(self, stk_cd: str) -> dict:
         return self._post("/stock/basic-info", {"stk_cd": stk_cd})
 
+    def get_watchlist_info(self, stk_cds: list[str]) -> dict:
+        return self._post("/stock/watchlist-info", {"stk_cds": stk_cds})
+
     def get_stock_detail_info(self, stk_cd: str) -> dict:
         return self._post("/stock/detail-info", {"stk_cd": stk_cd})
 
@@ -94,3 +107,80 @@ class KiwoomRestClient:
             "/theme/stocks",
             {"thema_grp_cd": thema_grp_cd, "date_tp": date_tp, "stex_tp": stex_tp},
         )
+
+    # ── 주문 ──
+    def place_buy_order(self, stk_cd: str, qty: int, price: int, trde_tp: str = "0") -> dict:
+        return self._post(
+            "/order/buy",
+            {"stk_cd": stk_cd, "qty": qty, "price": price, "trde_tp": trde_tp},
+        )
+
+    def place_sell_order(self, stk_cd: str, qty: int, price: int, trde_tp: str = "0") -> dict:
+        return self._post(
+            "/order/sell",
+            {"stk_cd": stk_cd, "qty": qty, "price": price, "trde_tp": trde_tp},
+        )
+
+    # ── 계좌 ──
+    def get_deposit(self) -> dict:
+        return self._post("/account/deposit", {})
+
+    def get_evaluation_balance(self) -> dict:
+        return self._post("/account/balance", {})
+
+
+class PaperOrderClient(KiwoomRestClient):
+    """주문/계좌 TR 로컬 모의 — 접수 즉시 지정 단가(시장가는 기준가)로 전량 체결 처리.
+
+    응답은 키움 kt10000 / kt00001 / kt00018 과 같은 필드명·문자열 숫자 형식을 따른다.
+    """
+
+    def __init__(self, cash: int = 10_000_000, base_url: str | None = None):
+        super().__init__(base_url)
+        self.cash = cash
+        self.holdings: dict[str, dict] = {}  # {code: {qty, cost}}
+        self.orders: list[dict] = []
+        self._lock = threading.Lock()
+
+    def _fill(self, stk_cd: str, qty: int, price: int, side: int) -> dict:
+        code = stk_cd.split("_")[0]
+        with self._lock:
+            h = self.holdings.setdefault(code, {"qty": 0, "cost": 0})
+            if side > 0:
+                if price * qty > self.cash:
+                    return {"return_code": 1, "return_msg": "주문가능금액 부족"}
+                h["qty"] += qty
+                h["cost"] += price * qty
+            else:
+                if qty > h["qty"]:
+                    return {"return_code": 1, "return_msg": "매도가능수량 부족"}
+                h["cost"] -= h["cost"] * qty // h["qty"]
+                h["qty"] -= qty
+            self.cash -= side * price * qty
+            ord_no = f"{len(self.orders) + 1:07d}"
+            self.orders.append({
+                "ord_no": ord_no, "stk_cd": code, "qty": qty, "price": price,
+                "side": side, "at": datetime.now().isoformat(timespec="milliseconds"),
+            })
+        return {"return_code": 0, "return_msg": "모의 체결", "ord_no": ord_no}
+
+    def place_buy_order(self, stk_cd: str, qty: int, price: int, trde_tp: str = "0") -> dict:
+        return self._fill(stk_cd, qty, price, side=1)
+
+    def place_sell_order(self, stk_cd: str, qty: int, price: int, trde_tp: str = "0") -> dict:
+        return self._fill(stk_cd, qty, price, side=-1)
+
+    def get_deposit(self) -> dict:
+        return {"return_code": 0, "ord_alow_amt": f"{self.cash:015d}"}
+
+    def get_evaluation_balance(self) -> dict:
+        with self._lock:
+            items = [
+                {
+                    "stk_cd": f"A{code}",
+                    "rmnd_qty": f"{h['qty']:015d}",
+                    "pur_pric": f"{h['cost'] // h['qty']:015d}",
+                }
+                for code, h in self.holdings.items() if h["qty"] > 0
+            ]
+        return {"return_code": 0, "acnt_evlt_remn_indv_tot": items}
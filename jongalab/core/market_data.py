@@ -2,16 +2,19 @@
 시장 데이터 서비스
 - 개별 종목(시세/차트/종목명/주도주): 키움 REST API (6자리 종목코드 기준)
 - 주요 지수(미국지수·국내지수·원자재·환율): yfinance
+
+yfinance·pykrx(및 pandas)는 import 만으로 수 초가 걸려 최초 사용 시점에 불러온다.
 """
 import math
 import re
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
-import yfinance as yf
-from pykrx import stock as pykrx_stock
-
-from core.repository.ticker import lookup_name_by_ticker
+from core.repository.ticker_index import invalidate_ticker_index, ticker_name_map
 
 
 # ── 키움 데이터 서버 클라이언트 (국내 종목 시세 — lazy singleton, HTTP) ──
@@ -74,39 +77,60 @@ def _safe_float(val) -> float | None:
     return round(f, 2)
 
 
-def _fetch_quote(item: dict) -> dict:
-    """하나의 종목/지수 데이터를 yfinance에서 조회"""
-    empty = {**item, "price": None, "change": None, "change_percent": None}
+def _fetch_quotes(items: list[dict]) -> list[dict]:
+    """전체 지수를 yfinance 한 번의 배치 다운로드로 조회.
+
+    종가 프레임(행=날짜, 열=심볼)에서 심볼별 마지막/직전 유효 종가를 벡터 연산으로 뽑는다.
+    심볼마다 휴장일이 달라(BTC 주말 거래 등) 행 단위 iloc[-1] 대신 '뒤에서 n번째 유효값'을 쓴다.
+    값 처리 규칙은 심볼별 조회 때와 같다 — 유효 종가가 하나뿐이면 직전=현재(등락 0),
+    직전 종가가 0 이면 등락 None, nan/inf 는 _safe_float 로 None.
+    """
+    import pandas as pd
+    import yfinance as yf
+
+    symbols = [item["symbol"] for item in items]
+    empty = [{**item, "price": None, "change": None, "change_percent": None} for item in items]
     try:
-        stock = yf.Ticker(item["symbol"])
-        hist = stock.history(period="5d")
-        if hist.empty:
-            return empty
-        current = _safe_float(hist["Close"].iloc[-1])
-        if current is None:
+        df = yf.download(
+            symbols, period="5d", auto_adjust=True, progress=False, group_by="column",
+        )
+        if df is None or df.empty:
             return empty
-        prev = _safe_float(hist["Close"].iloc[-2]) if len(hist) >= 2 else current
-        if prev is None or prev == 0:
-            return {**item, "price": current, "change": None, "change_percent": None}
-        change = round(current - prev, 2)
-        change_pct = round((change / prev) * 100, 2)
-        return {
-            **item,
-            "price": current,
-            "change": change,
-            "change_percent": change_pct,
-        }
+        close = df["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(symbols[0])
+        close = close.reindex(columns=symbols)
     except Exception:
         return empty
 
+    valid = close.notna()
+    # 각 칸 기준 '그 행 이후(포함) 유효값 개수' — 1 이면 마지막, 2 면 직전 유효 종가
+    remaining = valid.iloc[::-1].cumsum().iloc[::-1]
+    current = close.where(valid & remaining.eq(1)).max().round(2)
+    prev = close.where(valid & remaining.eq(2)).max().round(2).fillna(current)
+    change = (current - prev).round(2)
+    change_pct = (change / prev.where(prev != 0) * 100).round(2)
+
+    results = []
+    for item in items:
+        sym = item["symbol"]
+        price = _safe_float(current[sym])
+        if price is None:
+            results.append({**item, "price": None, "change": None, "change_percent": None})
+            continue
+        pct = _safe_float(change_pct[sym])
+        results.append({
+            **item,
+            "price": price,
+            "change": _safe_float(change[sym]) if pct is not None else None,
+            "change_percent": pct,
+        })
+    return results
+
 
-def _kiwoom_quote(code: str) -> dict:
-    """키움 ka10001 기준 실시간 현재가/등락 (실패 시 None)"""
+def _quote_from_info(info: dict) -> dict:
+    """ka10001/ka10095 응답 행 → 현재가/등락 (현재가 0 이면 None)"""
     none = {"price": None, "change": None, "change_percent": None}
-    try:
-        info = _get_kiwoom().get_stock_basic_info(code)
-    except Exception:
-        return none
     cur = abs(_parse_num(info.get("cur_prc")))
     if cur == 0:
         return none
@@ -124,6 +148,49 @@ def _kiwoom_quote(code: str) -> dict:
     }
 
 
+def _kiwoom_quote(code: str) -> dict:
+    """키움 ka10001 기준 실시간 현재가/등락 (실패 시 None)"""
+    try:
+        info = _get_kiwoom().get_stock_basic_info(code)
+    except Exception:
+        return {"price": None, "change": None, "change_percent": None}
+    return _quote_from_info(info)
+
+
+# ── 일봉 캐시 ──
+# 과거 일자의 일봉은 바뀌지 않으므로 종목별 마지막 조회분(기준일 이전 약 600거래일)을 보관하고,
+# 범위 안의 과거 날짜 요청은 키움 재조회 없이 캐시에서 푼다. 당일 봉은 장중 변하므로 캐시하지 않는다.
+_CANDLE_CACHE_SIZE = 512
+
+_candle_cache: "OrderedDict[str, list[dict]]" = OrderedDict()
+_candle_lock = threading.Lock()
+
+
+def _daily_candles(code: str, tgt: str) -> list[dict]:
+    """tgt(YYYYMMDD) 이하 일봉을 최신순으로 반환 (tgt 포함 최소 2봉을 덮으면 캐시 사용)"""
+    today = datetime.now().strftime("%Y%m%d")
+    with _candle_lock:
+        cached = _candle_cache.get(code)
+        if cached is not None:
+            _candle_cache.move_to_end(code)
+    if cached and tgt < today and cached[-1]["dt"] < tgt <= cached[0]["dt"]:
+        return [c for c in cached if c["dt"] <= tgt]
+
+    data = _get_kiwoom().get_daily_chart(code, dt=tgt)
+    candles = sorted(
+        [c for c in data.get("stk_dt_pole_chart_qry", []) if c.get("dt") and c["dt"] <= tgt],
+        key=lambda c: c["dt"], reverse=True,
+    )
+    past = [c for c in candles if c["dt"] < today]
+    if past:
+        with _candle_lock:
+            _candle_cache[code] = past
+            _candle_cache.move_to_end(code)
+            while len(_candle_cache) > _CANDLE_CACHE_SIZE:
+                _candle_cache.popitem(last=False)
+    return candles
+
+
 def _kiwoom_price_on_date(code: str, ticker: str, date: str) -> dict:
     """키움 ka10081 일봉으로 특정 일자 종가 + 전 거래일 대비 등락률 조회"""
     try:
@@ -132,16 +199,10 @@ def _kiwoom_price_on_date(code: str, ticker: str, date: str) -> dict:
         return {"error": "잘못된 날짜 형식입니다."}
 
     try:
-        data = _get_kiwoom().get_daily_chart(code, dt=target.strftime("%Y%m%d"))
-        candles = data.get("stk_dt_pole_chart_qry", [])
+        rows = _daily_candles(code, target.strftime("%Y%m%d"))
     except Exception:
         return {"error": "데이터를 찾을 수 없습니다."}
 
-    tgt = target.strftime("%Y%m%d")
-    rows = sorted(
-        [c for c in candles if c.get("dt") and c["dt"] <= tgt],
-        key=lambda c: c["dt"], reverse=True,
-    )
     if not rows:
         return {"error": "데이터를 찾을 수 없습니다."}
 
@@ -183,6 +244,48 @@ def fetch_stock_price(ticker: str, date: str | None = None) -> dict:
     return {"ticker": ticker, **q}
 
 
+# 키움 ka10095 한 번에 담을 수 있는 종목 수 / 날짜 지정 시 동시 일봉 조회 수
+_BATCH_QUOTE_SIZE = 100
+_BATCH_CHART_WORKERS = 4
+
+
+def fetch_stock_prices(tickers: list[str], date: str | None = None) -> dict[str, dict]:
+    """여러 종목 주가 일괄 조회. 반환: {ticker: fetch_stock_price 와 같은 shape}
+
+    - date 미지정: 키움 ka10095(관심종목정보)로 최대 100종목씩 한 번에 조회.
+    - date 지정: 종목별 일봉(캐시 우선)으로 해당 일자 종가·등락률.
+    일부 종목만 실패해도 나머지는 정상 반환하고, 실패 종목은 {"error": ...} 로 채운다.
+    """
+    not_found = {"error": "데이터를 찾을 수 없습니다."}
+    codes = {t: _norm_code(t) for t in dict.fromkeys(tickers)}
+    result = {t: not_found for t, code in codes.items() if not code}
+    valid = {t: code for t, code in codes.items() if code}
+
+    if date:
+        with ThreadPoolExecutor(max_workers=_BATCH_CHART_WORKERS) as pool:
+            prices = pool.map(
+                lambda item: _kiwoom_price_on_date(item[1], item[0], date), valid.items(),
+            )
+            result.update(zip(valid.keys(), prices))
+        return {t: result[t] for t in codes}
+
+    unique_codes = list(dict.fromkeys(valid.values()))
+    quotes: dict[str, dict] = {}
+    for i in range(0, len(unique_codes), _BATCH_QUOTE_SIZE):
+        chunk = unique_codes[i : i + _BATCH_QUOTE_SIZE]
+        try:
+            rows = _get_kiwoom().get_watchlist_info(chunk).get("atn_stk_infr", [])
+        except Exception:
+            continue
+        for row in rows:
+            quotes[_norm_code(row.get("stk_cd", ""))] = _quote_from_info(row)
+
+    for t, code in valid.items():
+        q = quotes.get(code)
+        result[t] = {"ticker": t, **q} if q and q["price"] is not None else not_found
+    return {t: result[t] for t in codes}
+
+
 def fetch_stock_history(ticker: str, period: str = "7d") -> list[dict]:
     """최근 주가 히스토리 (차트 오버레이용, 키움 일봉)"""
     code = _norm_code(ticker)
@@ -211,13 +314,90 @@ def fetch_stock_history(ticker: str, period: str = "7d") -> list[dict]:
     return result
 
 
+# ── 종목명 인덱스 (프로세스 내 메모리) ──
+# ticker_dictionary 인덱스(core.repository.ticker_index) + 일일 KRX 상장 종목 스냅샷을 적재해 두고,
+# 둘 다에 없는 코드만 pykrx/키움 개별 조회(LRU 캐시)로 푼다.
+_NAME_MISS_CACHE_SIZE = 1024
+_KRX_LISTING_RETRY_SEC = 600
+
+_name_lock = threading.Lock()
+_krx_names: dict[str, str] = {}
+_krx_names_date = None
+_krx_loading = threading.Lock()
+_krx_attempted_at = -float(_KRX_LISTING_RETRY_SEC)
+
+
+def _load_krx_listing():
+    """KRX(코스피·코스닥) 상장 종목 {코드: 종목명} 스냅샷을 하루 한 번 적재"""
+    global _krx_names, _krx_names_date, _krx_attempted_at
+    if not _krx_loading.acquire(blocking=False):
+        return
+    try:
+        from pykrx import stock as pykrx_stock
+
+        today = datetime.now().date()
+        if _krx_names_date == today or time.monotonic() - _krx_attempted_at < _KRX_LISTING_RETRY_SEC:
+            return
+        _krx_attempted_at = time.monotonic()
+        names = {
+            code: pykrx_stock.get_market_ticker_name(code)
+            for code in pykrx_stock.get_market_ticker_list(market="ALL")
+        }
+        with _name_lock:
+            _krx_names = {code: name for code, name in names.items() if name}
+            _krx_names_date = today
+        _resolve_name_fallback.cache_clear()
+    except Exception:
+        pass
+    finally:
+        _krx_loading.release()
+
+
+def _name_index() -> tuple[dict[str, str], dict[str, str]]:
+    """(ticker_dictionary 맵, KRX 스냅샷). 사전은 공유 인덱스에서, 스냅샷은 날짜가 바뀌면 백그라운드 재적재."""
+    dict_names = ticker_name_map()
+    with _name_lock:
+        krx_names, krx_date = _krx_names, _krx_names_date
+    if krx_date != datetime.now().date() and not _krx_loading.locked():
+        threading.Thread(target=_load_krx_listing, daemon=True).start()
+    return dict_names, krx_names
+
+
+def invalidate_stock_name_index():
+    """티커 사전 변경(관리자 수정/삭제) 시 호출 — 다음 조회에서 사전을 다시 적재"""
+    invalidate_ticker_index()
+    _resolve_name_fallback.cache_clear()
+
+
+@lru_cache(maxsize=_NAME_MISS_CACHE_SIZE)
+def _resolve_name_fallback(code: str) -> str | None:
+    """인덱스에 없는 6자리 코드 → pykrx → 키움 ka10001 순서로 종목명 조회.
+
+    키움이 정상 응답했는데 이름이 없는 경우(확정 미스)만 None 으로 캐시한다.
+    키움 조회가 예외로 끝나면(일시 장애) 예외를 그대로 올려 lru_cache 에 남지 않게 한다.
+    pykrx 오류는 키움 조회로 넘어가므로 따로 올리지 않는다.
+    """
+    try:
+        from pykrx import stock as pykrx_stock
+        kr_name = pykrx_stock.get_market_ticker_name(code)
+        if kr_name:
+            return kr_name
+    except Exception:
+        pass
+
+    info = _get_kiwoom().get_stock_basic_info(code)
+    return (info.get("stk_nm") or "").strip() or None
+
+
 def fetch_stock_name(ticker: str) -> str:
-    """티커로 종목명 조회 (dictionary → pykrx → 키움 순서, 국장 전용)"""
+    """티커로 종목명 조회 (dictionary → KRX 스냅샷 → pykrx → 키움 순서, 국장 전용)"""
     original_ticker = ticker
     ticker = (ticker or "").strip().upper()
 
-    # 1) ticker_dictionary에서 우선 조회
-    dict_name = lookup_name_by_ticker(ticker)
+    dict_names, krx_names = _name_index()
+
+    # 1) ticker_dictionary 우선
+    dict_name = dict_names.get(ticker)
     if dict_name:
         return dict_name
 
@@ -225,24 +405,133 @@ def fetch_stock_name(ticker: str) -> str:
     if not re.match(r"^\d{6}$", code):
         return original_ticker
 
-    # 2) pykrx로 한글명 조회
+    # 2) 일일 KRX 상장 종목 스냅샷
+    krx_name = krx_names.get(code)
+    if krx_name:
+        return krx_name
+
+    # 3) 개별 조회 (pykrx → 키움, LRU 캐시 — 일시 장애는 캐시하지 않음)
     try:
-        kr_name = pykrx_stock.get_market_ticker_name(code)
-        if kr_name:
-            return kr_name
+        return _resolve_name_fallback(code) or original_ticker
     except Exception:
-        pass
+        return original_ticker
+
+
+# ── 시장 지수 캐시 (백그라운드 갱신 + stale-while-revalidate) ──
+# 장중(국장 08:00~16:00, 미장 22:00~06:00 KST)엔 짧게, 그 외엔 길게 갱신한다.
+INDICES_REFRESH_MARKET_SEC = 60
+INDICES_REFRESH_IDLE_SEC = 600
+
+_indices_cache: dict = {"data": None, "fetched_at": None}
+_indices_lock = threading.Lock()
+_indices_refreshing = threading.Lock()
+_indices_refresher: threading.Thread | None = None
+
+
+def _indices_refresh_interval(now: datetime | None = None) -> int:
+    """현재 시각 기준 지수 갱신 주기(초)"""
+    now = now or datetime.now()
+    hour = now.hour
+    weekday = now.weekday()
+    kr_open = weekday < 5 and 8 <= hour < 16
+    # 미장은 KST 기준 월 밤 ~ 토 새벽
+    us_open = (weekday < 5 and hour >= 22) or (0 < weekday <= 5 and hour < 6)
+    return INDICES_REFRESH_MARKET_SEC if kr_open or us_open else INDICES_REFRESH_IDLE_SEC
 
-    # 3) 키움 ka10001 폴백
+
+def _merge_indices(old: dict | None, new: dict) -> tuple[dict, bool]:
+    """새 조회 결과에서 시세가 비어 있는(price None) 심볼은 이전 값으로 채운다.
+
+    반환: (병합 결과, 새로 받은 시세가 하나라도 있는지)
+    _fetch_quotes 는 yfinance 장애·스로틀 시 예외 대신 전부 None 을 돌려주므로 여기서 걸러낸다.
+    """
+    previous = {
+        item["symbol"]: item
+        for items in (old or {}).values() for item in items
+        if item.get("price") is not None
+    }
+    fresh = False
+    merged = {}
+    for category, items in new.items():
+        merged[category] = []
+        for item in items:
+            if item.get("price") is not None:
+                fresh = True
+                merged[category].append(item)
+            else:
+                merged[category].append(previous.get(item["symbol"], item))
+    return merged, fresh
+
+
+def _refresh_market_indices(wait: bool = False):
+    """지수를 새로 조회해 캐시 교체. 동시에 하나만 실행되고, 실패 시 기존 값 유지.
+
+    심볼별로 조회에 실패하면 그 심볼의 직전 시세를 유지하고, 전부 실패하면
+    캐시(및 fetched_at)를 건드리지 않아 stale 표시가 그대로 남는다.
+    wait=False 면 이미 갱신 중일 때 바로 돌아가고, True 면 진행 중인 갱신을 기다린다.
+    """
+    if not _indices_refreshing.acquire(blocking=wait):
+        return
     try:
-        info = _get_kiwoom().get_stock_basic_info(code)
-        name = (info.get("stk_nm") or "").strip()
-        if name:
-            return name
+        if wait and _indices_cache["data"] is not None:
+            return  # 기다리는 동안 다른 스레드가 채움
+        data = fetch_market_indices()
+        with _indices_lock:
+            data, fresh = _merge_indices(_indices_cache["data"], data)
+            if not fresh:
+                return
+            _indices_cache["data"] = data
+            _indices_cache["fetched_at"] = datetime.now()
     except Exception:
         pass
+    finally:
+        _indices_refreshing.release()
 
-    return original_ticker
+
+def _indices_refresh_loop():
+    while True:
+        _refresh_market_indices()
+        time.sleep(_indices_refresh_interval())
+
+
+def start_market_indices_refresher():
+    """API 기동 시 백그라운드 지수 갱신 스레드 시작 (중복 호출 무시)"""
+    global _indices_refresher
+    if _indices_refresher is None:
+        _indices_refresher = threading.Thread(
+            target=_indices_refresh_loop, name="market-indices-refresher", daemon=True,
+        )
+        _indices_refresher.start()
+
+
+def get_market_indices_cached() -> dict:
+    """캐시된 지수 즉시 반환 (stale-while-revalidate).
+
+    갱신 주기를 넘긴 값이면 백그라운드 갱신만 걸어두고 기존 값을 그대로 돌려준다.
+    캐시가 아직 비어 있을 때(기동 직후)만 동기로 조회한다.
+    응답에 as_of(조회 시각), age_seconds, stale 를 함께 싣는다.
+    """
+    with _indices_lock:
+        data, fetched_at = _indices_cache["data"], _indices_cache["fetched_at"]
+
+    if data is None:
+        _refresh_market_indices(wait=True)
+        with _indices_lock:
+            data, fetched_at = _indices_cache["data"], _indices_cache["fetched_at"]
+        if data is None:
+            return {category: [] for category in MARKET_INDICES}
+
+    age = (datetime.now() - fetched_at).total_seconds()
+    stale = age > _indices_refresh_interval()
+    if stale:
+        threading.Thread(target=_refresh_market_indices, daemon=True).start()
+
+    return {
+        **data,
+        "as_of": fetched_at.isoformat(timespec="seconds"),
+        "age_seconds": round(age, 1),
+        "stale": stale,
+    }
 
 
 def fetch_market_indices() -> dict:
@@ -251,8 +540,7 @@ def fetch_market_indices() -> dict:
     for items in MARKET_INDICES.values():
         all_items.extend(items)
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        results = list(executor.map(_fetch_quote, all_items))
+    results = _fetch_quotes(all_items)
 
     grouped = {}
     idx = 0
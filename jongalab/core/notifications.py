@@ -214,7 +214,7 @@ def send_gap_check_alert(
             )
         else:
             message = (
-                f"📊 *[갭 체크] {report_date} Top 10*\n"
+                f"📊 *[갭 체크] {report_date} Top {len(rows)}*\n"
                 f"(리포트 시각 → {check_time})\n\n"
                 f"🏆 *{wins}승 {losses}패* "
                 f"(보합 {len(flats)} / 승률 {win_rate:.0f}%)\n"
@@ -230,3 +230,69 @@ def send_gap_check_alert(
 
     except Exception as e:
         logging.error(f"❌ 갭 체크 전송 실패: {e}")
+
+
+def send_variant_gap_alert(
+    report_date: str, check_time: str, summaries: dict[str, dict], is_retry: bool = False
+):
+    """섀도 변형 전략 갭 성과 비교 — ADMIN 유저에게만 전송
+
+    summaries: {label: {wins, losses, flats, total, avg_pct}}  ("live" = 실제 운용 전략)
+    """
+    try:
+        venue = "KRX" if is_retry else "NXT"
+        lines = []
+        for label, s in summaries.items():
+            tracked = s["total"]
+            win_rate = (s["wins"] / tracked * 100) if tracked else 0.0
+            avg = f"{s['avg_pct']:+.2f}%" if s.get("avg_pct") is not None else "-"
+            marker = "⭐" if label == "live" else "🧪"
+            lines.append(
+                f"{marker} *{label}*  `{s['wins']}승 {s['losses']}패` "
+                f"(승률 {win_rate:.0f}% / 평균 `{avg}`)"
+            )
+
+        message = (
+            f"🧪 *[변형 전략 갭 비교] {report_date}* `{venue}`\n"
+            f"(리포트 시각 → {check_time})\n"
+            f"──────────────────\n\n"
+            + "\n".join(lines)
+        )
+
+        count = _send_telegram_admin(message)
+        logging.info(f"📨 변형 갭 비교 전송 완료 -> {count}개 채팅방 ({len(summaries)}개 전략)")
+
+    except Exception as e:
+        logging.error(f"❌ 변형 갭 비교 전송 실패: {e}")
+
+
+def send_order_execution_alert(report_date: str, tickets: list, positions: dict, paper: bool = False):
+    """종가베팅 주문 실행 결과 — ADMIN 유저에게만 전송
+
+    tickets: [OrderTicket], positions: {code: Position}
+    """
+    try:
+        lines = []
+        for t in tickets:
+            pos = positions.get(t.code)
+            if not pos:
+                lines.append(f"❌ *{t.name}* 주문 실패 (0/{t.quantity}주)")
+                continue
+            mark = "✅" if pos.quantity >= t.quantity else "⏳"
+            lines.append(
+                f"{mark} *{t.name}* `{pos.quantity}/{t.quantity}주` "
+                f"평단 {pos.avg_price:,.0f} (분할 {pos.splits_done}/{len(t.splits)})"
+            )
+
+        title = "🧪 *[모의 주문]*" if paper else "💸 *[종가베팅 주문]*"
+        message = (
+            f"{title} {report_date}\n"
+            f"──────────────────\n\n"
+            + "\n".join(lines)
+        )
+
+        count = _send_telegram_admin(message)
+        logging.info(f"📨 주문 결과 전송 완료 -> {count}개 채팅방")
+
+    except Exception as e:
+        logging.error(f"❌ 주문 결과 전송 실패: {e}")
@@ -0,0 +1,244 @@
+"""DB 쿼리 계측 — 문장 지문별 시간·행 수 집계, 느린 쿼리 로그, 요청/워커 단위 N+1 감지
+
+get_db()/get_adb() 가 돌려주는 커서가 실행마다 record() 를 부른다.
+
+- 지문(fingerprint): 공백을 접고, 리터럴·플레이스홀더를 ? 로, IN (?, ?, ...) /
+  VALUES (...), (...) / UNION ALL 반복을 한 번으로 줄인 SQL. 같은 모양의 쿼리는 한 항목으로 모인다.
+- 느린 쿼리: DB_SLOW_QUERY_MS(기본 200) 이상이면 WARNING 로그.
+- 범위(scope): HTTP 요청(api.py 미들웨어)·워커 실행(query_scope) 단위로 쿼리 수를 세고,
+  같은 지문이 DB_NPLUS1_THRESHOLD(기본 10)회 이상 반복되면 N+1 의심으로 WARNING 로그.
+- get_query_stats(): 지문별·범위별 집계 스냅샷 (/metrics/db)
+"""
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger("QueryMetrics")
+
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+NPLUS1_THRESHOLD = int(os.getenv("DB_NPLUS1_THRESHOLD", "10"))
+_MAX_FINGERPRINTS = 500
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(\(\?(?:\s*,\s*\?)*\))(?:\s*,\s*\(\?(?:\s*,\s*\?)*\))+")
+_UNION_ALL = re.compile(r"(SELECT [^()]*?)(?: UNION ALL SELECT [^()]*?)+(?=\))", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+_lock = threading.Lock()
+_by_fingerprint: dict[str, dict] = {}
+_by_scope: dict[str, dict] = {}
+
+_current_scope: ContextVar["_Scope | None"] = ContextVar("query_scope", default=None)
+
+
+def fingerprint(sql: str) -> str:
+    """SQL 문 → 값·반복을 걷어낸 지문"""
+    fp = _SPACES.sub(" ", sql).strip()
+    fp = _STRING.sub("?", fp)
+    fp = _PLACEHOLDER.sub("?", fp)
+    fp = _NUMBER.sub("?", fp)
+    fp = _VALUES_LIST.sub(r"\1+", fp)
+    fp = _IN_LIST.sub("(?+)", fp)
+    fp = _UNION_ALL.sub(r"\1 UNION ALL ...", fp)
+    return fp
+
+
+class _Scope:
+    __slots__ = ("name", "queries", "total_ms", "counts")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queries = 0
+        self.total_ms = 0.0
+        self.counts: Counter = Counter()
+
+
+def record(sql: str, elapsed_ms: float, rows: int):
+    """문장 하나의 실행 결과 기록 (커서 래퍼가 호출)"""
+    fp = fingerprint(sql)
+    with _lock:
+        s = _by_fingerprint.get(fp)
+        if s is None:
+            if len(_by_fingerprint) >= _MAX_FINGERPRINTS:
+                fp = "(기타)"
+                s = _by_fingerprint.get(fp)
+            if s is None:
+                s = _by_fingerprint[fp] = {
+                    "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "slow": 0,
+                }
+        s["count"] += 1
+        s["total_ms"] += elapsed_ms
+        s["max_ms"] = max(s["max_ms"], elapsed_ms)
+        s["rows"] += rows
+        if elapsed_ms >= SLOW_QUERY_MS:
+            s["slow"] += 1
+
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.queries += 1
+        scope.total_ms += elapsed_ms
+        scope.counts[fp] += 1
+
+    if elapsed_ms >= SLOW_QUERY_MS:
+        where = f" [{scope.name}]" if scope is not None and scope.name else ""
+        logger.warning(f"느린 쿼리{where} {elapsed_ms:.1f}ms rows={rows}: {fp[:300]}")
+
+
+@contextmanager
+def query_scope(name: str | None = None):
+    """범위 안의 쿼리 수를 세고 끝날 때 집계·N+1 검사. yield 한 객체의 name 은 나중에 바꿔도 된다."""
+    scope = _Scope(name or "")
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        _finish_scope(scope)
+
+
+def _finish_scope(scope: _Scope):
+    name = scope.name or "(unnamed)"
+    repeated = [(fp, n) for fp, n in scope.counts.most_common(3) if n >= NPLUS1_THRESHOLD]
+    with _lock:
+        s = _by_scope.setdefault(name, {
+            "runs": 0, "queries": 0, "max_queries": 0, "total_ms": 0.0, "nplus1_runs": 0,
+        })
+        s["runs"] += 1
+        s["queries"] += scope.queries
+        s["max_queries"] = max(s["max_queries"], scope.queries)
+        s["total_ms"] += scope.total_ms
+        if repeated:
+            s["nplus1_runs"] += 1
+            s["nplus1_sample"] = repeated[0][0][:300]
+    for fp, n in repeated:
+        logger.warning(f"N+1 의심 [{name}] 같은 쿼리 {n}회 (총 {scope.queries}회): {fp[:300]}")
+
+
+def get_query_stats(top: int = 20) -> dict:
+    """지문별(총 소요 시간 상위 top)·범위별 집계 스냅샷"""
+    with _lock:
+        fps = [{"fingerprint": fp, **s} for fp, s in _by_fingerprint.items()]
+        scopes = {name: dict(s) for name, s in _by_scope.items()}
+    fps.sort(key=lambda s: s["total_ms"], reverse=True)
+    for s in fps:
+        s["avg_ms"] = round(s["total_ms"] / s["count"], 3) if s["count"] else 0.0
+        s["total_ms"] = round(s["total_ms"], 3)
+        s["max_ms"] = round(s["max_ms"], 3)
+    for s in scopes.values():
+        s["avg_queries"] = round(s["queries"] / s["runs"], 2) if s["runs"] else 0.0
+        s["total_ms"] = round(s["total_ms"], 3)
+    return {
+        "slow_query_ms": SLOW_QUERY_MS,
+        "nplus1_threshold": NPLUS1_THRESHOLD,
+        "statements": fps[:top],
+        "scopes": scopes,
+    }
+
+
+class InstrumentedCursor:
+    """mysql.connector 커서 래퍼 — execute~fetch 까지를 한 문장으로 재서 record()"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._sql: str | None = None
+        self._started = 0.0
+        self._rows = 0
+
+    def _flush(self):
+        if self._sql is not None:
+            record(self._sql, (time.perf_counter() - self._started) * 1000, self._rows)
+            self._sql = None
+
+    def _begin(self, sql: str):
+        self._flush()
+        self._sql = sql
+        self._started = time.perf_counter()
+        self._rows = 0
+
+    def _after_execute(self):
+        if self._cursor.rowcount and self._cursor.rowcount > 0:
+            self._rows = self._cursor.rowcount
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._begin(operation)
+        result = self._cursor.execute(operation, params, *args, **kwargs)
+        self._after_execute()
+        return result
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        self._begin(operation)
+        result = self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        self._after_execute()
+        return result
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None and self._rows == 0:
+            self._rows = 1
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._rows = max(self._rows, len(rows))
+        self._flush()
+        return rows
+
+    def fetchmany(self, size=None):
+        rows = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        self._rows += len(rows)
+        return rows
+
+    def close(self):
+        self._flush()
+        return self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class AsyncInstrumentedCursor(InstrumentedCursor):
+    """aiomysql 커서 래퍼 (InstrumentedCursor 의 async 버전)"""
+
+    async def execute(self, operation, params=None):
+        self._begin(operation)
+        result = await self._cursor.execute(operation, params)
+        self._after_execute()
+        return result
+
+    async def executemany(self, operation, seq_params):
+        self._begin(operation)
+        result = await self._cursor.executemany(operation, seq_params)
+        self._after_execute()
+        return result
+
+    async def fetchone(self):
+        row = await self._cursor.fetchone()
+        if row is not None and self._rows == 0:
+            self._rows = 1
+        return row
+
+    async def fetchall(self):
+        rows = await self._cursor.fetchall()
+        self._rows = max(self._rows, len(rows))
+        self._flush()
+        return rows
+
+    async def fetchmany(self, size=None):
+        rows = await self._cursor.fetchmany(size)
+        self._rows += len(rows)
+        return rows
+
+    async def close(self):
+        self._flush()
+        return await self._cursor.close()
@@ -14,6 +14,19 @@ from core.repository.content import (
     get_today_content_by_stock,
     get_content_by_stock_and_date,
     get_mention_stats,
+    get_contents_paginated_async,
+    get_contents_by_ticker_async,
+    get_content_by_stock_and_date_async,
+    get_mention_stats_async,
+    search_contents,
+    search_contents_async,
+)
+
+from core.repository.content_archive import (
+    ensure_archive_partitions,
+    archive_contents_before,
+    get_archived_content_texts,
+    get_archived_content_texts_async,
 )
 
 from core.repository.daily_summary import (
@@ -41,6 +54,21 @@ from core.repository.stock_report import (
     get_stock_report_dates,
     save_gap_check_results,
     get_gap_stats_by_dates,
+    get_stock_report_async,
+    get_stock_report_history_async,
+    get_stock_reports_by_date_async,
+    get_stock_reports_payload_async,
+    get_stock_report_dates_async,
+)
+
+from core.repository.gap_tick import (
+    save_gap_ticks,
+    get_gap_path_stats_by_dates,
+)
+
+from core.repository.candidate_feature import (
+    save_candidate_features,
+    get_candidate_features,
 )
 
 from core.repository.sector_report import (
@@ -48,6 +76,9 @@ from core.repository.sector_report import (
     get_sector_reports_by_date,
     get_sector_report_dates,
     get_top_themes_by_dates,
+    get_sector_reports_by_date_async,
+    get_sector_report_dates_async,
+    get_top_themes_by_dates_async,
 )
 
 from core.repository.strategy_config import (
@@ -55,6 +86,13 @@ from core.repository.strategy_config import (
     update_strategy_config,
 )
 
+from core.repository.strategy_variant import (
+    get_active_strategy_variants,
+    save_variant_reports,
+    get_variant_reports_by_date,
+    save_variant_gap_results,
+)
+
 from core.repository.telegram_user import (
     get_telegram_users,
     get_active_chat_ids,
@@ -68,11 +106,17 @@ from core.repository.telegram_user import (
 from core.repository.ticker import (
     lookup_ticker,
     lookup_name_by_ticker,
+    get_ticker_name_map,
     save_ticker,
     get_ticker_dictionary,
     update_ticker,
     delete_ticker,
 )
 
+from core.repository.ticker_index import (
+    normalize_company_name,
+    invalidate_ticker_index,
+)
+
 # 키움 토큰 저장은 별도 kiwoom 데이터 서버가 소유한다(kiwoom/core/repository/kiwoom_token.py).
 # jongalab 은 토큰을 직접 다루지 않으므로 여기서 re-export 하지 않는다.
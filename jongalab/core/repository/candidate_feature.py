@@ -0,0 +1,153 @@
+"""Phase 2 후보 피처 저장소 데이터 접근
+
+closing_bet Phase 2 에서 평가한 **모든** 후보(Top 10 밖 포함)의 원시 수급·차트 플래그·
+테마/대장주 여부·콘텐츠 건수·점수 구성요소를 일자별로 보관한다.
+재채점(what-if)·백테스트가 키움 재조회 없이 이 테이블만으로 동작하도록 하기 위함.
+
+저장 형식(compact):
+  - bool 피처는 flags 비트마스크 1바이트로 묶는다.
+  - supply_history 는 JSON 대신 고정폭 바이너리로 패킹한다 (_pack_supply_history).
+"""
+import struct
+from datetime import date, datetime
+
+from core.db import get_db
+
+# flags 비트마스크
+FLAG_MA_ALIGNED = 1 << 0
+FLAG_NEAR_HIGH = 1 << 1
+FLAG_LEADER = 1 << 2
+FLAG_THEME_STOCK = 1 << 3
+FLAG_SUPPLY_CHECKED = 1 << 4
+FLAG_FOREIGN_BROKERS = 1 << 5
+
+_FLAG_FIELDS = {
+    "ma_aligned": FLAG_MA_ALIGNED,
+    "near_high": FLAG_NEAR_HIGH,
+    "is_leader": FLAG_LEADER,
+    "is_theme_stock": FLAG_THEME_STOCK,
+    "supply_checked": FLAG_SUPPLY_CHECKED,
+    "foreign_brokers_buying": FLAG_FOREIGN_BROKERS,
+}
+
+# supply_history 패킹: 헤더(version, 일수) + 일별(YYYYMMDD, 기관, 외국인, 개인)
+# 순매수 금액은 키움 응답 단위(백만원)로 저장 — 원 단위 값은 항상 1,000,000 의 배수다.
+_SUPPLY_VERSION = 1
+_SUPPLY_HEADER = struct.Struct("<BB")
+_SUPPLY_DAY = struct.Struct("<Iiii")
+_SUPPLY_UNIT = 1_000_000
+
+_COLUMNS = (
+    "report_date", "stock_code", "stock_name", "sector",
+    "current_price", "change_pct", "trading_value", "market_cap", "flags",
+    "inst_net_buy", "frgn_net_buy", "indv_net_buy", "prog_net_buy",
+    "supply_days", "supply_history",
+    "content_count", "content_avg_score",
+    "supply_score", "content_score", "score", "rank_no",
+)
+
+
+def _pack_supply_history(history: list[dict]) -> bytes | None:
+    """[{date, inst_net_buy, frgn_net_buy, indv_net_buy}, ...] → 바이너리"""
+    if not history:
+        return None
+    out = [_SUPPLY_HEADER.pack(_SUPPLY_VERSION, len(history))]
+    for day in history:
+        ymd = int((day.get("date") or "0").replace("-", "") or 0)
+        out.append(_SUPPLY_DAY.pack(
+            ymd,
+            round(day.get("inst_net_buy", 0) / _SUPPLY_UNIT),
+            round(day.get("frgn_net_buy", 0) / _SUPPLY_UNIT),
+            round(day.get("indv_net_buy", 0) / _SUPPLY_UNIT),
+        ))
+    return b"".join(out)
+
+
+def _unpack_supply_history(blob: bytes | None) -> list[dict]:
+    """_pack_supply_history 의 역변환 (StockCandidate.supply_history 와 동일 shape)"""
+    if not blob:
+        return []
+    version, days = _SUPPLY_HEADER.unpack_from(blob, 0)
+    if version != _SUPPLY_VERSION:
+        raise ValueError(f"지원하지 않는 supply_history 버전: {version}")
+    history = []
+    for i in range(days):
+        ymd, inst, frgn, indv = _SUPPLY_DAY.unpack_from(
+            blob, _SUPPLY_HEADER.size + i * _SUPPLY_DAY.size
+        )
+        s = str(ymd)
+        history.append({
+            "date": f"{s[:4]}-{s[4:6]}-{s[6:]}" if len(s) == 8 else s,
+            "inst_net_buy": inst * _SUPPLY_UNIT,
+            "frgn_net_buy": frgn * _SUPPLY_UNIT,
+            "indv_net_buy": indv * _SUPPLY_UNIT,
+        })
+    return history
+
+
+def save_candidate_features(features: list[dict]):
+    """오늘 Phase 2 후보 피처 일괄 UPSERT (단일 트랜잭션, 이번 후보에서 빠진 종목은 삭제).
+
+    features 각 항목: StockCandidate 필드명과 동일한 키 + content_score, rank_no(Top N 밖은 None)
+    """
+    if not features:
+        return
+
+    rows = []
+    for f in features:
+        flags = 0
+        for key, bit in _FLAG_FIELDS.items():
+            if f.get(key):
+                flags |= bit
+        rows.append((
+            f["stock_code"], f["stock_name"], f.get("sector"),
+            f.get("current_price", 0), f.get("change_pct", 0.0),
+            f.get("trading_value", 0), f.get("market_cap", 0), flags,
+            f.get("inst_net_buy", 0), f.get("frgn_net_buy", 0),
+            f.get("indv_net_buy", 0), f.get("prog_net_buy", 0),
+            f.get("supply_days", 0), _pack_supply_history(f.get("supply_history")),
+            f.get("content_count", 0), f.get("content_avg_score", 0.0),
+            f.get("supply_score", 0.0), f.get("content_score", 0.0),
+            f.get("score", 0.0), f.get("rank_no"),
+        ))
+
+    placeholders = ", ".join(["%s"] * (len(_COLUMNS) - 1))
+    updates = ", ".join(f"{col} = VALUES({col})" for col in _COLUMNS[2:])
+    codes = [f["stock_code"] for f in features]
+    with get_db() as (conn, cursor):
+        # executemany 는 단일 multi-row INSERT 로 재작성되어 한 번의 왕복으로 저장된다.
+        cursor.executemany(
+            f"""INSERT INTO daily_candidate_feature ({', '.join(_COLUMNS)})
+                VALUES (CURDATE(), {placeholders})
+                ON DUPLICATE KEY UPDATE {updates}""",
+            rows,
+        )
+        cursor.execute(
+            f"""DELETE FROM daily_candidate_feature
+                 WHERE report_date = CURDATE()
+                   AND stock_code NOT IN ({', '.join(['%s'] * len(codes))})""",
+            tuple(codes),
+        )
+        conn.commit()
+
+
+def get_candidate_features(start_date: str, end_date: str | None = None) -> list[dict]:
+    """기간 내 후보 피처 일괄 조회 (날짜순 → 점수순). end_date 미지정 시 start_date 하루."""
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            f"""SELECT {', '.join(_COLUMNS)}
+                  FROM daily_candidate_feature
+                 WHERE report_date BETWEEN %s AND %s
+                 ORDER BY report_date ASC, score DESC""",
+            (start_date, end_date or start_date),
+        )
+        rows = cursor.fetchall()
+
+    for row in rows:
+        if isinstance(row.get("report_date"), (date, datetime)):
+            row["report_date"] = row["report_date"].isoformat().split("T")[0]
+        flags = row.pop("flags") or 0
+        for key, bit in _FLAG_FIELDS.items():
+            row[key] = bool(flags & bit)
+        row["supply_history"] = _unpack_supply_history(row["supply_history"])
+    return rows
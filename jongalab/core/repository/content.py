@@ -1,83 +1,338 @@
 """콘텐츠 분석 데이터 접근"""
+import base64
 import json
 import math
 import logging
+import re
+import time
 from datetime import datetime
 
+from core.adb import get_adb
 from core.db import get_db
+from core.repository.content_archive import (
+    get_archived_content_texts,
+    get_archived_content_texts_async,
+)
 from core.ai_utils import remove_markdown_code_blocks
 
 
-def get_contents_paginated(page: int = 1, limit: int = 12) -> dict:
-    """페이지네이션된 콘텐츠 목록 조회"""
-    with get_db() as (conn, cursor):
-        offset = (page - 1) * limit
+# 피드 총 개수는 페이지마다 COUNT(*) 하지 않고 짧게 캐시한다 (근사치).
+_TOTAL_COUNT_TTL_SEC = 60
+_total_count_cache: dict = {"value": None, "at": 0.0}
 
-        where_clause = "WHERE created_at >= NOW() - INTERVAL 7 DAY"
 
-        cursor.execute(
-            f"SELECT COUNT(*) as total_count FROM content_analysis {where_clause}",
-        )
-        total_count = cursor.fetchone()["total_count"]
+def _encode_cursor(created_at, content_id: int) -> str:
+    """(created_at, id) → 불투명 커서 문자열"""
+    raw = f"{created_at.isoformat() if isinstance(created_at, datetime) else created_at}|{content_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
 
-        cursor.execute(
-            f"""
-            SELECT id, external_id, source_name, title,
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, content_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(content_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+_TOTAL_COUNT_SQL = (
+    "SELECT COUNT(*) as total_count FROM content_analysis WHERE created_at >= NOW() - INTERVAL 7 DAY"
+)
+
+
+def _cached_total_count() -> int | None:
+    """TTL 안의 캐시된 피드 총 개수 (없으면 None)"""
+    cached = _total_count_cache["value"]
+    if cached is not None and time.monotonic() - _total_count_cache["at"] < _TOTAL_COUNT_TTL_SEC:
+        return cached
+    return None
+
+
+def _feed_total_count(cursor) -> int:
+    """최근 7일 콘텐츠 수 (TTL 캐시)"""
+    total = _cached_total_count()
+    if total is None:
+        cursor.execute(_TOTAL_COUNT_SQL)
+        total = cursor.fetchone()["total_count"]
+        _total_count_cache.update(value=total, at=time.monotonic())
+    return total
+
+
+async def _feed_total_count_async(cursor) -> int:
+    total = _cached_total_count()
+    if total is None:
+        await cursor.execute(_TOTAL_COUNT_SQL)
+        total = (await cursor.fetchone())["total_count"]
+        _total_count_cache.update(value=total, at=time.monotonic())
+    return total
+
+
+def get_contents_paginated(page: int = 1, limit: int = 12, cursor: str | None = None) -> dict:
+    """페이지네이션된 콘텐츠 목록 조회.
+
+    cursor 를 주면 (created_at, id) 키셋 방식으로 그 다음 항목부터 조회하고(page 무시),
+    없으면 기존처럼 page/limit OFFSET 방식. 두 방식 모두 next_cursor 를 돌려준다.
+    total_items 는 최대 _TOTAL_COUNT_TTL_SEC 초 지난 캐시 값일 수 있다.
+    """
+    query, params = _feed_page_query(page, limit, cursor)
+    with get_db() as (conn, cur):
+        total_count = _feed_total_count(cur)
+        cur.execute(query, params)
+        result = cur.fetchall()
+    return _feed_page_result(result, total_count, page, limit, cursor)
+
+
+async def get_contents_paginated_async(
+    page: int = 1, limit: int = 12, cursor: str | None = None
+) -> dict:
+    """get_contents_paginated 의 async 버전"""
+    query, params = _feed_page_query(page, limit, cursor)
+    async with get_adb() as (conn, cur):
+        total_count = await _feed_total_count_async(cur)
+        await cur.execute(query, params)
+        result = list(await cur.fetchall())
+    return _feed_page_result(result, total_count, page, limit, cursor)
+
+
+def _feed_page_query(page: int, limit: int, cursor: str | None) -> tuple[str, tuple]:
+    columns = """id, external_id, source_name, title,
                    analysis_content, sentiment_score,
-                   platform, source_url, created_at, related_tickers
-            FROM content_analysis {where_clause}
-            ORDER BY created_at DESC
-            LIMIT %s OFFSET %s
+                   platform, source_url, created_at, related_tickers"""
+    if cursor:
+        after_created, after_id = _decode_cursor(cursor)
+        return (
+            f"""
+            SELECT {columns}
+            FROM content_analysis
+            WHERE created_at >= NOW() - INTERVAL 7 DAY
+              AND (created_at < %s OR (created_at = %s AND id < %s))
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
             """,
-            (limit, offset),
+            (after_created, after_created, after_id, limit + 1),
         )
-        result = cursor.fetchall()
-
-        for row in result:
-            if row["created_at"]:
-                row["created_at"] = str(row["created_at"])
-            if row["sentiment_score"] is None:
-                row["sentiment_score"] = 50
-            if row.get("related_tickers"):
-                try:
-                    row["related_tickers"] = json.loads(row["related_tickers"])
-                except Exception:
-                    row["related_tickers"] = []
-            else:
+    return (
+        f"""
+        SELECT {columns}
+        FROM content_analysis
+        WHERE created_at >= NOW() - INTERVAL 7 DAY
+        ORDER BY created_at DESC, id DESC
+        LIMIT %s OFFSET %s
+        """,
+        (limit + 1, (page - 1) * limit),
+    )
+
+
+def _feed_page_result(
+    result: list[dict], total_count: int, page: int, limit: int, cursor: str | None
+) -> dict:
+    has_next_page = len(result) > limit
+    result = result[:limit]
+    next_cursor = (
+        _encode_cursor(result[-1]["created_at"], result[-1]["id"])
+        if has_next_page and result else None
+    )
+
+    for row in result:
+        if row["created_at"]:
+            row["created_at"] = str(row["created_at"])
+        if row["sentiment_score"] is None:
+            row["sentiment_score"] = 50
+        if row.get("related_tickers"):
+            try:
+                row["related_tickers"] = json.loads(row["related_tickers"])
+            except Exception:
                 row["related_tickers"] = []
+        else:
+            row["related_tickers"] = []
 
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 1
+    total_pages = math.ceil(total_count / limit) if total_count > 0 else 1
 
-        return {
-            "data": result,
-            "pagination": {
-                "current_page": page,
-                "limit": limit,
-                "total_items": total_count,
-                "total_pages": total_pages,
-                "has_next_page": page < total_pages,
-                "has_prev_page": page > 1,
-            },
-        }
+    return {
+        "data": result,
+        "pagination": {
+            "current_page": None if cursor else page,
+            "limit": limit,
+            "total_items": total_count,
+            "total_pages": total_pages,
+            "has_next_page": has_next_page,
+            "has_prev_page": False if cursor else page > 1,
+            "next_cursor": next_cursor,
+        },
+    }
+
+
+def _ticker_code(ticker: str) -> str:
+    """'005930.KS', '005930_NX' 등 접미사를 떼어 content_ticker.ticker 와 같은 형태로"""
+    return (ticker or "").strip().upper().split(".")[0].split("_")[0]
+
+
+_BY_TICKER_SQL = """
+    SELECT ca.* FROM content_ticker ct
+    JOIN content_analysis ca ON ca.id = ct.content_id
+    WHERE ct.ticker = %s
+      AND ct.created_at >= NOW() - INTERVAL 7 DAY
+    ORDER BY ct.created_at DESC
+"""
 
 
 def get_contents_by_ticker(ticker: str) -> list[dict]:
-    """특정 티커 관련 콘텐츠 조회"""
+    """특정 티커 관련 콘텐츠 조회 (content_ticker 인덱스 조인)"""
     with get_db() as (conn, cursor):
-        cursor.execute(
-            """
-            SELECT * FROM content_analysis
-            WHERE created_at >= NOW() - INTERVAL 7 DAY
-              AND related_tickers LIKE %s
-            ORDER BY created_at DESC
-            """,
-            (f"%{ticker}%",),
-        )
+        cursor.execute(_BY_TICKER_SQL, (_ticker_code(ticker),))
         results = cursor.fetchall()
-        for row in results:
-            if isinstance(row["created_at"], datetime):
-                row["created_at"] = row["created_at"].isoformat()
-        return results
+    for row in results:
+        if isinstance(row["created_at"], datetime):
+            row["created_at"] = row["created_at"].isoformat()
+    return results
+
+
+async def get_contents_by_ticker_async(ticker: str) -> list[dict]:
+    """get_contents_by_ticker 의 async 버전"""
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_BY_TICKER_SQL, (_ticker_code(ticker),))
+        results = list(await cursor.fetchall())
+    for row in results:
+        if isinstance(row["created_at"], datetime):
+            row["created_at"] = row["created_at"].isoformat()
+    return results
+
+
+# InnoDB FULLTEXT BOOLEAN MODE 연산자 — 검색어에서는 제거하고 단어 단위로 다시 조립한다.
+_FT_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+_SEARCH_COLUMNS = """ca.id, ca.external_id, ca.source_name, ca.title,
+                   ca.analysis_content, ca.sentiment_score,
+                   ca.platform, ca.source_url, ca.created_at, ca.related_tickers"""
+
+
+def _fulltext_query(query: str) -> str:
+    """사용자 검색어 → BOOLEAN MODE 식. 모든 단어 필수(+), 접두 일치(*).
+
+    한국어 조사가 붙은 어절('삼성전자가')도 '삼성전자*' 로 찾히도록 접두 일치를 쓴다.
+    """
+    terms = _FT_OPERATORS.sub(" ", query).split()
+    return " ".join(f"+{t}*" for t in terms)
+
+
+def _search_query(
+    query: str,
+    start_date: str | None,
+    end_date: str | None,
+    platform: str | None,
+    ticker: str | None,
+    page: int,
+    limit: int,
+) -> tuple[str, tuple] | None:
+    expr = _fulltext_query(query)
+    if not expr:
+        return None
+    where = ["MATCH(ca.title, ca.analysis_content) AGAINST (%s IN BOOLEAN MODE)"]
+    params: list = [expr, expr]
+    if start_date:
+        where.append("ca.created_at >= %s")
+        params.append(start_date)
+    if end_date:
+        where.append("ca.created_at < %s + INTERVAL 1 DAY")
+        params.append(end_date)
+    if platform:
+        where.append("ca.platform = %s")
+        params.append(platform)
+    if ticker:
+        where.append(
+            "EXISTS (SELECT 1 FROM content_ticker ct WHERE ct.content_id = ca.id AND ct.ticker = %s)"
+        )
+        params.append(_ticker_code(ticker))
+    params += [limit + 1, (page - 1) * limit]
+    return (
+        f"""
+        SELECT {_SEARCH_COLUMNS},
+               MATCH(ca.title, ca.analysis_content) AGAINST (%s IN BOOLEAN MODE) AS score
+        FROM content_analysis ca
+        WHERE {' AND '.join(where)}
+        ORDER BY score DESC, ca.created_at DESC, ca.id DESC
+        LIMIT %s OFFSET %s
+        """,
+        tuple(params),
+    )
+
+
+def search_contents(
+    query: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    platform: str | None = None,
+    ticker: str | None = None,
+    page: int = 1,
+    limit: int = 20,
+) -> dict:
+    """콘텐츠 전문 검색 (제목 + 분석 본문 FULLTEXT, 관련도순).
+
+    start_date/end_date(YYYY-MM-DD, 양끝 포함), platform, ticker 로 좁힐 수 있다.
+    콜드 보관된 콘텐츠는 본문이 FULLTEXT 에 없어 제목으로만 찾히고, 찾힌 행의 본문은
+    페이지에 실린 것만 content_archive 에서 풀어 채운다.
+    """
+    built = _search_query(query, start_date, end_date, platform, ticker, page, limit)
+    if built is None:
+        return _search_result([], page, limit)
+    with get_db() as (conn, cursor):
+        cursor.execute(*built)
+        rows = cursor.fetchall()
+    archived = get_archived_content_texts(_archived_ids(rows[:limit]))
+    return _search_result(rows, page, limit, archived)
+
+
+async def search_contents_async(
+    query: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    platform: str | None = None,
+    ticker: str | None = None,
+    page: int = 1,
+    limit: int = 20,
+) -> dict:
+    """search_contents 의 async 버전"""
+    built = _search_query(query, start_date, end_date, platform, ticker, page, limit)
+    if built is None:
+        return _search_result([], page, limit)
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(*built)
+        rows = list(await cursor.fetchall())
+    archived = await get_archived_content_texts_async(_archived_ids(rows[:limit]))
+    return _search_result(rows, page, limit, archived)
+
+
+def _archived_ids(rows: list[dict]) -> list[int]:
+    """본문이 콜드 보관돼 NULL 인 행의 id"""
+    return [row["id"] for row in rows if row["analysis_content"] is None]
+
+
+def _search_result(
+    rows: list[dict], page: int, limit: int, archived: dict[int, str] | None = None
+) -> dict:
+    has_next_page = len(rows) > limit
+    rows = rows[:limit]
+    for row in rows:
+        if row["created_at"]:
+            row["created_at"] = str(row["created_at"])
+        if row["sentiment_score"] is None:
+            row["sentiment_score"] = 50
+        if row["analysis_content"] is None:
+            row["analysis_content"] = (archived or {}).get(row["id"]) or ""
+        row["score"] = round(float(row["score"] or 0), 4)
+        try:
+            row["related_tickers"] = json.loads(row["related_tickers"]) if row.get("related_tickers") else []
+        except Exception:
+            row["related_tickers"] = []
+    return {
+        "data": rows,
+        "pagination": {
+            "current_page": page,
+            "limit": limit,
+            "has_next_page": has_next_page,
+            "has_prev_page": page > 1,
+        },
+    }
 
 
 def is_content_processed(external_id: str) -> bool:
@@ -103,10 +358,12 @@ def save_content_analysis(
     """콘텐츠 분석 결과 저장 (telegram / youtube 공통).
     related_tickers의 종목별 섹터를 동기 조회해 ticker_sectors에 함께 저장.
     조회 실패는 sector=None으로 채워 콘텐츠 저장 자체는 막지 않음.
+    종목별 매핑은 content_ticker 에도 정규화해 남긴다 (종목 필터 조회용).
     """
     content = remove_markdown_code_blocks(content)
 
     ticker_sectors_json: str | None = None
+    sectors: list[dict] = []
     try:
         from core.sector_resolver import resolve_sectors  # 지연 import: 순환참조 방지
         sectors = resolve_sectors(related_tickers or [])
@@ -115,6 +372,14 @@ def save_content_analysis(
     except Exception as e:
         logging.warning(f"섹터 enrich 실패 (계속 진행): {e}")
 
+    # resolve_sectors 는 티커를 strip 만 하므로 content_ticker 와 같은 형태로 맞춰 키를 잡는다
+    sector_by_ticker = {_ticker_code(s["ticker"]): s["sector"] for s in sectors}
+    mapped: dict[str, tuple[str | None, str]] = {}  # ticker -> (sector, name)
+    for t in related_tickers or []:
+        tk = _ticker_code(t.get("ticker") if isinstance(t, dict) else "")
+        if tk and tk not in mapped:
+            mapped[tk] = (sector_by_ticker.get(tk), (t.get("name") or "").strip())
+
     with get_db() as (conn, cursor):
         query = """
             INSERT INTO content_analysis
@@ -127,24 +392,56 @@ def save_content_analysis(
             source_url, json.dumps(related_tickers), platform,
             ticker_sectors_json,
         ))
+        content_id = cursor.lastrowid
+        # 종목 매핑은 콘텐츠와 같은 트랜잭션·같은 created_at 으로 저장
+        for tk, (sector, _) in mapped.items():
+            cursor.execute(
+                """
+                INSERT IGNORE INTO content_ticker (content_id, ticker, sector, created_at)
+                SELECT id, %s, %s, created_at FROM content_analysis WHERE id = %s
+                """,
+                (tk, sector, content_id),
+            )
+        # 언급 통계 롤업 증분 (섹터 매핑 자체가 없는 콘텐츠는 집계 제외 — get_mention_stats 규칙)
+        if ticker_sectors_json:
+            for tk, (sector, name) in mapped.items():
+                cursor.execute(
+                    """
+                    INSERT INTO mention_hourly
+                        (bucket, sector, ticker, name, mention_count, sentiment_sum, sentiment_n)
+                    SELECT DATE_FORMAT(created_at, '%%Y-%%m-%%d %%H:00:00'), %s, %s, %s, 1, %s, %s
+                    FROM content_analysis WHERE id = %s
+                    ON DUPLICATE KEY UPDATE
+                        mention_count = mention_count + 1,
+                        sentiment_sum = sentiment_sum + VALUES(sentiment_sum),
+                        sentiment_n   = sentiment_n + VALUES(sentiment_n)
+                    """,
+                    (
+                        sector or "", tk, name,
+                        int(score) if score is not None else 0,
+                        1 if score is not None else 0,
+                        content_id,
+                    ),
+                )
         conn.commit()
     logging.info(f"DB 저장 완료: {title} (점수: {score}, 티커: {related_tickers})")
 
 
 def get_today_content_by_stock(stock_code: str) -> list[dict]:
-    """오늘 날짜의 특정 종목 관련 콘텐츠 분석 조회 (ticker로 매칭)"""
-    code_part = stock_code.split(".")[0]
+    """오늘 날짜의 특정 종목 관련 콘텐츠 분석 조회 (content_ticker 인덱스 조인)"""
     with get_db() as (conn, cursor):
         cursor.execute(
             """
-            SELECT id, title, analysis_content, sentiment_score,
-                   source_name, platform, source_url, created_at
-            FROM content_analysis
-            WHERE DATE(created_at) = CURDATE()
-              AND related_tickers LIKE %s
-            ORDER BY created_at DESC
+            SELECT ca.id, ca.title, ca.analysis_content, ca.sentiment_score,
+                   ca.source_name, ca.platform, ca.source_url, ca.created_at
+            FROM content_ticker ct
+            JOIN content_analysis ca ON ca.id = ct.content_id
+            WHERE ct.ticker = %s
+              AND ct.created_at >= CURDATE()
+              AND ct.created_at < CURDATE() + INTERVAL 1 DAY
+            ORDER BY ct.created_at DESC
             """,
-            (f"%{code_part}%",),
+            (_ticker_code(stock_code),),
         )
         results = cursor.fetchall()
         for row in results:
@@ -155,30 +452,56 @@ def get_today_content_by_stock(stock_code: str) -> list[dict]:
         return results
 
 
+# 리포트 상세는 지난 날짜도 보므로 콜드 보관된 본문(content_archive)을 함께 읽는다.
+_BY_STOCK_AND_DATE_SQL = """
+    SELECT ca.id, ca.title,
+           COALESCE(ca.analysis_content,
+                    CONVERT(UNCOMPRESS(arc.body) USING utf8mb4)) AS analysis_content,
+           ca.sentiment_score, ca.source_name, ca.platform, ca.source_url, ca.created_at
+    FROM content_ticker ct
+    JOIN content_analysis ca ON ca.id = ct.content_id
+    LEFT JOIN content_archive arc
+           ON ca.archived_at IS NOT NULL
+          AND arc.content_id = ca.id
+          AND arc.month_key = EXTRACT(YEAR_MONTH FROM ca.created_at)
+    WHERE ct.ticker = %s
+      AND ct.created_at >= %s
+      AND ct.created_at < %s + INTERVAL 1 DAY
+    ORDER BY ct.created_at DESC
+"""
+
+
 def get_content_by_stock_and_date(
     stock_code: str, report_date: str
 ) -> list[dict]:
-    """특정 날짜의 특정 종목 관련 콘텐츠 분석 조회 (ticker로 매칭)"""
-    code_part = stock_code.split(".")[0]
+    """특정 날짜의 특정 종목 관련 콘텐츠 분석 조회 (content_ticker 인덱스 조인)"""
     with get_db() as (conn, cursor):
         cursor.execute(
-            """
-            SELECT id, title, analysis_content, sentiment_score,
-                   source_name, platform, source_url, created_at
-            FROM content_analysis
-            WHERE DATE(created_at) = %s
-              AND related_tickers LIKE %s
-            ORDER BY created_at DESC
-            """,
-            (report_date, f"%{code_part}%"),
+            _BY_STOCK_AND_DATE_SQL, (_ticker_code(stock_code), report_date, report_date)
         )
         results = cursor.fetchall()
-        for row in results:
-            if isinstance(row["created_at"], datetime):
-                row["created_at"] = row["created_at"].isoformat()
-            if row["sentiment_score"] is None:
-                row["sentiment_score"] = 50
-        return results
+    return _content_rows(results)
+
+
+async def get_content_by_stock_and_date_async(
+    stock_code: str, report_date: str
+) -> list[dict]:
+    """get_content_by_stock_and_date 의 async 버전"""
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(
+            _BY_STOCK_AND_DATE_SQL, (_ticker_code(stock_code), report_date, report_date)
+        )
+        results = list(await cursor.fetchall())
+    return _content_rows(results)
+
+
+def _content_rows(results: list[dict]) -> list[dict]:
+    for row in results:
+        if isinstance(row["created_at"], datetime):
+            row["created_at"] = row["created_at"].isoformat()
+        if row["sentiment_score"] is None:
+            row["sentiment_score"] = 50
+    return results
 
 
 def get_recent_analyses(hours: int = 24) -> list[dict]:
@@ -193,85 +516,72 @@ def get_recent_analyses(hours: int = 24) -> list[dict]:
         return cursor.fetchall()
 
 
+_MENTION_SINCE_SQL = (
+    "SELECT CAST(DATE_FORMAT(NOW(), '%%Y-%%m-%%d %%H:00:00') AS DATETIME)"
+    " - INTERVAL %s HOUR AS since"
+)
+_MENTION_TOTAL_SQL = "SELECT COUNT(*) AS cnt FROM content_analysis WHERE created_at >= %s"
+_MENTION_ROLLUP_SQL = """
+    SELECT sector, ticker, MAX(name) AS name,
+           SUM(mention_count) AS cnt,
+           SUM(sentiment_sum) AS sent_sum,
+           SUM(sentiment_n) AS sent_n
+    FROM mention_hourly
+    WHERE bucket >= %s
+    GROUP BY sector, ticker
+"""
+
+
 def get_mention_stats(hours: int = 12) -> dict:
     """최근 N시간 콘텐츠의 섹터/티커 언급 통계 (트리맵용).
     sector=None인 ticker는 통계에서 제외 (이전 합의).
     한 콘텐츠 내 동일 ticker는 1회만 카운트.
-    """
-    where = "WHERE created_at >= NOW() - INTERVAL %s HOUR"
-    params: list = [hours]
 
+    mention_hourly 롤업(정시 버킷)을 읽으므로 창은 현재 시각이 속한 버킷을 포함한
+    최근 N개 버킷이다.
+    """
     with get_db() as (conn, cursor):
-        cursor.execute(
-            f"SELECT COUNT(*) AS cnt FROM content_analysis {where}",
-            tuple(params),
-        )
+        cursor.execute(_MENTION_SINCE_SQL, (max(hours - 1, 0),))
+        since = cursor.fetchone()["since"]
+        cursor.execute(_MENTION_TOTAL_SQL, (since,))
         total_contents = cursor.fetchone()["cnt"]
-
-        cursor.execute(
-            f"""
-            SELECT id, related_tickers, ticker_sectors, sentiment_score
-            FROM content_analysis
-            {where}
-              AND related_tickers IS NOT NULL
-              AND ticker_sectors IS NOT NULL
-            """,
-            tuple(params),
-        )
+        cursor.execute(_MENTION_ROLLUP_SQL, (since,))
         rows = cursor.fetchall()
+    return _mention_stats_result(rows, total_contents, hours)
 
-    # 집계: (sector, ticker) -> {mention_count, sentiments[], name}
-    sector_ticker: dict[tuple[str, str], dict] = {}
-    name_lookup: dict[str, str] = {}
-    total_mentions = 0
-    dropped = 0
 
-    for row in rows:
-        try:
-            tickers = json.loads(row["related_tickers"]) if isinstance(row["related_tickers"], str) else (row["related_tickers"] or [])
-            sector_map_list = json.loads(row["ticker_sectors"]) if isinstance(row["ticker_sectors"], str) else (row["ticker_sectors"] or [])
-        except Exception:
-            continue
+async def get_mention_stats_async(hours: int = 12) -> dict:
+    """get_mention_stats 의 async 버전"""
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_MENTION_SINCE_SQL, (max(hours - 1, 0),))
+        since = (await cursor.fetchone())["since"]
+        await cursor.execute(_MENTION_TOTAL_SQL, (since,))
+        total_contents = (await cursor.fetchone())["cnt"]
+        await cursor.execute(_MENTION_ROLLUP_SQL, (since,))
+        rows = await cursor.fetchall()
+    return _mention_stats_result(rows, total_contents, hours)
+
 
-        # ticker -> name 룩업
-        for t in tickers:
-            tk = (t.get("ticker") or "").strip()
-            if tk and tk not in name_lookup:
-                name_lookup[tk] = (t.get("name") or "").strip()
-
-        # ticker -> sector 매핑
-        sector_by_ticker = {
-            (s.get("ticker") or "").strip(): (s.get("sector") or None)
-            for s in sector_map_list
-        }
-
-        seen_in_content: set[str] = set()
-        for tk, sector in sector_by_ticker.items():
-            if not tk or tk in seen_in_content:
-                continue
-            seen_in_content.add(tk)
-            if not sector:
-                dropped += 1
-                continue
-            key = (sector, tk)
-            entry = sector_ticker.setdefault(key, {"count": 0, "sent_sum": 0, "sent_n": 0})
-            entry["count"] += 1
-            score = row.get("sentiment_score")
-            if score is not None:
-                entry["sent_sum"] += int(score)
-                entry["sent_n"] += 1
-            total_mentions += 1
+def _mention_stats_result(rows, total_contents: int, hours: int) -> dict:
+    total_mentions = 0
+    dropped = 0
 
     # 섹터 단위로 묶기
     sectors_agg: dict[str, dict] = {}
-    for (sector, ticker), e in sector_ticker.items():
-        sec = sectors_agg.setdefault(sector, {"sector": sector, "mention_count": 0, "tickers": []})
-        sec["mention_count"] += e["count"]
-        avg_sent = round(e["sent_sum"] / e["sent_n"]) if e["sent_n"] > 0 else None
+    for row in rows:
+        count = int(row["cnt"] or 0)
+        if not row["sector"]:
+            dropped += count
+            continue
+        total_mentions += count
+        sent_n = int(row["sent_n"] or 0)
+        sec = sectors_agg.setdefault(row["sector"], {"sector": row["sector"], "mention_count": 0, "tickers": []})
+        sec["mention_count"] += count
+        avg_sent = round(int(row["sent_sum"] or 0) / sent_n) if sent_n > 0 else None
         sec["tickers"].append({
-            "ticker": ticker,
-            "name": name_lookup.get(ticker, ""),
-            "mention_count": e["count"],
+            "ticker": row["ticker"],
+            "name": row["name"] or "",
+            "mention_count": count,
             "avg_sentiment": avg_sent,
         })
 
@@ -0,0 +1,122 @@
+"""콘텐츠 본문 콜드 보관(content_archive) 데이터 접근
+
+오래된 content_analysis.analysis_content 를 COMPRESS() 해 월 파티션 테이블로 옮기고,
+필요할 때 UNCOMPRESS 로 되읽는다. 메타데이터 행은 content_analysis 에 남는다.
+"""
+from datetime import date, datetime
+
+from core.adb import get_adb
+from core.db import get_db
+
+
+def month_key(d: date | datetime) -> int:
+    """날짜 → YYYYMM 정수 (content_archive.month_key)"""
+    return d.year * 100 + d.month
+
+
+def _next_month_key(key: int) -> int:
+    year, month = divmod(key, 100)
+    return (year + 1) * 100 + 1 if month == 12 else key + 1
+
+
+def ensure_archive_partitions(until_key: int) -> list[str]:
+    """content_archive 월 파티션을 until_key(YYYYMM) 월까지 앞으로 늘린다.
+
+    p_future(MAXVALUE)를 쪼개는 방식이라 가장 최근 월 파티션 다음 달부터 순서대로만
+    추가된다. 파티션이 하나도 없으면 아카이브 대상 중 가장 오래된 달부터 만든다.
+    반환: 새로 만든 파티션 이름 목록
+    """
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            """SELECT PARTITION_NAME AS name
+                 FROM information_schema.PARTITIONS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'content_archive'"""
+        )
+        existing = sorted(
+            int(row["name"][1:]) for row in cursor.fetchall()
+            if row["name"] and row["name"][1:].isdigit()
+        )
+        if existing:
+            key = _next_month_key(existing[-1])
+        else:
+            cursor.execute(
+                """SELECT MIN(created_at) AS oldest FROM content_analysis
+                    WHERE archived_at IS NULL AND analysis_content IS NOT NULL"""
+            )
+            oldest = cursor.fetchone()["oldest"]
+            key = month_key(oldest) if oldest else until_key
+
+        added = []
+        while key <= until_key:
+            cursor.execute(
+                f"""ALTER TABLE content_archive REORGANIZE PARTITION p_future INTO (
+                        PARTITION p{key} VALUES LESS THAN ({_next_month_key(key)}),
+                        PARTITION p_future VALUES LESS THAN MAXVALUE
+                    )"""
+            )
+            added.append(f"p{key}")
+            key = _next_month_key(key)
+        return added
+
+
+def archive_contents_before(cutoff: datetime, batch_size: int = 500) -> int:
+    """cutoff 이전 콘텐츠 본문을 batch_size 건 압축 보관. 반환: 처리 건수 (0 이면 끝).
+
+    본문 복사와 원본 NULL 처리를 한 트랜잭션에서 한다. 이미 보관된 행은 건너뛴다.
+    """
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            """SELECT id FROM content_analysis
+                WHERE archived_at IS NULL AND created_at < %s
+                ORDER BY created_at, id
+                LIMIT %s""",
+            (cutoff, batch_size),
+        )
+        ids = [row["id"] for row in cursor.fetchall()]
+        if not ids:
+            return 0
+
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(
+            f"""INSERT IGNORE INTO content_archive (content_id, month_key, body)
+                SELECT id, EXTRACT(YEAR_MONTH FROM created_at), COMPRESS(analysis_content)
+                  FROM content_analysis
+                 WHERE id IN ({placeholders}) AND analysis_content IS NOT NULL""",
+            tuple(ids),
+        )
+        cursor.execute(
+            f"""UPDATE content_analysis
+                   SET analysis_content = NULL, archived_at = CURRENT_TIMESTAMP
+                 WHERE id IN ({placeholders})""",
+            tuple(ids),
+        )
+        conn.commit()
+    return len(ids)
+
+
+def _archived_texts_query(content_ids: list[int]) -> tuple[str, tuple]:
+    return (
+        f"""SELECT content_id,
+                   CONVERT(UNCOMPRESS(body) USING utf8mb4) AS analysis_content
+              FROM content_archive
+             WHERE content_id IN ({', '.join(['%s'] * len(content_ids))})""",
+        tuple(content_ids),
+    )
+
+
+def get_archived_content_texts(content_ids: list[int]) -> dict[int, str]:
+    """보관된 본문 on-demand 조회. 반환: {content_id: analysis_content}"""
+    if not content_ids:
+        return {}
+    with get_db() as (conn, cursor):
+        cursor.execute(*_archived_texts_query(content_ids))
+        return {row["content_id"]: row["analysis_content"] for row in cursor.fetchall()}
+
+
+async def get_archived_content_texts_async(content_ids: list[int]) -> dict[int, str]:
+    """get_archived_content_texts 의 async 버전"""
+    if not content_ids:
+        return {}
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(*_archived_texts_query(content_ids))
+        return {row["content_id"]: row["analysis_content"] for row in await cursor.fetchall()}
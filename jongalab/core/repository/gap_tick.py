@@ -0,0 +1,109 @@
+"""갭 추적 시계열(gap_tick) 데이터 접근
+
+gap_check --track 이 장전·개장 구간에 폴링한 시세 틱을 저장하고,
+날짜별로 리포트 가격 대비 경로 지표(최대 상승폭·최대 낙폭·고점 도달 시간)를 계산한다.
+"""
+from datetime import date, datetime
+
+from core.db import get_db
+
+
+def save_gap_ticks(report_date: str, ticks: list[dict]):
+    """틱 일괄 저장 (단일 multi-row INSERT). 같은 (종목, ts) 는 덮어쓴다.
+
+    ticks 항목 형태: {stock_code, ts, nxt_price?, krx_price?}
+    """
+    if not ticks:
+        return
+
+    with get_db() as (conn, cursor):
+        cursor.executemany(
+            """INSERT INTO gap_tick (report_date, stock_code, ts, nxt_price, krx_price)
+               VALUES (%s, %s, %s, %s, %s)
+               ON DUPLICATE KEY UPDATE
+                   nxt_price = VALUES(nxt_price),
+                   krx_price = VALUES(krx_price)""",
+            [
+                (report_date, t["stock_code"], t["ts"], t.get("nxt_price"), t.get("krx_price"))
+                for t in ticks
+            ],
+        )
+        conn.commit()
+
+
+def _path_metrics(report_price: int, ticks: list[tuple[datetime, int]]) -> dict | None:
+    """리포트 가격 대비 한 종목의 경로 지표.
+
+    - runup_pct     : 구간 최고가 기준 최대 상승률
+    - drawdown_pct  : 구간 내 고점 대비 최대 낙폭 (음수, 갭상승 후 밀림 포착)
+    - time_to_peak_min : 첫 틱부터 최고가 도달까지 걸린 분
+    """
+    if report_price <= 0 or not ticks:
+        return None
+    start = ticks[0][0]
+    peak_price, peak_ts = ticks[0][1], start
+    running_peak = ticks[0][1]
+    drawdown = 0.0
+    for ts, price in ticks:
+        if price > peak_price:
+            peak_price, peak_ts = price, ts
+        running_peak = max(running_peak, price)
+        drawdown = min(drawdown, (price - running_peak) / running_peak * 100)
+    return {
+        "runup_pct": (peak_price - report_price) / report_price * 100,
+        "drawdown_pct": drawdown,
+        "time_to_peak_min": (peak_ts - start).total_seconds() / 60,
+    }
+
+
+def get_gap_path_stats_by_dates(dates: list[str], top_n: int = 10) -> dict[str, dict]:
+    """여러 날짜의 Top N 갭 경로 지표 평균.
+
+    반환: {date: {tracked, avg_runup_pct, avg_drawdown_pct, avg_time_to_peak_min}}
+      - 틱 가격은 KRX 우선, 없으면 NXT.
+      - 추적 틱이 없는 날짜는 키 없음.
+    """
+    if not dates:
+        return {}
+
+    placeholders = ",".join(["%s"] * len(dates))
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            f"""SELECT t.report_date, t.stock_code, t.ts,
+                       COALESCE(t.krx_price, t.nxt_price) AS price,
+                       r.current_price AS report_price
+                  FROM gap_tick t
+                  JOIN daily_stock_report r
+                    ON r.report_date = t.report_date AND r.stock_code = t.stock_code
+                 WHERE t.report_date IN ({placeholders})
+                   AND r.rank_no BETWEEN 1 AND %s
+                   AND (t.krx_price IS NOT NULL OR t.nxt_price IS NOT NULL)
+                 ORDER BY t.report_date, t.stock_code, t.ts""",
+            (*dates, top_n),
+        )
+        rows = cursor.fetchall()
+
+    series: dict[tuple[str, str], tuple[int, list]] = {}
+    for row in rows:
+        d = row["report_date"]
+        key = d.isoformat() if isinstance(d, (date, datetime)) else str(d)
+        report_price = abs(int(row["report_price"] or 0))
+        _, ticks = series.setdefault((key, row["stock_code"]), (report_price, []))
+        ticks.append((row["ts"], abs(int(row["price"]))))
+
+    per_date: dict[str, list[dict]] = {}
+    for (key, _), (report_price, ticks) in series.items():
+        m = _path_metrics(report_price, ticks)
+        if m:
+            per_date.setdefault(key, []).append(m)
+
+    stats: dict[str, dict] = {}
+    for key, metrics in per_date.items():
+        n = len(metrics)
+        stats[key] = {
+            "tracked": n,
+            "avg_runup_pct": sum(m["runup_pct"] for m in metrics) / n,
+            "avg_drawdown_pct": sum(m["drawdown_pct"] for m in metrics) / n,
+            "avg_time_to_peak_min": sum(m["time_to_peak_min"] for m in metrics) / n,
+        }
+    return stats
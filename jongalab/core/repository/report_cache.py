@@ -0,0 +1,127 @@
+"""일간 리포트 조회 read-through 캐시
+
+daily_stock_report / daily_sector_report 의 지난 날짜 행은 갭 체크가 끝나면 바뀌지 않는다.
+조회마다 다시 SELECT 하고 supply_history·hourly_candles JSON 을 다시 파싱하지 않도록
+저장소 함수 앞단에서 직렬화가 끝난 결과를 프로세스 메모리에 보관한다.
+
+  - 확정(settled) 항목: _SETTLED_TTL_SEC 초(기본 1시간) 후 재조회. 용량(_MAX_ENTRIES) 초과 시 LRU.
+  - 미확정 항목(오늘 리포트, 날짜 목록 등): _TODAY_TTL_SEC 초 후 재조회.
+  - 저장 함수는 invalidate() 로 해당 항목을 즉시 비운다.
+
+캐시는 프로세스 단위다. 워커(closing_bet, gap_check)가 저장하면 워커 프로세스의 캐시만
+비워지므로, API 프로세스는 TTL 로 변경을 따라잡는다 — 확정 항목도 만료 없이 두지 않는다.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+_TODAY_TTL_SEC = float(os.getenv("REPORT_CACHE_TODAY_TTL_SEC", "30"))
+_SETTLED_TTL_SEC = float(os.getenv("REPORT_CACHE_SETTLED_TTL_SEC", "3600"))
+_MAX_ENTRIES = 256
+
+# key: (namespace, arg) → (만료 시각 monotonic, 확정 여부, 값)
+_cache: "OrderedDict[tuple, tuple[float, bool, Any]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def is_past_date(report_date: str) -> bool:
+    """report_date(YYYY-MM-DD)가 오늘 이전인지"""
+    return str(report_date)[:10] < date.today().isoformat()
+
+
+def _copy(value):
+    """호출 측 변경이 캐시로 새지 않도록 list/dict 를 한 단계 복사.
+
+    행 안의 supply_history·hourly_candles·stocks 목록은 공유된다 (읽기 전용으로 취급).
+    """
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _lookup(key: tuple):
+    """유효한 캐시 항목이면 (True, 값), 없거나 만료됐으면 (False, None)"""
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if now < expires_at:
+                _cache.move_to_end(key)
+                return True, value
+            del _cache[key]
+    return False, None
+
+
+def _store(key: tuple, value, settled: bool):
+    expires_at = time.monotonic() + (_SETTLED_TTL_SEC if settled else _TODAY_TTL_SEC)
+    with _lock:
+        _cache[key] = (expires_at, settled, value)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def cached(
+    namespace: str,
+    arg,
+    loader: Callable[[], Any],
+    settled: Callable[[Any], bool],
+):
+    """(namespace, arg) 항목을 캐시에서 반환하고, 없거나 만료됐으면 loader() 로 채운다.
+
+    settled(값) 이 True 면 _SETTLED_TTL_SEC, False 면 _TODAY_TTL_SEC 동안 보관.
+    """
+    key = (namespace, arg)
+    hit, value = _lookup(key)
+    if not hit:
+        value = loader()
+        _store(key, value, settled(value))
+    return _copy(value)
+
+
+async def acached(
+    namespace: str,
+    arg,
+    loader: Callable[[], Awaitable[Any]],
+    settled: Callable[[Any], Awaitable[bool]],
+):
+    """cached() 의 async 버전 — loader/settled 가 코루틴 함수. 캐시 항목은 동기 경로와 공유."""
+    key = (namespace, arg)
+    hit, value = _lookup(key)
+    if not hit:
+        value = await loader()
+        _store(key, value, await settled(value))
+    return _copy(value)
+
+
+def is_settled(namespace: str, arg) -> bool:
+    """(namespace, arg) 항목이 확정 항목으로 캐시돼 있는지"""
+    with _lock:
+        entry = _cache.get((namespace, arg))
+    return entry is not None and entry[1] and time.monotonic() < entry[0]
+
+
+def invalidate(namespace: str, arg=None):
+    """namespace 의 캐시 항목 제거. arg 지정 시 해당 항목만, 미지정 시 namespace 전체.
+
+    "namespace:xxx" 형태의 파생 항목(예: 직렬화된 응답 본문)도 함께 지운다.
+    """
+    prefix = namespace + ":"
+    with _lock:
+        for key in [
+            k for k in _cache
+            if (k[0] == namespace or k[0].startswith(prefix)) and (arg is None or k[1] == arg)
+        ]:
+            del _cache[key]
+
+
+def clear():
+    """전체 캐시 비우기"""
+    with _lock:
+        _cache.clear()
@@ -2,11 +2,13 @@
 import json
 from datetime import date, datetime
 
+from core.adb import get_adb
 from core.db import get_db
+from core.repository import report_cache
 
 
 def save_sector_reports(sectors: list[dict]):
-    """테마그룹 분석 결과를 일괄 저장 (UPSERT)
+    """테마그룹 분석 결과를 일괄 저장 (UPSERT, 단일 트랜잭션 — 빠진 테마는 삭제)
 
     sectors 각 항목 예시:
         {
@@ -28,40 +30,98 @@ def save_sector_reports(sectors: list[dict]):
     if not sectors:
         return
 
-    with get_db() as (conn, cursor):
-        cursor.execute("DELETE FROM daily_sector_report WHERE report_date = CURDATE()")
+    rows = [(
+        sec["thema_grp_cd"], sec["thema_nm"],
+        sec.get("stk_num", 0), sec.get("flu_rt", 0.0),
+        sec.get("dt_prft_rt", 0.0), sec.get("main_stk", ""),
+        sec.get("rising_stk_num", 0), sec.get("fall_stk_num", 0),
+        sec.get("rank_no", 0), json.dumps(sec.get("stocks", []), ensure_ascii=False),
+    ) for sec in sectors]
+    codes = [sec["thema_grp_cd"] for sec in sectors]
 
-        query = """
+    with get_db() as (conn, cursor):
+        # multi-row UPSERT — 값이 같은 행은 다시 쓰지 않는다
+        cursor.executemany(
+            """
             INSERT INTO daily_sector_report
             (report_date, thema_grp_cd, thema_nm, stk_num, flu_rt, dt_prft_rt,
              main_stk, rising_stk_num, fall_stk_num, rank_no, stocks)
             VALUES (CURDATE(), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        for s in sectors:
-            stocks_json = json.dumps(s.get("stocks", []), ensure_ascii=False)
-            cursor.execute(query, (
-                s["thema_grp_cd"], s["thema_nm"],
-                s.get("stk_num", 0), s.get("flu_rt", 0.0),
-                s.get("dt_prft_rt", 0.0), s.get("main_stk", ""),
-                s.get("rising_stk_num", 0), s.get("fall_stk_num", 0),
-                s.get("rank_no", 0), stocks_json,
-            ))
+            ON DUPLICATE KEY UPDATE
+                thema_nm = VALUES(thema_nm), stk_num = VALUES(stk_num),
+                flu_rt = VALUES(flu_rt), dt_prft_rt = VALUES(dt_prft_rt),
+                main_stk = VALUES(main_stk), rising_stk_num = VALUES(rising_stk_num),
+                fall_stk_num = VALUES(fall_stk_num), rank_no = VALUES(rank_no),
+                stocks = VALUES(stocks)
+            """,
+            rows,
+        )
+        # 이번 분석에서 빠진 테마만 한 번에 정리
+        cursor.execute(
+            f"""DELETE FROM daily_sector_report
+                 WHERE report_date = CURDATE()
+                   AND thema_grp_cd NOT IN ({', '.join(['%s'] * len(codes))})""",
+            tuple(codes),
+        )
         conn.commit()
 
+    report_cache.invalidate("sector_reports", date.today().isoformat())
+    report_cache.invalidate("sector_report_dates")
+
+
+_SELECT_BY_DATE = """SELECT * FROM daily_sector_report
+               WHERE report_date = %s
+               ORDER BY rank_no ASC"""
+_SELECT_DATES = """SELECT DISTINCT report_date
+               FROM daily_sector_report
+               ORDER BY report_date DESC
+               LIMIT %s"""
+
 
 def get_sector_reports_by_date(report_date: str) -> list[dict]:
-    """특정 날짜의 주도 섹터 목록 (순위순)"""
+    """특정 날짜의 주도 섹터 목록 (순위순). 지난 날짜는 확정 TTL, 오늘은 짧은 TTL 로 캐시."""
+    return report_cache.cached(
+        "sector_reports", report_date,
+        lambda: _load_sector_reports_by_date(report_date),
+        lambda _: report_cache.is_past_date(report_date),
+    )
+
+
+async def get_sector_reports_by_date_async(report_date: str) -> list[dict]:
+    """get_sector_reports_by_date 의 async 버전 (캐시 공유)"""
+    async def settled(_):
+        return report_cache.is_past_date(report_date)
+
+    return await report_cache.acached(
+        "sector_reports", report_date,
+        lambda: _load_sector_reports_by_date_async(report_date),
+        settled,
+    )
+
+
+def _load_sector_reports_by_date(report_date: str) -> list[dict]:
     with get_db() as (conn, cursor):
-        cursor.execute(
-            """SELECT * FROM daily_sector_report
-               WHERE report_date = %s
-               ORDER BY rank_no ASC""",
-            (report_date,),
-        )
+        cursor.execute(_SELECT_BY_DATE, (report_date,))
         results = cursor.fetchall()
-        for row in results:
-            _serialize(row)
-        return results
+    for row in results:
+        _serialize(row)
+    return results
+
+
+async def _load_sector_reports_by_date_async(report_date: str) -> list[dict]:
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_SELECT_BY_DATE, (report_date,))
+        results = list(await cursor.fetchall())
+    for row in results:
+        _serialize(row)
+    return results
+
+
+def _top_themes_query(dates: list[str]) -> str:
+    return f"""SELECT report_date, thema_nm, rank_no
+                  FROM daily_sector_report
+                 WHERE report_date IN ({",".join(["%s"] * len(dates))})
+                 ORDER BY report_date DESC, rank_no ASC"""
 
 
 def get_top_themes_by_dates(dates: list[str], limit: int = 3) -> dict[str, list[str]]:
@@ -72,17 +132,24 @@ def get_top_themes_by_dates(dates: list[str], limit: int = 3) -> dict[str, list[
     if not dates:
         return {}
 
-    placeholders = ",".join(["%s"] * len(dates))
     with get_db() as (conn, cursor):
-        cursor.execute(
-            f"""SELECT report_date, thema_nm, rank_no
-                  FROM daily_sector_report
-                 WHERE report_date IN ({placeholders})
-                 ORDER BY report_date DESC, rank_no ASC""",
-            tuple(dates),
-        )
+        cursor.execute(_top_themes_query(dates), tuple(dates))
         rows = cursor.fetchall()
+    return _group_top_themes(rows, limit)
+
+
+async def get_top_themes_by_dates_async(dates: list[str], limit: int = 3) -> dict[str, list[str]]:
+    """get_top_themes_by_dates 의 async 버전"""
+    if not dates:
+        return {}
+
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_top_themes_query(dates), tuple(dates))
+        rows = await cursor.fetchall()
+    return _group_top_themes(rows, limit)
+
 
+def _group_top_themes(rows, limit: int) -> dict[str, list[str]]:
     result: dict[str, list[str]] = {}
     for row in rows:
         d = row["report_date"]
@@ -94,22 +161,45 @@ def get_top_themes_by_dates(dates: list[str], limit: int = 3) -> dict[str, list[
 
 
 def get_sector_report_dates(limit: int = 30) -> list[str]:
-    """섹터 리포트가 존재하는 날짜 목록"""
+    """섹터 리포트가 존재하는 날짜 목록 (짧은 TTL 캐시)"""
+    return report_cache.cached(
+        "sector_report_dates", limit,
+        lambda: _load_sector_report_dates(limit),
+        lambda _: False,
+    )
+
+
+async def get_sector_report_dates_async(limit: int = 30) -> list[str]:
+    """get_sector_report_dates 의 async 버전 (캐시 공유)"""
+    async def settled(_):
+        return False
+
+    return await report_cache.acached(
+        "sector_report_dates", limit,
+        lambda: _load_sector_report_dates_async(limit),
+        settled,
+    )
+
+
+def _load_sector_report_dates(limit: int) -> list[str]:
     with get_db() as (conn, cursor):
-        cursor.execute(
-            """SELECT DISTINCT report_date
-               FROM daily_sector_report
-               ORDER BY report_date DESC
-               LIMIT %s""",
-            (limit,),
-        )
-        results = cursor.fetchall()
-        return [
-            row["report_date"].isoformat()
-            if isinstance(row["report_date"], (date, datetime))
-            else str(row["report_date"])
-            for row in results
-        ]
+        cursor.execute(_SELECT_DATES, (limit,))
+        return _date_list(cursor.fetchall())
+
+
+async def _load_sector_report_dates_async(limit: int) -> list[str]:
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_SELECT_DATES, (limit,))
+        return _date_list(await cursor.fetchall())
+
+
+def _date_list(rows) -> list[str]:
+    return [
+        row["report_date"].isoformat()
+        if isinstance(row["report_date"], (date, datetime))
+        else str(row["report_date"])
+        for row in rows
+    ]
 
 
 def _serialize(row: dict):
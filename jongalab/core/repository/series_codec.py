@@ -0,0 +1,138 @@
+"""일간 리포트 시계열 컬럼(hourly_candles, supply_history) compact 바이너리 코덱
+
+JSON 텍스트(행마다 반복되는 키 + 문자열 시각) 대신 필드별 정수 배열을 델타 인코딩한다.
+
+형식:
+  헤더 <BBH : version, kind, 항목 수
+  필드마다: scale(1B, 모든 값이 10**scale 의 배수) + 첫 값과 이후 차분의 zigzag varint
+
+  - 시각 "YYYY-MM-DDTHH:MM" 은 epoch 분, 날짜 "YYYY-MM-DD" 는 epoch 일로 바꿔 넣는다.
+  - encode 는 decode 결과가 원본과 정확히 같고 MAX_BYTES(*_bin 컬럼 BLOB 크기) 이하일 때만
+    바이트를 돌려주고, 아니면 None (형식이 다른 값이 섞였거나 너무 긴 경우 — 호출 측은 기존
+    JSON 으로 저장한다).
+"""
+import struct
+from datetime import date, datetime, timedelta
+
+VERSION = 1
+MAX_BYTES = 65535  # daily_stock_report.*_bin (BLOB)
+
+KIND_HOURLY_CANDLES = 1
+KIND_SUPPLY_HISTORY = 2
+
+_HEADER = struct.Struct("<BBH")
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_DATE = date(1970, 1, 1)
+
+# kind → (필드명, 변환 종류) — 필드 순서가 곧 디코드 결과 dict 의 키 순서
+_LAYOUTS = {
+    KIND_HOURLY_CANDLES: (
+        ("time", "minute"), ("open", "int"), ("high", "int"),
+        ("low", "int"), ("close", "int"), ("volume", "int"),
+    ),
+    KIND_SUPPLY_HISTORY: (
+        ("date", "day"), ("inst_net_buy", "int"),
+        ("frgn_net_buy", "int"), ("indv_net_buy", "int"),
+    ),
+}
+
+
+def _to_int(value, conv: str) -> int:
+    if conv == "minute":
+        return int((datetime.strptime(value, "%Y-%m-%dT%H:%M") - _EPOCH).total_seconds()) // 60
+    if conv == "day":
+        return (date.fromisoformat(value) - _EPOCH_DATE).days
+    if type(value) is not int:
+        raise TypeError(f"정수가 아닌 값: {value!r}")
+    return value
+
+
+def _from_int(n: int, conv: str):
+    if conv == "minute":
+        return (_EPOCH + timedelta(minutes=n)).strftime("%Y-%m-%dT%H:%M")
+    if conv == "day":
+        return date.fromordinal(_EPOCH_DATE.toordinal() + n).isoformat()
+    return n
+
+
+def _scale_of(values: list[int]) -> int:
+    """모든 값이 10**k 의 배수인 최대 k (0~18)"""
+    nonzero = [v for v in values if v]
+    if not nonzero:
+        return 0
+    k = 0
+    while k < 18 and all(v % 10 ** (k + 1) == 0 for v in nonzero):
+        k += 1
+    return k
+
+
+def _put_varint(out: bytearray, n: int):
+    if not -(1 << 63) <= n < (1 << 63):
+        raise OverflowError(f"64비트 범위를 벗어난 값: {n}")
+    z = (n << 1) ^ (n >> 63)  # zigzag: 음수도 작은 양수로
+    while z >= 0x80:
+        out.append((z & 0x7F) | 0x80)
+        z >>= 7
+    out.append(z)
+
+
+def _get_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    z = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        z |= (b & 0x7F) << shift
+        if b < 0x80:
+            break
+        shift += 7
+    return (z >> 1) ^ -(z & 1), pos
+
+
+def encode(kind: int, items: list[dict] | None) -> bytes | None:
+    """items → compact 바이트. 빈 목록이거나 손실 없이 담을 수 없거나 MAX_BYTES 를 넘으면 None."""
+    if not items:
+        return None
+    layout = _LAYOUTS[kind]
+    names = [name for name, _ in layout]
+    try:
+        if any(set(item) != set(names) for item in items):
+            return None
+        out = bytearray(_HEADER.pack(VERSION, kind, len(items)))
+        for name, conv in layout:
+            values = [_to_int(item[name], conv) for item in items]
+            scale = _scale_of(values)
+            unit = 10 ** scale
+            out.append(scale)
+            prev = 0
+            for v in values:
+                v //= unit
+                _put_varint(out, v - prev)
+                prev = v
+    except (TypeError, ValueError, OverflowError, struct.error):
+        return None
+    if len(out) > MAX_BYTES:
+        return None
+    blob = bytes(out)
+    return blob if decode(blob) == items else None
+
+
+def decode(blob: bytes | None) -> list[dict]:
+    """encode 의 역변환"""
+    if not blob:
+        return []
+    version, kind, count = _HEADER.unpack_from(blob, 0)
+    if version != VERSION:
+        raise ValueError(f"지원하지 않는 시계열 인코딩 버전: {version}")
+    layout = _LAYOUTS[kind]
+    items: list[dict] = [{} for _ in range(count)]
+    pos = _HEADER.size
+    for name, conv in layout:
+        unit = 10 ** blob[pos]
+        pos += 1
+        prev = 0
+        for item in items:
+            delta, pos = _get_varint(blob, pos)
+            prev += delta
+            item[name] = _from_int(prev * unit, conv)
+    return items
@@ -1,121 +1,271 @@
 """종목일간리포트 데이터 접근"""
 import json
+import os
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Callable
 
+from core.adb import get_adb
 from core.db import get_db
+from core.repository import report_cache, series_codec
+from core.repository.gap_tick import get_gap_path_stats_by_dates
+
+
+# save_stock_reports 가 쓰는 컬럼 (report_date 제외, 순서 = INSERT 값 순서)
+_REPORT_COLUMNS = (
+    "stock_code", "stock_name", "sector", "current_price", "change_pct",
+    "trading_value", "market_cap", "supply_score",
+    "inst_net_buy", "frgn_net_buy",
+    "indv_net_buy", "prog_net_buy", "supply_days", "supply_history", "supply_history_bin",
+    "ma_aligned", "near_high", "hourly_candles", "hourly_candles_bin",
+    "is_leader", "is_theme_stock", "content_score", "score", "rank_no",
+)
+
+# supply_history / hourly_candles 저장 형식: compact(기본, series_codec 바이너리) | json
+SERIES_ENCODING = os.getenv("REPORT_SERIES_ENCODING", "compact")
+
+
+def _encode_series(kind: int, items: list[dict] | None) -> tuple[str | None, bytes | None]:
+    """시계열 컬럼 값 → (JSON 컬럼 값, 바이너리 컬럼 값). 둘 중 하나만 채운다.
+
+    compact 로 손실 없이 담을 수 없는 값은 JSON 으로 남긴다.
+    """
+    if not items:
+        return None, None
+    if SERIES_ENCODING == "compact":
+        blob = series_codec.encode(kind, items)
+        if blob is not None:
+            return None, blob
+    return json.dumps(items, ensure_ascii=False), None
 
 
 def save_stock_reports(candidates: list[dict]):
-    """Phase 2 결과를 일괄 저장 (오늘 날짜 기존 데이터 삭제 후 INSERT)"""
+    """Phase 2 결과를 오늘 날짜로 일괄 UPSERT (단일 트랜잭션).
+
+    - (report_date, stock_code) 기준 multi-row INSERT ... ON DUPLICATE KEY UPDATE.
+      값이 같은 행은 InnoDB 가 실제로 다시 쓰지 않는다(affected rows 0).
+    - 이번 랭킹에서 빠진 종목은 DELETE 한 번으로 정리.
+    오늘 리포트를 비운 뒤 다시 채우지 않으므로 조회 측에 빈 날이 보이지 않는다.
+    """
     if not candidates:
         return
 
+    rows = []
+    for c in candidates:
+        supply_history_json, supply_history_bin = _encode_series(
+            series_codec.KIND_SUPPLY_HISTORY, c.get("supply_history")
+        )
+        hourly_candles_json, hourly_candles_bin = _encode_series(
+            series_codec.KIND_HOURLY_CANDLES, c.get("hourly_candles")
+        )
+        rows.append((
+            c["stock_code"], c["stock_name"], c["sector"],
+            c["current_price"], c["change_pct"],
+            c["trading_value"], c["market_cap"],
+            c.get("supply_score", 0.0),
+            c["inst_net_buy"], c["frgn_net_buy"],
+            c["indv_net_buy"], c["prog_net_buy"], c["supply_days"],
+            supply_history_json, supply_history_bin,
+            c["ma_aligned"], c["near_high"], hourly_candles_json, hourly_candles_bin,
+            c["is_leader"], c.get("is_theme_stock", False),
+            c.get("content_score", 0),
+            c["score"], c["rank_no"],
+        ))
+
+    codes = [c["stock_code"] for c in candidates]
+    placeholders = ", ".join(["%s"] * len(_REPORT_COLUMNS))
+    updates = ", ".join(f"{col} = VALUES({col})" for col in _REPORT_COLUMNS[1:])
     with get_db() as (conn, cursor):
-        cursor.execute("DELETE FROM daily_stock_report WHERE report_date = CURDATE()")
-
-        query = """
-            INSERT INTO daily_stock_report
-            (report_date, stock_code, stock_name, sector, current_price, change_pct,
-             trading_value, market_cap, supply_score,
-             inst_net_buy, frgn_net_buy,
-             indv_net_buy, prog_net_buy, supply_days, supply_history,
-             ma_aligned, near_high, hourly_candles,
-             is_leader, is_theme_stock, content_score, score, rank_no)
-            VALUES (CURDATE(), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        for c in candidates:
-            supply_history_json = json.dumps(
-                c.get("supply_history", []), ensure_ascii=False
-            ) if c.get("supply_history") else None
-            hourly_candles_json = json.dumps(
-                c.get("hourly_candles", []), ensure_ascii=False
-            ) if c.get("hourly_candles") else None
-            cursor.execute(query, (
-                c["stock_code"], c["stock_name"], c["sector"],
-                c["current_price"], c["change_pct"],
-                c["trading_value"], c["market_cap"],
-                c.get("supply_score", 0.0),
-                c["inst_net_buy"], c["frgn_net_buy"],
-                c["indv_net_buy"], c["prog_net_buy"], c["supply_days"],
-                supply_history_json,
-                c["ma_aligned"], c["near_high"], hourly_candles_json,
-                c["is_leader"], c.get("is_theme_stock", False),
-                c.get("content_score", 0),
-                c["score"], c["rank_no"],
-            ))
+        # executemany 는 단일 multi-row INSERT 로 재작성되어 한 번의 왕복으로 저장된다.
+        cursor.executemany(
+            f"""INSERT INTO daily_stock_report (report_date, {', '.join(_REPORT_COLUMNS)})
+                VALUES (CURDATE(), {placeholders})
+                ON DUPLICATE KEY UPDATE {updates}""",
+            rows,
+        )
+        cursor.execute(
+            f"""DELETE FROM daily_stock_report
+                 WHERE report_date = CURDATE()
+                   AND stock_code NOT IN ({', '.join(['%s'] * len(codes))})""",
+            tuple(codes),
+        )
         conn.commit()
 
+    report_cache.invalidate("stock_reports", date.today().isoformat())
+    report_cache.invalidate("stock_report_dates")
+
+
+_SELECT_HISTORY = """SELECT * FROM daily_stock_report
+               WHERE stock_code = %s
+               ORDER BY report_date DESC
+               LIMIT %s"""
+_SELECT_BY_DATE = """SELECT * FROM daily_stock_report
+               WHERE report_date = %s
+               ORDER BY rank_no ASC"""
+_SELECT_DATES = """SELECT DISTINCT report_date
+               FROM daily_stock_report
+               ORDER BY report_date DESC
+               LIMIT %s"""
+
 
 def get_stock_report(report_date: str, stock_code: str) -> dict | None:
-    """특정 날짜 + 종목 리포트 조회"""
-    with get_db() as (conn, cursor):
-        cursor.execute(
-            "SELECT * FROM daily_stock_report WHERE report_date = %s AND stock_code = %s",
-            (report_date, stock_code),
-        )
-        result = cursor.fetchone()
-        if result:
-            _serialize_dates(result)
-        return result
+    """특정 날짜 + 종목 리포트 조회 (날짜별 목록 캐시에서 찾는다)"""
+    return _find_stock(get_stock_reports_by_date(report_date), stock_code)
+
+
+async def get_stock_report_async(report_date: str, stock_code: str) -> dict | None:
+    """get_stock_report 의 async 버전"""
+    return _find_stock(await get_stock_reports_by_date_async(report_date), stock_code)
+
+
+def _find_stock(rows: list[dict], stock_code: str) -> dict | None:
+    for row in rows:
+        if row["stock_code"] == stock_code:
+            return row
+    return None
 
 
 def get_stock_report_history(stock_code: str, days: int = 3) -> list[dict]:
     """특정 종목의 최근 N일 리포트 조회 (수급 동향용)"""
     with get_db() as (conn, cursor):
-        cursor.execute(
-            """SELECT * FROM daily_stock_report
-               WHERE stock_code = %s
-               ORDER BY report_date DESC
-               LIMIT %s""",
-            (stock_code, days),
-        )
+        cursor.execute(_SELECT_HISTORY, (stock_code, days))
         results = cursor.fetchall()
-        for row in results:
-            _serialize_dates(row)
-        return results
+    for row in results:
+        _serialize_dates(row)
+    return results
+
+
+async def get_stock_report_history_async(stock_code: str, days: int = 3) -> list[dict]:
+    """get_stock_report_history 의 async 버전"""
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_SELECT_HISTORY, (stock_code, days))
+        results = list(await cursor.fetchall())
+    for row in results:
+        _serialize_dates(row)
+    return results
 
 
 def get_stock_reports_by_date(report_date: str) -> list[dict]:
-    """특정 날짜의 전체 종목 리포트 목록 (점수순)"""
+    """특정 날짜의 전체 종목 리포트 목록 (점수순).
+
+    갭 체크(KRX 재조회)까지 끝난 지난 날짜는 긴 TTL, 그 외(오늘·갭 체크 대기)는 짧은 TTL 로 캐시한다.
+    """
+    return report_cache.cached(
+        "stock_reports", report_date,
+        lambda: _load_stock_reports_by_date(report_date),
+        lambda rows: _gap_settled(report_date, rows),
+    )
+
+
+async def get_stock_reports_by_date_async(report_date: str) -> list[dict]:
+    """get_stock_reports_by_date 의 async 버전 (캐시 공유)"""
+    async def settled(rows):
+        return _gap_settled(report_date, rows)
+
+    return await report_cache.acached(
+        "stock_reports", report_date,
+        lambda: _load_stock_reports_by_date_async(report_date),
+        settled,
+    )
+
+
+async def get_stock_reports_payload_async(
+    report_date: str, encode: Callable[[list[dict]], bytes]
+) -> bytes | None:
+    """특정 날짜 리포트 목록을 encode 로 직렬화한 응답 본문 (리포트가 없으면 None).
+
+    첫 조회 시 한 번 직렬화해 캐시하고, 행 목록이 확정(settled)된 날짜면 본문도
+    확정 TTL 로 보관한다. 행 캐시가 무효화되면 본문도 함께 지워진다.
+    """
+    async def load():
+        rows = await get_stock_reports_by_date_async(report_date)
+        return encode(rows) if rows else None
+
+    async def settled(_):
+        return report_cache.is_settled("stock_reports", report_date)
+
+    return await report_cache.acached("stock_reports:payload", report_date, load, settled)
+
+
+def _load_stock_reports_by_date(report_date: str) -> list[dict]:
     with get_db() as (conn, cursor):
-        cursor.execute(
-            """SELECT * FROM daily_stock_report
-               WHERE report_date = %s
-               ORDER BY rank_no ASC""",
-            (report_date,),
-        )
+        cursor.execute(_SELECT_BY_DATE, (report_date,))
         results = cursor.fetchall()
-        for row in results:
-            _serialize_dates(row)
-        return results
+    for row in results:
+        _serialize_dates(row)
+    return results
+
+
+async def _load_stock_reports_by_date_async(report_date: str) -> list[dict]:
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_SELECT_BY_DATE, (report_date,))
+        results = list(await cursor.fetchall())
+    for row in results:
+        _serialize_dates(row)
+    return results
+
+
+def _gap_settled(report_date: str, rows: list[dict]) -> bool:
+    """지난 날짜이고 Top 10 모두 KRX 갭 값이 채워졌는지 (다음날 --retry 가 끝나야 확정).
+
+    이후 날짜 리포트가 있다는 것만으로는 확정으로 보지 않는다 — 다음날 09시 closing_bet 저장이
+    09:05 --retry 의 KRX 기록보다 먼저 일어난다.
+    """
+    if not report_cache.is_past_date(report_date):
+        return False
+    top = [r for r in rows if 1 <= (r.get("rank_no") or 0) <= 10]
+    return all(r.get("gap_krx_pct") is not None for r in top)
 
 
 def get_stock_report_dates(limit: int = 30) -> list[str]:
-    """리포트가 존재하는 날짜 목록"""
+    """리포트가 존재하는 날짜 목록 (짧은 TTL 캐시)"""
+    return report_cache.cached(
+        "stock_report_dates", limit,
+        lambda: _load_stock_report_dates(limit),
+        lambda _: False,
+    )
+
+
+async def get_stock_report_dates_async(limit: int = 30) -> list[str]:
+    """get_stock_report_dates 의 async 버전 (캐시 공유)"""
+    async def settled(_):
+        return False
+
+    return await report_cache.acached(
+        "stock_report_dates", limit,
+        lambda: _load_stock_report_dates_async(limit),
+        settled,
+    )
+
+
+def _load_stock_report_dates(limit: int) -> list[str]:
     with get_db() as (conn, cursor):
-        cursor.execute(
-            """SELECT DISTINCT report_date
-               FROM daily_stock_report
-               ORDER BY report_date DESC
-               LIMIT %s""",
-            (limit,),
-        )
-        results = cursor.fetchall()
-        return [
-            row["report_date"].isoformat()
-            if isinstance(row["report_date"], (date, datetime))
-            else str(row["report_date"])
-            for row in results
-        ]
+        cursor.execute(_SELECT_DATES, (limit,))
+        return _date_list(cursor.fetchall())
+
+
+async def _load_stock_report_dates_async(limit: int) -> list[str]:
+    async with get_adb() as (conn, cursor):
+        await cursor.execute(_SELECT_DATES, (limit,))
+        return _date_list(await cursor.fetchall())
+
+
+def _date_list(rows) -> list[str]:
+    return [
+        row["report_date"].isoformat()
+        if isinstance(row["report_date"], (date, datetime))
+        else str(row["report_date"])
+        for row in rows
+    ]
 
 
 def save_gap_check_results(report_date: str, rows: list[dict]):
     """갭 체크 결과를 daily_stock_report에 업데이트.
 
     rows 항목 형태:
-      초기(08:10): {rank, now_price, pct}   → gap_nxt_*
-      재조회(09:10): {rank, nxt_price?, nxt_pct?, krx_price?, krx_pct?}
+      초기(08:10): {rank, now_price, pct, captured_at?}   → gap_nxt_*
+      재조회(09:10): {rank, nxt_price?, nxt_pct?, krx_price?, krx_pct?, captured_at?}
+    captured_at(시세 실제 포착 시각)이 있으면 gap_checked_at 에 그대로 기록한다.
 
     error/pending 행은 가격 값이 없으므로 자연스럽게 건너뜀.
     rank_no는 같은 report_date 안에서 unique 하다고 가정.
@@ -141,32 +291,44 @@ def save_gap_check_results(report_date: str, rows: list[dict]):
             krx_pct = None
         if all(v is None for v in (nxt_price, nxt_pct, krx_price, krx_pct)):
             continue
-        updates.append((nxt_price, nxt_pct, krx_price, krx_pct, report_date, rank))
+        updates.append((
+            nxt_price, nxt_pct, krx_price, krx_pct, r.get("captured_at"), report_date, rank,
+        ))
 
     if not updates:
         return
 
+    # 행별 UPDATE 대신 값 목록을 파생 테이블로 만들어 UPDATE ... JOIN 한 번에 반영
+    derived = " UNION ALL ".join(
+        ["SELECT %s AS nxt_price, %s AS nxt_pct, %s AS krx_price, %s AS krx_pct,"
+         " %s AS captured_at, %s AS rank_no"] * len(updates)
+    )
+    params = [v for u in updates for v in (*u[:5], u[6])]
     with get_db() as (conn, cursor):
-        for nxt_price, nxt_pct, krx_price, krx_pct, rd, rank in updates:
-            cursor.execute(
-                """UPDATE daily_stock_report
-                   SET gap_nxt_price = COALESCE(%s, gap_nxt_price),
-                       gap_nxt_pct   = COALESCE(%s, gap_nxt_pct),
-                       gap_krx_price = COALESCE(%s, gap_krx_price),
-                       gap_krx_pct   = COALESCE(%s, gap_krx_pct),
-                       gap_checked_at = CURRENT_TIMESTAMP
-                   WHERE report_date = %s AND rank_no = %s""",
-                (nxt_price, nxt_pct, krx_price, krx_pct, rd, rank),
-            )
+        cursor.execute(
+            f"""UPDATE daily_stock_report d
+                  JOIN ({derived}) v ON v.rank_no = d.rank_no
+                   SET d.gap_nxt_price = COALESCE(v.nxt_price, d.gap_nxt_price),
+                       d.gap_nxt_pct   = COALESCE(v.nxt_pct, d.gap_nxt_pct),
+                       d.gap_krx_price = COALESCE(v.krx_price, d.gap_krx_price),
+                       d.gap_krx_pct   = COALESCE(v.krx_pct, d.gap_krx_pct),
+                       d.gap_checked_at = COALESCE(v.captured_at, CURRENT_TIMESTAMP)
+                 WHERE d.report_date = %s""",
+            (*params, report_date),
+        )
         conn.commit()
 
+    report_cache.invalidate("stock_reports", report_date)
+
 
 def get_gap_stats_by_dates(dates: list[str]) -> dict[str, dict]:
     """여러 날짜의 Top 10 갭 체크 승률 통계를 한 번에 조회.
 
-    반환: {date: {wins, losses, flats, total}}
+    반환: {date: {wins, losses, flats, total, [tracked, avg_runup_pct, avg_drawdown_pct,
+                   avg_time_to_peak_min]}}
       - KRX 우선, 없으면 NXT 등락률 기준.
       - 갭 체크가 안 된 날짜는 키 없음.
+      - gap_check --track 시계열이 있는 날짜는 경로 지표(gap_tick)를 함께 싣는다.
     """
     if not dates:
         return {}
@@ -201,6 +363,9 @@ def get_gap_stats_by_dates(dates: list[str]) -> dict[str, dict]:
             s["losses"] += 1
         else:
             s["flats"] += 1
+
+    for key, path in get_gap_path_stats_by_dates(dates).items():
+        stats.setdefault(key, {"wins": 0, "losses": 0, "flats": 0, "total": 0}).update(path)
     return stats
 
 
@@ -232,13 +397,12 @@ def _serialize_dates(row: dict):
     # supply_score → supply_grade 파생 (DB에 등급은 저장하지 않음)
     if "supply_score" in row:
         row["supply_grade"] = _score_to_grade(row.get("supply_score") or 0.0)
-    # supply_history JSON 파싱
-    if "supply_history" in row and isinstance(row["supply_history"], str):
-        row["supply_history"] = json.loads(row["supply_history"])
-    if row.get("supply_history") is None:
-        row["supply_history"] = []
-    # hourly_candles JSON 파싱
-    if "hourly_candles" in row and isinstance(row["hourly_candles"], str):
-        row["hourly_candles"] = json.loads(row["hourly_candles"])
-    if row.get("hourly_candles") is None:
-        row["hourly_candles"] = []
+    # supply_history / hourly_candles: compact 바이너리 우선, 없으면 JSON 파싱
+    for key in ("supply_history", "hourly_candles"):
+        blob = row.pop(f"{key}_bin", None)
+        if blob:
+            row[key] = series_codec.decode(blob)
+        elif key in row and isinstance(row[key], str):
+            row[key] = json.loads(row[key])
+        if row.get(key) is None:
+            row[key] = []
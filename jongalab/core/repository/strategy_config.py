@@ -43,6 +43,13 @@ _DEFAULTS = {
     "THEME_PERIOD_DAYS": "10",
     "THEME_STOCK_BONUS": 15,
     "CONTENT_SCORE_MAX": 10,
+    "ORDER_TOP_N": 5,
+    "ORDER_BUDGET_RATIO": 0.9,
+    "ORDER_SPLIT_COUNT": 2,
+    "ORDER_SPLIT_INTERVAL_SEC": 60,
+    "ORDER_TIME": "15:15",
+    "ORDER_TRADE_TYPE": "3",
+    "ORDER_MAX_PER_SEC": 5,
     "EXCLUDE_KEYWORDS": [
         "ETF", "ETN", "KODEX", "TIGER", "KBSTAR",
         "ARIRANG", "SOL", "HANARO", "RISE",
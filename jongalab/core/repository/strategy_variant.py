@@ -0,0 +1,116 @@
+"""섀도 전략 변형(variant) 설정 및 변형별 랭킹 데이터 접근
+
+closing_bet 이 한 번 수집한 후보 피처를 변형 설정마다 재채점한 결과를
+daily_variant_report 에 variant 라벨별로 저장하고, 다음날 gap_check 가
+같은 시세로 변형별 갭 성과를 채운다.
+"""
+import json
+from datetime import date, datetime
+
+from core.db import get_db
+
+
+def get_active_strategy_variants() -> dict[str, dict]:
+    """활성 변형 설정 조회. 반환: {name: 기본 설정 대비 덮어쓸 항목 dict}"""
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            """SELECT name, config FROM strategy_variant
+               WHERE is_active = TRUE
+               ORDER BY name ASC"""
+        )
+        rows = cursor.fetchall()
+    return {
+        row["name"]: json.loads(row["config"]) if isinstance(row["config"], str) else row["config"]
+        for row in rows
+    }
+
+
+def save_variant_reports(variant: str, reports: list[dict]):
+    """변형 하나의 오늘 랭킹을 일괄 UPSERT (단일 트랜잭션, 빠진 종목은 한 번에 삭제)"""
+    if not reports:
+        return
+
+    codes = [r["stock_code"] for r in reports]
+    with get_db() as (conn, cursor):
+        cursor.executemany(
+            """
+            INSERT INTO daily_variant_report
+            (report_date, variant, stock_code, stock_name, current_price,
+             supply_score, score, rank_no)
+            VALUES (CURDATE(), %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                stock_name = VALUES(stock_name), current_price = VALUES(current_price),
+                supply_score = VALUES(supply_score), score = VALUES(score),
+                rank_no = VALUES(rank_no)
+            """,
+            [(
+                variant, r["stock_code"], r["stock_name"], r["current_price"],
+                r.get("supply_score", 0.0), r["score"], r["rank_no"],
+            ) for r in reports],
+        )
+        cursor.execute(
+            f"""DELETE FROM daily_variant_report
+                 WHERE report_date = CURDATE() AND variant = %s
+                   AND stock_code NOT IN ({', '.join(['%s'] * len(codes))})""",
+            (variant, *codes),
+        )
+        conn.commit()
+
+
+def get_variant_reports_by_date(report_date: str) -> dict[str, list[dict]]:
+    """특정 날짜의 변형별 랭킹. 반환: {variant: [row, ...]} (rank_no 순)"""
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            """SELECT * FROM daily_variant_report
+               WHERE report_date = %s
+               ORDER BY variant ASC, rank_no ASC""",
+            (report_date,),
+        )
+        rows = cursor.fetchall()
+
+    result: dict[str, list[dict]] = {}
+    for row in rows:
+        if isinstance(row.get("report_date"), (date, datetime)):
+            row["report_date"] = row["report_date"].isoformat().split("T")[0]
+        for col in ("created_at", "gap_checked_at"):
+            if isinstance(row.get(col), datetime):
+                row[col] = row[col].isoformat()
+        result.setdefault(row["variant"], []).append(row)
+    return result
+
+
+def save_variant_gap_results(report_date: str, rows: list[dict]):
+    """변형별 갭 체크 결과 업데이트.
+
+    rows 항목 형태: {variant, stock_code, nxt_price?, nxt_pct?, krx_price?, krx_pct?}
+    값이 없는 항목은 COALESCE 로 기존 값을 유지한다.
+    """
+    if not rows:
+        return
+
+    # 행별 UPDATE 대신 값 목록 파생 테이블과 UPDATE ... JOIN 한 번으로 반영
+    derived = " UNION ALL ".join(
+        ["SELECT %s AS variant, %s AS stock_code, %s AS nxt_price, %s AS nxt_pct,"
+         " %s AS krx_price, %s AS krx_pct"] * len(rows)
+    )
+    params = [
+        v for r in rows
+        for v in (
+            r["variant"], r["stock_code"],
+            r.get("nxt_price"), r.get("nxt_pct"), r.get("krx_price"), r.get("krx_pct"),
+        )
+    ]
+    with get_db() as (conn, cursor):
+        cursor.execute(
+            f"""UPDATE daily_variant_report d
+                  JOIN ({derived}) v
+                    ON v.variant = d.variant AND v.stock_code = d.stock_code
+                   SET d.gap_nxt_price = COALESCE(v.nxt_price, d.gap_nxt_price),
+                       d.gap_nxt_pct   = COALESCE(v.nxt_pct, d.gap_nxt_pct),
+                       d.gap_krx_price = COALESCE(v.krx_price, d.gap_krx_price),
+                       d.gap_krx_pct   = COALESCE(v.krx_pct, d.gap_krx_pct),
+                       d.gap_checked_at = CURRENT_TIMESTAMP
+                 WHERE d.report_date = %s""",
+            (*params, report_date),
+        )
+        conn.commit()
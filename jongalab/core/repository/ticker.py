@@ -2,38 +2,27 @@
 from datetime import datetime
 
 from core.db import get_db
+from core.repository.ticker_index import (
+    find_by_company_name,
+    invalidate_ticker_index,
+    ticker_name_map,
+)
 
 
 def lookup_ticker(company_name: str) -> dict | None:
-    """ticker_dictionary에서 기업명으로 티커 조회 (ACTIVE 우선, PENDING도 허용)"""
-    with get_db() as (conn, cursor):
-        cursor.execute(
-            """
-            SELECT id, company_name, ticker_symbol, status
-            FROM ticker_dictionary
-            WHERE company_name = %s
-            ORDER BY FIELD(status, 'ACTIVE', 'PENDING', 'INACTIVE')
-            LIMIT 1
-            """,
-            (company_name,),
-        )
-        return cursor.fetchone()
+    """기업명으로 티커 조회 (ACTIVE 우선, PENDING/INACTIVE 도 반환 — 호출 측이 status 확인).
+    공백·법인 표기·대소문자 차이는 무시한다 (ticker_index 참고)."""
+    return find_by_company_name(company_name)
 
 
 def lookup_name_by_ticker(ticker_symbol: str) -> str | None:
-    """ticker_dictionary에서 티커 심볼로 기업명 조회 (ACTIVE 우선)"""
-    with get_db() as (conn, cursor):
-        cursor.execute(
-            """
-            SELECT company_name FROM ticker_dictionary
-            WHERE ticker_symbol = %s AND status != 'INACTIVE'
-            ORDER BY FIELD(status, 'ACTIVE', 'PENDING')
-            LIMIT 1
-            """,
-            (ticker_symbol,),
-        )
-        row = cursor.fetchone()
-        return row["company_name"] if row else None
+    """티커 심볼로 기업명 조회 (INACTIVE 제외, ACTIVE 우선)"""
+    return ticker_name_map().get(ticker_symbol)
+
+
+def get_ticker_name_map() -> dict[str, str]:
+    """ticker_dictionary 전체 {티커 심볼: 기업명} (INACTIVE 제외, 같은 티커는 ACTIVE 우선)"""
+    return dict(ticker_name_map())
 
 
 def save_ticker(company_name: str, ticker_symbol: str, status: str = "PENDING") -> None:
@@ -47,6 +36,7 @@ def save_ticker(company_name: str, ticker_symbol: str, status: str = "PENDING")
             (company_name, ticker_symbol, status),
         )
         conn.commit()
+    invalidate_ticker_index()
 
 
 def get_ticker_dictionary(status: str | None = None) -> list[dict]:
@@ -92,7 +82,9 @@ def update_ticker(
     with get_db() as (conn, cursor):
         cursor.execute(sql, tuple(params))
         conn.commit()
-        return cursor.rowcount > 0
+        updated = cursor.rowcount > 0
+    invalidate_ticker_index()
+    return updated
 
 
 def delete_ticker(ticker_id: int) -> bool:
@@ -100,4 +92,6 @@ def delete_ticker(ticker_id: int) -> bool:
     with get_db() as (conn, cursor):
         cursor.execute("DELETE FROM ticker_dictionary WHERE id = %s", (ticker_id,))
         conn.commit()
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
+    invalidate_ticker_index()
+    return deleted
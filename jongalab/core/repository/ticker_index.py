@@ -0,0 +1,139 @@
+"""ticker_dictionary 프로세스 내 인덱스
+
+기업명 → 티커(core.ticker), 티커 → 종목명(market_data), 티커 → 섹터(sector_resolver) 조회가
+건마다 연결을 열고 SELECT 하지 않도록 사전 전체를 한 번에 적재해 메모리에서 찾는다.
+
+  - 기업명 키: normalize_company_name() — 공백·'주식회사'·'(주)'·'㈜' 제거, 대소문자 무시
+  - 같은 키/티커에 여러 행이면 ACTIVE > PENDING > INACTIVE 순으로 우선
+  - 관리자 저장 함수(save/update/delete_ticker)는 invalidate_ticker_index() 로 즉시 비운다.
+  - 섹터 캐시 갱신(sector_resolver)은 건마다 전체를 다시 적재하지 않도록 apply_sector() 로
+    살아 있는 인덱스의 해당 행만 고친다.
+  - 다른 프로세스의 변경은 TICKER_INDEX_CHECK_SEC(기본 60)초마다 (행 수, MAX(updated_at))
+    을 비교해 바뀌었을 때만 다시 적재한다.
+
+인덱스가 돌려주는 dict/list 는 공유 객체다 (읽기 전용으로 취급, 고칠 땐 복사).
+"""
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+from core.db import get_db
+
+_CHECK_SEC = float(os.getenv("TICKER_INDEX_CHECK_SEC", "60"))
+
+_STATUS_RANK = {"ACTIVE": 0, "PENDING": 1, "INACTIVE": 2}
+_CORP_MARKS = re.compile(r"주식회사|\(주\)|㈜|\s+")
+
+_LOAD_SQL = """
+    SELECT id, company_name, ticker_symbol, status, sector, sector_updated_at
+    FROM ticker_dictionary
+"""
+_VERSION_SQL = "SELECT COUNT(*) AS n, MAX(updated_at) AS changed_at FROM ticker_dictionary"
+
+
+def normalize_company_name(name: str | None) -> str:
+    """기업명 비교 키 — 공백·법인 표기 제거 + casefold ('삼성 전자(주)' == '삼성전자')"""
+    return _CORP_MARKS.sub("", name or "").casefold()
+
+
+def _rank(row: dict) -> int:
+    return _STATUS_RANK.get(row.get("status"), len(_STATUS_RANK))
+
+
+def _order(row: dict) -> tuple:
+    return _rank(row), row["id"]
+
+
+class _TickerIndex:
+    __slots__ = ("by_name", "by_ticker", "names", "version", "checked_at")
+
+    def __init__(self, rows: list[dict], version: tuple):
+        self.by_name: dict[str, dict] = {}
+        self.by_ticker: dict[str, list[dict]] = {}
+        self.names: dict[str, str] = {}
+        # 상태 우선순위 순으로 넣으면 "키마다 처음 본 행"이 곧 우선 행이다
+        for row in sorted(rows, key=_order):
+            self._add(row)
+        self.version = version
+        self.checked_at = time.monotonic()
+
+    def _add(self, row: dict):
+        self.by_name.setdefault(normalize_company_name(row["company_name"]), row)
+        self.by_ticker.setdefault(row["ticker_symbol"], []).append(row)
+        if row["status"] != "INACTIVE":
+            self.names.setdefault(row["ticker_symbol"], row["company_name"])
+
+    def insert(self, row: dict):
+        """적재 이후 추가된 행 반영 (우선순위가 더 낮은 행 뒤에 들어가도 순서를 유지)"""
+        self._add(row)
+        self.by_ticker[row["ticker_symbol"]].sort(key=_order)
+
+
+_lock = threading.Lock()
+_index: _TickerIndex | None = None
+
+
+def _read_version(cursor) -> tuple:
+    cursor.execute(_VERSION_SQL)
+    row = cursor.fetchone()
+    return row["n"], row["changed_at"]
+
+
+def _get_index() -> _TickerIndex:
+    """현재 인덱스. 없으면 적재, 확인 주기가 지났으면 버전 비교 후 바뀐 경우에만 재적재."""
+    global _index
+    with _lock:
+        index = _index
+        if index is not None and time.monotonic() - index.checked_at < _CHECK_SEC:
+            return index
+        with get_db() as (conn, cursor):
+            version = _read_version(cursor)
+            if index is not None and index.version == version:
+                index.checked_at = time.monotonic()
+                return index
+            cursor.execute(_LOAD_SQL)
+            _index = _TickerIndex(cursor.fetchall(), version)
+        return _index
+
+
+def invalidate_ticker_index():
+    """ticker_dictionary 변경 후 호출 — 다음 조회에서 다시 적재"""
+    global _index
+    with _lock:
+        _index = None
+
+
+def apply_sector(ticker_symbol: str, sector: str, updated_at: datetime, new_row: dict | None = None):
+    """섹터 캐시 갱신을 살아 있는 인덱스에 반영 (전체 재적재 없음).
+
+    new_row: 행이 없어 새로 INSERT 한 경우 그 행. 다른 프로세스는 버전 비교로 따라잡는다.
+    """
+    with _lock:
+        index = _index
+        if index is None:
+            return
+        for row in index.by_ticker.get(ticker_symbol, []):
+            row["sector"] = sector
+            row["sector_updated_at"] = updated_at
+        if new_row is not None:
+            index.insert(new_row)
+
+
+def find_by_company_name(company_name: str) -> dict | None:
+    """정규화된 기업명으로 우선순위가 가장 높은 행 {id, company_name, ticker_symbol, status}"""
+    row = _get_index().by_name.get(normalize_company_name(company_name))
+    if row is None:
+        return None
+    return {k: row[k] for k in ("id", "company_name", "ticker_symbol", "status")}
+
+
+def find_rows_by_ticker(ticker_symbol: str) -> list[dict]:
+    """티커의 모든 행 (상태 우선순위 순, INACTIVE 포함)"""
+    return _get_index().by_ticker.get(ticker_symbol, [])
+
+
+def ticker_name_map() -> dict[str, str]:
+    """{티커: 기업명} (INACTIVE 제외, 같은 티커는 ACTIVE 우선)"""
+    return _get_index().names
@@ -1,12 +1,13 @@
 """티커별 섹터 해석기 (국장 전용)
 - KR: 키움 ka10100.upName
-- 캐시: ticker_dictionary.sector (TTL 1년)
+- 캐시: ticker_dictionary.sector (TTL 1년, 조회는 ticker_index 메모리 인덱스)
 """
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
 from core.db import get_db
+from core.repository.ticker_index import apply_sector, find_rows_by_ticker
 
 logger = logging.getLogger(__name__)
 
@@ -29,30 +30,30 @@ def _normalize_kr_code(ticker: str) -> str:
 
 
 def _read_cache(ticker: str) -> Optional[str]:
-    """ticker_dictionary에서 섹터 캐시 조회 (TTL 1년)"""
-    with get_db() as (conn, cursor):
-        cursor.execute(
-            """
-            SELECT sector, sector_updated_at
-            FROM ticker_dictionary
-            WHERE ticker_symbol = %s
-              AND sector IS NOT NULL AND sector_updated_at IS NOT NULL
-            ORDER BY FIELD(status, 'ACTIVE', 'PENDING', 'INACTIVE'), sector_updated_at DESC
-            LIMIT 1
-            """,
-            (ticker,),
-        )
-        row = cursor.fetchone()
-    if not row:
+    """ticker_dictionary 인덱스에서 섹터 캐시 조회 (상태 우선, 같은 상태면 최근 갱신분, TTL 1년)"""
+    rows = [
+        r for r in find_rows_by_ticker(ticker)
+        if r["sector"] is not None and r["sector_updated_at"] is not None
+    ]
+    if not rows:
         return None
-    if isinstance(row["sector_updated_at"], datetime):
-        if datetime.now() - row["sector_updated_at"] > _CACHE_TTL:
+    # find_rows_by_ticker 는 상태 우선순위 순 — 최우선 상태 안에서 최근 갱신분을 고른다
+    best = max(
+        (r for r in rows if r["status"] == rows[0]["status"]),
+        key=lambda r: r["sector_updated_at"],
+    )
+    if isinstance(best["sector_updated_at"], datetime):
+        if datetime.now() - best["sector_updated_at"] > _CACHE_TTL:
             return None
-    return row["sector"] or None
+    return best["sector"] or None
 
 
 def _write_cache(ticker: str, sector: str, name: str = "") -> None:
-    """ticker_dictionary 섹터 캐시 갱신. row 없으면 PENDING으로 생성."""
+    """ticker_dictionary 섹터 캐시 갱신. row 없으면 PENDING으로 생성.
+
+    ticker_index 는 비우지 않고 해당 행만 고친다 (호출마다 사전 전체 재적재 방지).
+    """
+    new_row = None
     with get_db() as (conn, cursor):
         cursor.execute(
             """
@@ -72,9 +73,15 @@ def _write_cache(ticker: str, sector: str, name: str = "") -> None:
                     """,
                     (name, ticker, sector),
                 )
+                if cursor.rowcount > 0:
+                    new_row = {
+                        "id": cursor.lastrowid, "company_name": name, "ticker_symbol": ticker,
+                        "status": "PENDING", "sector": sector, "sector_updated_at": datetime.now(),
+                    }
             except Exception as e:
                 logger.warning(f"섹터 캐시 INSERT 실패 [{ticker}]: {e}")
         conn.commit()
+    apply_sector(ticker, sector, datetime.now(), new_row)
 
 
 def _resolve_kr_sector(ticker: str) -> Optional[str]:
@@ -1,17 +1,18 @@
 import re
 import logging
 import warnings
-from ddgs import DDGS
-from pykrx import stock as pykrx_stock
 
 from core.repository import lookup_ticker, save_ticker
 
 warnings.filterwarnings("ignore")
 
+# ddgs·pykrx 는 import 비용이 커서(pandas 등) 온라인 검색이 필요할 때만 불러온다.
+
 
 def _is_valid_kr_code(code: str) -> bool:
     """pykrx로 6자리 코드가 실제 상장 종목인지 검증 (코스피/코스닥 공통)"""
     try:
+        from pykrx import stock as pykrx_stock
         return bool(pykrx_stock.get_market_ticker_name(code))
     except Exception:
         return False
@@ -19,6 +20,8 @@ def _is_valid_kr_code(code: str) -> bool:
 
 def _search_ticker_online(company_name):
     """DuckDuckGo 검색으로 6자리 종목코드 추출 → pykrx 검증 (국장 전용)"""
+    from ddgs import DDGS
+
     with DDGS() as ddgs:
         query = f"{company_name} 코스피 코스닥 종목코드"
 
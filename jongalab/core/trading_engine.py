@@ -8,14 +8,17 @@
   14:30~15:00  수급 정밀 체크 & 매수 후보 확정
 """
 
+import math
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
 from typing import Optional
 
-from core.kiwoom_client import KiwoomRestClient
+from core.kiwoom_client import KiwoomRestClient, PaperOrderClient
 
 logger = logging.getLogger("ClosingBet")
 
@@ -77,14 +80,26 @@ class StrategyConfig:
     # ---- 콘텐츠 분석 가산점 ----
     CONTENT_SCORE_MAX = 10            # 콘텐츠 분석 최대 가산점
 
+    # ---- 주문 실행 (workers/closing_bet_order.py) ----
+    ORDER_TOP_N = 5                   # 매수 대상 상위 종목 수
+    ORDER_BUDGET_RATIO = 0.9          # 주문가능금액 중 사용 비율
+    ORDER_SPLIT_COUNT = 2             # 종목당 분할 매수 횟수
+    ORDER_SPLIT_INTERVAL_SEC = 60     # 분할 주문 간격(초)
+    ORDER_TIME = "15:15"              # 1차 주문 시각 (HH:MM)
+    ORDER_TRADE_TYPE = "3"            # kt10000 trde_tp: 0=지정가, 3=시장가
+    ORDER_MAX_PER_SEC = 5             # 주문 TR 초당 최대 호출 수
+
+    def apply(self, config: dict):
+        """설정 dict 를 인스턴스에 덮어씀 (알 수 없는 키·WATCHLIST_SECTORS 는 무시)"""
+        for key, value in config.items():
+            if hasattr(self, key) and key != "WATCHLIST_SECTORS":
+                setattr(self, key, value)
+
     def load_from_db(self):
         """DB에서 전략 설정값을 로드하여 인스턴스에 덮어씀"""
         try:
             from core.repository.strategy_config import get_strategy_config
-            config = get_strategy_config()
-            for key, value in config.items():
-                if hasattr(self, key) and key != "WATCHLIST_SECTORS":
-                    setattr(self, key, value)
+            self.apply(get_strategy_config())
             logger.info("전략 설정 DB 로드 완료")
         except Exception as e:
             logger.warning(f"전략 설정 DB 로드 실패, 기본값 사용: {e}")
@@ -132,6 +147,8 @@ class StockCandidate:
     hourly_candles: list = field(default_factory=list)  # 1시간봉 캔들 데이터
     content_count: int = 0        # 오늘 관련 콘텐츠 분석 건수
     content_avg_score: float = 0  # 콘텐츠 평균 sentiment_score
+    supply_checked: bool = False  # 수급 TR 조회 여부 (점수 상한 가지치기 시 False)
+    foreign_brokers_buying: bool = False  # 외국계 거래원 매수 우위 (등급 격상 시그널)
 
 
 @dataclass
@@ -563,6 +580,12 @@ class AnalysisEngine:
         result["supply_score"] = score
 
         foreign_signal = result["foreign_brokers_buying"] or result["prog_net_buy"] > 0
+        result["supply_grade"] = self.grade_supply(score, foreign_signal)
+
+        return result
+
+    def grade_supply(self, score: float, foreign_signal: bool) -> SupplyGrade:
+        """5일 수급 점수 → 등급. 외국계 자금 시그널이 있으면 임계값 직전 점수를 한 단계 격상."""
         if foreign_signal:
             thresholds = list(SUPPLY_GRADE_THRESHOLDS.values())
             for high in sorted(thresholds, reverse=True):
@@ -570,10 +593,7 @@ class AnalysisEngine:
                 if low <= score < high:
                     score = high
                     break
-
-        result["supply_grade"] = self.classify_supply_score(score)
-
-        return result
+        return self.classify_supply_score(score)
 
     # ── 섹터 대장주 판별 ──
     def identify_sector_leaders(self, candidates: list[StockCandidate]) -> list[StockCandidate]:
@@ -590,11 +610,24 @@ class AnalysisEngine:
         return candidates
 
     # ── 종합 스코어링 ──
-    def score_candidate(self, c: StockCandidate) -> float:
-        score = 0.0
+    # 수급 TR(ka10059/ka90004/ka10131/ka10002) 이후에만 확정되는 항목의 최대치:
+    # 5일 수급 점수 40점 + 5일 초과 연속 수급 보너스 15점
+    MAX_SUPPLY_COMPONENT = 40 + 15
 
+    def supply_component(self, c: StockCandidate) -> float:
+        """수급 TR 결과에 의존하는 점수 (5일 수급 점수 + 장기 연속 수급 보너스)"""
         # 5일 수급 점수 (40점 만점) — 0~100점 → 0~40점 선형 환산
-        score += c.supply_score * 0.4
+        score = c.supply_score * 0.4
+
+        # 5일 초과 연속 수급 보너스 (15점)
+        # 5일 이내 연속성은 supply_score에 이미 반영되므로, 6~10일+ 장기 연속만 가산
+        extra_days = max(c.supply_days - 5, 0)
+        score += min(extra_days, 5) * 3
+        return score
+
+    def base_component(self, c: StockCandidate) -> float:
+        """수급 TR 없이 확정되는 점수 (정배열·신고가·거래대금·대장주·테마·콘텐츠)"""
+        score = 0.0
 
         # 정배열 + 신고가 (20점)
         if c.ma_aligned:
@@ -616,11 +649,6 @@ class AnalysisEngine:
         if c.is_theme_stock:
             score += self.cfg.THEME_STOCK_BONUS
 
-        # 5일 초과 연속 수급 보너스 (15점)
-        # 5일 이내 연속성은 supply_score에 이미 반영되므로, 6~10일+ 장기 연속만 가산
-        extra_days = max(c.supply_days - 5, 0)
-        score += min(extra_days, 5) * 3
-
         # 콘텐츠 분석 (10점): 언급 횟수 + 평균 감성 점수
         if c.content_count > 0:
             mention_bonus = min(c.content_count, 3) * 2  # max 6
@@ -631,5 +659,293 @@ class AnalysisEngine:
             )
             score += min(mention_bonus + sentiment_bonus, self.cfg.CONTENT_SCORE_MAX)
 
+        return score
+
+    def score_upper_bound(self, c: StockCandidate) -> float:
+        """수급 조회 전 도달 가능한 최대 점수 (score_candidate 의 상한).
+        이 값이 Top N 컷오프에 못 미치면 수급 TR 을 호출할 필요가 없다."""
+        return self.base_component(c) + self.MAX_SUPPLY_COMPONENT
+
+    def score_candidate(self, c: StockCandidate) -> float:
+        score = self.supply_component(c) + self.base_component(c)
         c.score = score
-        return score
\ No newline at end of file
+        return score
+
+    def rescore(self, c: StockCandidate) -> StockCandidate:
+        """이미 수집된 후보 피처를 이 엔진의 설정으로 재채점한 사본 반환 (키움 호출 없음).
+        수급을 조회한 종목은 5일 수급 점수·등급도 이 설정의 가중치로 다시 계산한다."""
+        v = replace(c)
+        if c.supply_checked:
+            v.supply_score = self.calculate_supply_score(c.supply_history)
+            v.supply_grade = self.grade_supply(
+                v.supply_score, c.foreign_brokers_buying or c.prog_net_buy > 0
+            )
+        self.score_candidate(v)
+        return v
+
+
+# ============================================================
+# 저장 피처 재채점 (what-if)
+# ============================================================
+
+def rescore_features(features: list[dict], config: dict) -> list[StockCandidate]:
+    """저장된 후보 피처(daily_candidate_feature 행)를 주어진 설정으로 재채점해 점수순 반환.
+
+    키움을 호출하지 않는 순수 계산이다. 대장주·테마주 여부와 후보 집합 자체는
+    수집 당시 값을 그대로 쓰고, 점수와 5일 수급 점수·등급만 새 설정으로 다시 계산한다.
+    """
+    cfg = StrategyConfig()
+    cfg.apply(config)
+    engine = AnalysisEngine(None, cfg)
+
+    names = {f.name for f in fields(StockCandidate)}
+    candidates = []
+    for row in features:
+        c = StockCandidate(
+            code=row["stock_code"],
+            name=row["stock_name"],
+            sector=row.get("sector") or "기타",
+            **{k: v for k, v in row.items() if k in names and k not in ("code", "name", "sector")},
+        )
+        candidates.append(engine.rescore(c))
+
+    candidates.sort(key=lambda x: x.score, reverse=True)
+    return candidates
+
+
+# ============================================================
+# 주문 실행기
+# ============================================================
+
+@dataclass
+class OrderTicket:
+    """사전 계산된 매수 주문 (분할 수량 포함)"""
+    code: str
+    name: str
+    sector: str
+    ref_price: int                     # 수량 산정 기준가 (리포트 현재가)
+    quantity: int
+    splits: list[int] = field(default_factory=list)  # 분할별 수량
+    trade_type: str = "3"
+    order_nos: list[str] = field(default_factory=list)
+    accepted_qty: int = 0              # 접수된 분할 수량 합 (거부·실패분 제외) — 체결 추적 목표
+    rounds_sent: int = 0               # 발사를 마친 분할 수 (접수 여부 무관)
+
+
+class RateLimiter:
+    """초당 호출 수 제한 (스레드 안전). acquire() 는 슬롯이 날 때까지 대기한다."""
+
+    def __init__(self, max_per_sec: float):
+        self.interval = 1.0 / max_per_sec if max_per_sec > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _parse_amount(val) -> int:
+    """키움 계좌 응답 숫자 문자열("000000001234", "-00012") → int"""
+    try:
+        return int(str(val or "0").replace(",", "").strip() or 0)
+    except ValueError:
+        return 0
+
+
+def _fill_avg_price(holding: dict, base: dict, filled: int) -> float:
+    """kt00018 매입단가는 기존 보유분과 섞인 평균이므로, 기준 잔고 매입금액을 빼서 이번 체결분 평균을 구한다"""
+    if filled <= 0:
+        return 0.0
+    cost = holding["qty"] * holding["avg_price"] - base["qty"] * base["avg_price"]
+    return round(cost / filled, 2)
+
+
+BASELINE_RETRIES = 3
+BASELINE_RETRY_SEC = 1.0
+
+
+class OrderExecutor:
+    """저장된 랭킹으로 주문 티켓을 미리 계산해 두고, 예약 시각에 동시 발사한다.
+
+    api 는 place_buy_order / get_deposit / get_evaluation_balance 를 가진 객체면 된다
+    (KiwoomRestClient, 로컬 모의 체결용 PaperOrderClient 등).
+    """
+
+    def __init__(self, api: KiwoomRestClient, config: StrategyConfig):
+        self.api = api
+        self.cfg = config
+        self.limiter = RateLimiter(config.ORDER_MAX_PER_SEC)
+        self.positions: dict[str, Position] = {}
+        self._baseline: dict[str, dict] = {}  # 발사 전 보유 {code: {qty, avg_price}}
+        self._lock = threading.Lock()
+        self._tracker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ── 잔고 ──
+    def _holdings(self) -> dict[str, dict]:
+        """kt00018 보유 종목 {6자리 코드: {qty, avg_price}}"""
+        data = self.api.get_evaluation_balance()
+        out = {}
+        for item in data.get("acnt_evlt_remn_indv_tot", []):
+            code = (item.get("stk_cd") or "").lstrip("A").split("_")[0]
+            if code:
+                out[code] = {
+                    "qty": _parse_amount(item.get("rmnd_qty")),
+                    "avg_price": _parse_amount(item.get("pur_pric")),
+                }
+        return out
+
+    def _load_baseline(self) -> dict[str, dict]:
+        """체결 추적 시 기존 보유분을 빼기 위한 기준 잔고.
+
+        실계좌에서 조회에 끝내 실패하면 RuntimeError — 보유 0 으로 가정하면 기존 보유 종목이
+        즉시 체결된 것으로 잡힌다. 모의 체결(PaperOrderClient)만 빈 잔고로 진행한다.
+        """
+        last_error = None
+        for attempt in range(BASELINE_RETRIES):
+            try:
+                return self._holdings()
+            except Exception as e:
+                last_error = e
+                logger.warning(f"기준 잔고 조회 실패 ({attempt + 1}/{BASELINE_RETRIES}): {e}")
+                if attempt + 1 < BASELINE_RETRIES:
+                    time.sleep(BASELINE_RETRY_SEC)
+        if isinstance(self.api, PaperOrderClient):
+            logger.warning("모의 체결 — 기준 잔고 없이 진행 (보유 0 가정)")
+            return {}
+        raise RuntimeError(f"기준 잔고 조회 실패 — 주문 중단: {last_error}")
+
+    # ── 1) 티켓 사전 계산 ──
+    def build_tickets(self, reports: list[dict]) -> list[OrderTicket]:
+        """랭킹 상위 ORDER_TOP_N 종목에 주문가능금액 × ORDER_BUDGET_RATIO 를 균등 배분"""
+        picks = [r for r in reports if abs(int(r.get("current_price") or 0)) > 0]
+        picks = picks[:self.cfg.ORDER_TOP_N]
+        if not picks:
+            return []
+
+        deposit = self.api.get_deposit()
+        cash = _parse_amount(deposit.get("ord_alow_amt") or deposit.get("d2_entra"))
+        per_stock = cash * self.cfg.ORDER_BUDGET_RATIO / len(picks)
+        logger.info(f"주문가능금액 {cash:,}원 → 종목당 {per_stock:,.0f}원 ({len(picks)}종목)")
+
+        self._baseline = self._load_baseline()
+
+        split_count = max(int(self.cfg.ORDER_SPLIT_COUNT), 1)
+        tickets = []
+        for r in picks:
+            price = abs(int(r["current_price"]))
+            qty = math.floor(per_stock / price)
+            if qty <= 0:
+                logger.warning(f"[{r['stock_name']}] 배정 금액 부족 — 주문 제외")
+                continue
+            base, rem = divmod(qty, split_count)
+            splits = [base + (1 if i < rem else 0) for i in range(split_count)]
+            tickets.append(OrderTicket(
+                code=r["stock_code"], name=r["stock_name"], sector=r.get("sector") or "기타",
+                ref_price=price, quantity=qty,
+                splits=[q for q in splits if q > 0],
+                trade_type=self.cfg.ORDER_TRADE_TYPE,
+            ))
+        return tickets
+
+    # ── 2) 예약 발사 ──
+    @staticmethod
+    def _sleep_until(target: datetime):
+        """target 까지 대기 — 마지막 1초는 짧은 간격으로 깨어나 지연을 줄인다."""
+        while True:
+            remain = (target - datetime.now()).total_seconds()
+            if remain <= 0:
+                return
+            time.sleep(remain - 1 if remain > 1.5 else min(remain, 0.005))
+
+    def _send(self, ticket: OrderTicket, split_idx: int) -> bool:
+        qty = ticket.splits[split_idx]
+        self.limiter.acquire()
+        try:
+            resp = self.api.place_buy_order(
+                ticket.code, qty, ticket.ref_price, trde_tp=ticket.trade_type,
+            )
+        except Exception as e:
+            logger.error(f"[{ticket.name}] {split_idx + 1}차 주문 실패: {e}")
+            return False
+        if resp.get("return_code", 0) != 0:
+            logger.error(f"[{ticket.name}] {split_idx + 1}차 주문 거부: {resp.get('return_msg')}")
+            return False
+
+        with self._lock:
+            ticket.order_nos.append(resp.get("ord_no", ""))
+            ticket.accepted_qty += qty
+            pos = self.positions.setdefault(ticket.code, Position(
+                code=ticket.code, name=ticket.name, sector=ticket.sector,
+                avg_price=0.0, quantity=0,
+                bought_at=datetime.now().isoformat(timespec="milliseconds"),
+            ))
+            pos.splits_done += 1
+        logger.info(f"[{ticket.name}] {split_idx + 1}차 주문 접수 {qty}주 (주문번호 {resp.get('ord_no', '-')})")
+        return True
+
+    def execute(self, tickets: list[OrderTicket], at: datetime):
+        """at 시각에 1차 분할을 전 종목 동시 발사, 이후 ORDER_SPLIT_INTERVAL_SEC 간격으로 다음 분할."""
+        if not tickets:
+            return
+        rounds = max(len(t.splits) for t in tickets)
+        with ThreadPoolExecutor(max_workers=len(tickets)) as pool:
+            for k in range(rounds):
+                fire_at = at.timestamp() + k * self.cfg.ORDER_SPLIT_INTERVAL_SEC
+                self._sleep_until(datetime.fromtimestamp(fire_at))
+                batch = [t for t in tickets if k < len(t.splits)]
+                logger.info(f"{k + 1}차 분할 주문 발사 ({len(batch)}종목)")
+                list(pool.map(lambda t: self._send(t, k), batch))
+                with self._lock:
+                    for t in batch:
+                        t.rounds_sent += 1
+                if k == 0:
+                    self.start_fill_tracking(tickets)
+
+    # ── 3) 체결 추적 (백그라운드) ──
+    def _poll_fills(self, tickets: list[OrderTicket], interval: float):
+        """목표는 실제 접수된 수량(accepted_qty). 분할이 모두 발사되고 접수분이 다 체결되면 종료."""
+        while not self._stop.is_set():
+            try:
+                holdings = self._holdings()
+            except Exception as e:
+                logger.warning(f"잔고 조회 실패 (체결 추적 재시도): {e}")
+                holdings = None
+            if holdings is not None:
+                done = True
+                with self._lock:
+                    for t in tickets:
+                        h = holdings.get(t.code, {"qty": 0, "avg_price": 0})
+                        base = self._baseline.get(t.code, {"qty": 0, "avg_price": 0})
+                        filled = max(h["qty"] - base["qty"], 0)
+                        pos = self.positions.get(t.code)
+                        if pos:
+                            pos.quantity = filled
+                            pos.avg_price = _fill_avg_price(h, base, filled)
+                        if t.rounds_sent < len(t.splits) or filled < t.accepted_qty:
+                            done = False
+                if done:
+                    logger.info("전 종목 체결 완료")
+                    return
+            self._stop.wait(interval)
+
+    def start_fill_tracking(self, tickets: list[OrderTicket], interval: float = 2.0):
+        if self._tracker and self._tracker.is_alive():
+            return
+        self._stop.clear()
+        self._tracker = threading.Thread(
+            target=self._poll_fills, args=(tickets, interval), daemon=True,
+        )
+        self._tracker.start()
+
+    def wait_fills(self, timeout: float) -> dict[str, Position]:
+        """체결 추적 종료(전량 체결) 또는 timeout 까지 대기 후 포지션 반환"""
+        if self._tracker:
+            self._tracker.join(timeout)
+            self._stop.set()
+        return self.positions
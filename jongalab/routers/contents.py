@@ -3,7 +3,12 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from core.repository import get_contents_paginated, get_contents_by_ticker, get_mention_stats
+from core.repository import (
+    get_contents_paginated_async,
+    get_contents_by_ticker_async,
+    get_mention_stats_async,
+    search_contents_async,
+)
 
 router = APIRouter(prefix="/api", tags=["contents"])
 
@@ -21,34 +26,56 @@ class ContentAnalysis(BaseModel):
 
 
 @router.get("/contents")
-def get_contents(
+async def get_contents(
     page: int = Query(1, description="현재 페이지 번호"),
     limit: int = Query(12, description="페이지 당 항목 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
 ):
     try:
-        result = get_contents_paginated(page, limit)
+        result = await get_contents_paginated_async(page, limit, cursor)
         return {"success": True, **result}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 @router.get("/contents/mention-stats")
-def get_contents_mention_stats(
+async def get_contents_mention_stats(
     hours: int = Query(24, ge=1, le=168, description="집계 윈도우 (시간)"),
 ):
     """최근 N시간 콘텐츠 분석에서 언급된 섹터/기업 통계 (트리맵용).
     sector=None인 ticker는 통계에서 제외.
     """
     try:
-        return {"success": True, "data": get_mention_stats(hours=hours)}
+        return {"success": True, "data": await get_mention_stats_async(hours=hours)}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@router.get("/contents/search")
+async def search_contents(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백 구분 단어 모두 포함)"),
+    start_date: Optional[str] = Query(None, description="시작일 YYYY-MM-DD"),
+    end_date: Optional[str] = Query(None, description="종료일 YYYY-MM-DD (포함)"),
+    platform: Optional[str] = Query(None, description="youtube / telegram / news"),
+    ticker: Optional[str] = Query(None, description="관련 종목 코드"),
+    page: int = Query(1, ge=1, description="현재 페이지 번호"),
+    limit: int = Query(20, ge=1, le=50, description="페이지 당 항목 수"),
+):
+    """제목·분석 본문 전문 검색 (관련도순)"""
+    try:
+        result = await search_contents_async(
+            q, start_date=start_date, end_date=end_date,
+            platform=platform, ticker=ticker, page=page, limit=limit,
+        )
+        return {"success": True, **result}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 @router.get("/contents/{ticker}", response_model=List[ContentAnalysis])
-def get_ticker_contents(ticker: str):
+async def get_ticker_contents(ticker: str):
     """특정 티커(종목)와 관련된 콘텐츠 조회"""
     try:
-        return get_contents_by_ticker(ticker)
+        return await get_contents_by_ticker_async(ticker)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
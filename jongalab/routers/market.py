@@ -1,12 +1,13 @@
 """시장 데이터 라우트 (주가, 지수, 주도주)"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from core.repository import get_youtube_sources
 from core.market_data import (
     fetch_stock_price,
+    fetch_stock_prices,
     fetch_stock_history,
     fetch_stock_name,
-    fetch_market_indices,
+    get_market_indices_cached,
 )
 
 router = APIRouter(prefix="/api", tags=["market"])
@@ -21,6 +22,25 @@ def get_stock_price(ticker: str, date: str | None = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# 한 번에 받는 종목 수 상한
+MAX_BATCH_TICKERS = 200
+
+
+@router.get("/stock-prices")
+def get_stock_prices(
+    tickers: str = Query(..., description="콤마 구분 티커 목록"),
+    date: str | None = None,
+):
+    """여러 종목 주가 일괄 조회 — {ticker: 가격 또는 {error}} (일부 실패 허용)"""
+    ticker_list = [t.strip() for t in tickers.split(",") if t.strip()]
+    if len(ticker_list) > MAX_BATCH_TICKERS:
+        raise HTTPException(status_code=400, detail=f"티커는 최대 {MAX_BATCH_TICKERS}개까지 조회할 수 있습니다.")
+    try:
+        return fetch_stock_prices(ticker_list, date)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/stock-name/{ticker}")
 def get_stock_name(ticker: str):
     """티커로 종목명을 조회"""
@@ -38,8 +58,8 @@ def get_stock_history(ticker: str):
 
 @router.get("/market-indices")
 def get_market_indices():
-    """주요 시장 지수 일괄 조회"""
-    return fetch_market_indices()
+    """주요 시장 지수 일괄 조회 (백그라운드 갱신 캐시에서 즉시 반환, as_of/age_seconds 포함)"""
+    return get_market_indices_cached()
 
 
 @router.get("/channels")
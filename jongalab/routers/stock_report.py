@@ -1,17 +1,18 @@
 """종목일간리포트 라우트"""
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
 
 from core.repository import (
-    get_stock_report,
-    get_stock_report_history,
-    get_stock_reports_by_date,
-    get_stock_report_dates,
-    get_sector_reports_by_date,
-    get_content_by_stock_and_date,
+    get_stock_report_async,
+    get_stock_report_history_async,
+    get_stock_reports_payload_async,
+    get_stock_report_dates_async,
+    get_sector_reports_by_date_async,
+    get_content_by_stock_and_date_async,
     get_gap_stats_by_dates,
-    get_top_themes_by_dates,
+    get_top_themes_by_dates_async,
 )
 
 router = APIRouter(prefix="/api", tags=["stock-report"])
@@ -78,6 +79,14 @@ class ContentAnalysisItem(BaseModel):
     created_at: Optional[str] = None
 
 
+_stock_reports_adapter = TypeAdapter(List[StockReport])
+
+
+def _encode_stock_reports(rows: list[dict]) -> bytes:
+    """response_model=List[StockReport] 와 같은 검증·직렬화 결과를 JSON 바이트로"""
+    return _stock_reports_adapter.dump_json(_stock_reports_adapter.validate_python(rows))
+
+
 class StockReportDetail(BaseModel):
     report: StockReport
     content_analyses: List[ContentAnalysisItem] = []
@@ -107,7 +116,7 @@ class SectorReport(BaseModel):
 
 
 @router.get("/sector-report/top-themes", response_model=dict[str, List[str]])
-def top_themes(
+async def top_themes(
     dates: str = Query(..., description="콤마 구분 YYYY-MM-DD 목록"),
     limit: int = Query(3, description="날짜별 최대 테마 수"),
 ):
@@ -116,16 +125,16 @@ def top_themes(
         date_list = [d.strip() for d in dates.split(",") if d.strip()]
         if not date_list:
             return {}
-        return get_top_themes_by_dates(date_list, limit=limit)
+        return await get_top_themes_by_dates_async(date_list, limit=limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/sector-report/{report_date}", response_model=List[SectorReport])
-def list_sector_reports(report_date: str):
+async def list_sector_reports(report_date: str):
     """특정 날짜의 주도 섹터 목록 (순위순, 구성종목 포함)"""
     try:
-        results = get_sector_reports_by_date(report_date)
+        results = await get_sector_reports_by_date_async(report_date)
         if not results:
             raise HTTPException(status_code=404, detail="해당 날짜의 섹터 리포트가 없습니다")
         return results
@@ -140,6 +149,11 @@ class GapStat(BaseModel):
     losses: int = 0
     flats: int = 0
     total: int = 0
+    # gap_check --track 시계열 경로 지표 (추적하지 않은 날짜는 None)
+    tracked: Optional[int] = None
+    avg_runup_pct: Optional[float] = None
+    avg_drawdown_pct: Optional[float] = None
+    avg_time_to_peak_min: Optional[float] = None
 
 
 @router.get("/stock-report/gap-stats", response_model=dict[str, GapStat])
@@ -155,32 +169,36 @@ def gap_stats(dates: str = Query(..., description="콤마 구분 YYYY-MM-DD 목
 
 
 @router.get("/stock-report/dates", response_model=List[str])
-def list_report_dates(limit: int = Query(30, description="최대 조회 일수")):
+async def list_report_dates(limit: int = Query(30, description="최대 조회 일수")):
     """리포트가 존재하는 날짜 목록"""
     try:
-        return get_stock_report_dates(limit)
+        return await get_stock_report_dates_async(limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/stock-report/history/{stock_code}", response_model=List[StockReport])
-def list_reports_by_stock(stock_code: str, limit: int = Query(5, description="최대 조회 일수")):
+async def list_reports_by_stock(stock_code: str, limit: int = Query(5, description="최대 조회 일수")):
     """특정 종목의 최근 N일 리포트 목록 (최신순)"""
     try:
-        results = get_stock_report_history(stock_code, days=limit)
+        results = await get_stock_report_history_async(stock_code, days=limit)
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/stock-report/{report_date}", response_model=List[StockReport])
-def list_reports_by_date(report_date: str):
-    """특정 날짜의 전체 종목 리포트 목록 (점수순)"""
+async def list_reports_by_date(report_date: str):
+    """특정 날짜의 전체 종목 리포트 목록 (점수순).
+
+    직렬화된 응답 본문을 캐시해 바이트 그대로 내보낸다 (모델 검증·직렬화 생략).
+    본문은 response_model 과 같은 모델로 검증·직렬화해 만들므로 형태가 동일하다.
+    """
     try:
-        results = get_stock_reports_by_date(report_date)
-        if not results:
+        body = await get_stock_reports_payload_async(report_date, _encode_stock_reports)
+        if body is None:
             raise HTTPException(status_code=404, detail="해당 날짜의 리포트가 없습니다")
-        return results
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -188,14 +206,14 @@ def list_reports_by_date(report_date: str):
 
 
 @router.get("/stock-report/{report_date}/{stock_code}", response_model=StockReportDetail)
-def get_report_detail(report_date: str, stock_code: str):
+async def get_report_detail(report_date: str, stock_code: str):
     """특정 날짜 + 종목의 상세 리포트 (최근 5일 수급 동향 포함)"""
     try:
-        report = get_stock_report(report_date, stock_code)
+        report = await get_stock_report_async(report_date, stock_code)
         if not report:
             raise HTTPException(status_code=404, detail="해당 리포트가 없습니다")
 
-        content_analyses = get_content_by_stock_and_date(
+        content_analyses = await get_content_by_stock_and_date_async(
             stock_code, report_date
         )
 
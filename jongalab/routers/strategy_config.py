@@ -1,9 +1,14 @@
 """전략 설정 라우트"""
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
-from core.repository import get_strategy_config, update_strategy_config
+from core.repository import (
+    get_strategy_config,
+    update_strategy_config,
+    get_candidate_features,
+)
+from core.trading_engine import rescore_features
 
 router = APIRouter(prefix="/api", tags=["strategy-config"])
 
@@ -50,6 +55,14 @@ class StrategyConfigResponse(BaseModel):
     THEME_STOCK_BONUS: int = 15
     # 콘텐츠 분석
     CONTENT_SCORE_MAX: int = 10
+    # 주문 실행
+    ORDER_TOP_N: int = 5
+    ORDER_BUDGET_RATIO: float = 0.9
+    ORDER_SPLIT_COUNT: int = 2
+    ORDER_SPLIT_INTERVAL_SEC: int = 60
+    ORDER_TIME: str = "15:15"
+    ORDER_TRADE_TYPE: str = "3"
+    ORDER_MAX_PER_SEC: int = 5
     # 제외 키워드
     EXCLUDE_KEYWORDS: List[str] = []
 
@@ -70,3 +83,70 @@ def put_config(body: StrategyConfigResponse):
         return update_strategy_config(body.model_dump())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+class WhatIfRequest(BaseModel):
+    report_date: str
+    # 지정한 항목만 현재 저장된 설정에 덮어써서 재채점 (미지정 항목은 현재 설정 유지)
+    config: StrategyConfigResponse
+
+
+class WhatIfItem(BaseModel):
+    stock_code: str
+    stock_name: str
+    sector: Optional[str] = None
+    rank_no: int
+    score: float = 0.0
+    supply_score: float = 0.0
+    supply_grade: str = "D"
+    saved_rank: int
+    saved_score: float = 0.0
+    rank_delta: int = 0  # 양수 = 순위 상승
+    supply_checked: bool = True
+
+
+class WhatIfResponse(BaseModel):
+    report_date: str
+    total_candidates: int
+    ranking: List[WhatIfItem] = []
+
+
+@router.post("/strategy-config/what-if", response_model=WhatIfResponse)
+def what_if(body: WhatIfRequest):
+    """제안 설정으로 과거 거래일의 저장된 후보 피처를 재채점 (키움 호출 없음, 저장하지 않음).
+    saved_rank 는 해당일 실제 점수순 순위, rank_delta 는 saved_rank - 새 순위.
+    """
+    try:
+        features = get_candidate_features(body.report_date)
+        if not features:
+            raise HTTPException(status_code=404, detail="해당 날짜의 후보 피처가 없습니다")
+
+        saved = {f["stock_code"]: (i, f["score"]) for i, f in enumerate(features, 1)}
+        config = {**get_strategy_config(), **body.config.model_dump(exclude_unset=True)}
+
+        ranking = []
+        for rank, c in enumerate(rescore_features(features, config), 1):
+            saved_rank, saved_score = saved[c.code]
+            ranking.append({
+                "stock_code": c.code,
+                "stock_name": c.name,
+                "sector": c.sector,
+                "rank_no": rank,
+                "score": c.score,
+                "supply_score": c.supply_score,
+                "supply_grade": c.supply_grade.name,
+                "saved_rank": saved_rank,
+                "saved_score": saved_score,
+                "rank_delta": saved_rank - rank,
+                "supply_checked": c.supply_checked,
+            })
+
+        return {
+            "report_date": body.report_date,
+            "total_candidates": len(ranking),
+            "ranking": ranking,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -6,6 +6,7 @@ import mysql.connector
 
 from core.repository import get_ticker_dictionary, update_ticker, delete_ticker
 from core.sector_resolver import fetch_sector_from_api
+from core.market_data import invalidate_stock_name_index
 
 router = APIRouter(prefix="/api/ticker-dictionary", tags=["ticker-dictionary"])
 
@@ -58,6 +59,7 @@ def update_ticker_dict(ticker_id: int, body: TickerDictionaryUpdate):
         raise HTTPException(status_code=400, detail=str(e))
     if not success:
         raise HTTPException(status_code=404, detail="해당 항목을 찾을 수 없습니다.")
+    invalidate_stock_name_index()
     return {"success": True}
 
 
@@ -67,4 +69,5 @@ def delete_ticker_dict(ticker_id: int):
     success = delete_ticker(ticker_id)
     if not success:
         raise HTTPException(status_code=404, detail="해당 항목을 찾을 수 없습니다.")
+    invalidate_stock_name_index()
     return {"success": True}
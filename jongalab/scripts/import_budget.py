@@ -0,0 +1,85 @@
+"""엔트리포인트 import 시간 예산 점검
+
+api.py 와 cron 워커는 기동 시 import 만으로 시간을 쓰면 안 된다. 무거운 의존성
+(yfinance·pykrx·pandas·ddgs·exchange_calendars·openai·ollama)은 최초 사용 시점에
+불러오도록 되어 있으므로, 각 엔트리포인트를 새 인터프리터에서 import 해
+
+  1) 소요 시간(여러 번 측정한 중앙값)이 예산 이내인지
+  2) 무거운 모듈이 import 시점에 딸려 들어오지 않았는지
+
+를 확인하고, 하나라도 어기면 종료 코드 1 로 끝난다.
+
+사용법 (jongalab 디렉터리에서):
+    python scripts/import_budget.py            # 전체 점검
+    python scripts/import_budget.py --runs 5   # 측정 횟수 변경
+"""
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 엔트리포인트별 import 예산(ms)
+BUDGET_MS = {
+    "api": 800,
+    "workers.gap_check": 500,
+    "workers.closing_bet": 500,
+    "workers.closing_bet_order": 500,
+    "workers.daily_digest": 500,
+    "workers.content_archive": 500,
+    "workers.youtube_collector": 800,
+    "workers.telegram_listener": 1200,
+}
+
+# import 시점에 로드되면 안 되는 모듈 (최초 사용 시 lazy import)
+HEAVY_MODULES = (
+    "pandas", "numpy", "yfinance", "pykrx", "ddgs",
+    "exchange_calendars", "openai", "ollama",
+)
+
+_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - t) * 1000
+print(json.dumps({{"ms": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, runs: int) -> tuple[float, list[str]]:
+    """새 인터프리터에서 module 을 runs 번 import → (중앙값 ms, 딸려 온 무거운 모듈)"""
+    samples, heavy = [], []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True, timeout=120,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import 실패")
+        out = json.loads(proc.stdout.strip().splitlines()[-1])
+        samples.append(out["ms"])
+        heavy = out["heavy"]
+    return statistics.median(samples), heavy
+
+
+def main() -> int:
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 3
+    failed = False
+    for module, budget in BUDGET_MS.items():
+        try:
+            ms, heavy = measure(module, runs)
+        except Exception as e:
+            print(f"✗ {module:<28} import 실패: {e}")
+            failed = True
+            continue
+        ok = ms <= budget and not heavy
+        failed |= not ok
+        note = f"  무거운 모듈: {', '.join(heavy)}" if heavy else ""
+        print(f"{'✓' if ok else '✗'} {module:<28} {ms:7.0f}ms / {budget}ms{note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
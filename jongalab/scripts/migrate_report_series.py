@@ -0,0 +1,104 @@
+"""daily_stock_report 의 기존 JSON 시계열을 compact 바이너리로 변환 (sql/12 이후 1회)
+
+supply_history / hourly_candles JSON 을 series_codec 으로 인코딩해 *_bin 컬럼에 넣고
+JSON 컬럼은 비운다. 손실 없이 담을 수 없는 값은 JSON 그대로 둔다.
+이미 변환된 행은 건너뛰므로 여러 번 실행해도 된다.
+
+사용법 (jongalab 디렉터리에서):
+    python scripts/migrate_report_series.py               # 전체 변환
+    python scripts/migrate_report_series.py --dry-run     # 변환 가능 건수·용량만 출력
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from core.db import get_db  # noqa: E402
+from core.repository import report_cache, series_codec  # noqa: E402
+
+BATCH_SIZE = 500
+
+_SERIES = (
+    ("supply_history", series_codec.KIND_SUPPLY_HISTORY),
+    ("hourly_candles", series_codec.KIND_HOURLY_CANDLES),
+)
+
+
+def migrate(dry_run: bool = False) -> dict:
+    stats = {"rows": 0, "converted": 0, "kept_json": 0, "json_bytes": 0, "bin_bytes": 0}
+    last_id = 0
+    while True:
+        with get_db() as (conn, cursor):
+            cursor.execute(
+                """SELECT id, supply_history, hourly_candles
+                     FROM daily_stock_report
+                    WHERE id > %s
+                      AND (supply_history IS NOT NULL OR hourly_candles IS NOT NULL)
+                    ORDER BY id
+                    LIMIT %s""",
+                (last_id, BATCH_SIZE),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+
+            updates = []
+            for row in rows:
+                stats["rows"] += 1
+                values = {}
+                for col, kind in _SERIES:
+                    raw = row[col]
+                    if raw is None:
+                        continue
+                    text = raw.decode() if isinstance(raw, (bytes, bytearray)) else raw
+                    blob = series_codec.encode(kind, json.loads(text))
+                    if blob is None:
+                        stats["kept_json"] += 1
+                        continue
+                    stats["converted"] += 1
+                    stats["json_bytes"] += len(text.encode())
+                    stats["bin_bytes"] += len(blob)
+                    values[col] = blob
+                if values:
+                    sh, hc = values.get("supply_history"), values.get("hourly_candles")
+                    updates.append((sh, sh, hc, hc, row["id"]))
+
+            if updates and not dry_run:
+                # 변환된 컬럼만 *_bin 으로 옮기고 JSON 을 비운다 (None 이면 기존 값 유지)
+                cursor.executemany(
+                    """UPDATE daily_stock_report
+                          SET supply_history_bin = COALESCE(%s, supply_history_bin),
+                              supply_history = IF(%s IS NULL, supply_history, NULL),
+                              hourly_candles_bin = COALESCE(%s, hourly_candles_bin),
+                              hourly_candles = IF(%s IS NULL, hourly_candles, NULL)
+                        WHERE id = %s""",
+                    updates,
+                )
+                conn.commit()
+
+    if not dry_run:
+        report_cache.clear()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="DB 를 바꾸지 않고 건수·용량만 출력")
+    args = parser.parse_args()
+
+    stats = migrate(dry_run=args.dry_run)
+    print(
+        f"대상 행 {stats['rows']} / 변환 컬럼 {stats['converted']} / JSON 유지 {stats['kept_json']}"
+        f" — {stats['json_bytes']:,}B → {stats['bin_bytes']:,}B"
+    )
+
+
+if __name__ == "__main__":
+    main()
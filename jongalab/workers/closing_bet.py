@@ -6,11 +6,14 @@
   14:30~15:00  수급 정밀 체크 & 매수 후보 확정
 """
 
+import copy
+import heapq
 import time
 import logging
 from datetime import datetime
 
 from core.kiwoom_client import KiwoomRestClient
+from core.query_metrics import query_scope
 from core.trading_engine import (
     StrategyConfig,
     SupplyGrade,
@@ -19,19 +22,43 @@ from core.trading_engine import (
 )
 from core.repository.stock_report import save_stock_reports
 from core.repository.sector_report import save_sector_reports
+from core.repository.candidate_feature import save_candidate_features
 from core.repository.content import get_today_content_by_stock
+from core.repository.strategy_variant import (
+    get_active_strategy_variants,
+    save_variant_reports,
+)
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger("ClosingBet")
 
+REPORT_TOP_N = 10  # 점수순 상위 N종목만 리포트 저장(= 수급 가지치기 컷오프 기준)
+
 
 class ClosingBetStrategy:
-    def __init__(self):
+    def __init__(self, variants: dict[str, dict] | None = None):
+        """variants: {라벨: 기본 설정 대비 덮어쓸 항목} — 섀도 변형 전략.
+        None 이면 DB(strategy_variant)의 활성 변형을 로드한다.
+        시세·수급은 기본 설정 기준으로 한 번만 수집하고, 변형은 같은 피처를 재채점만 한다."""
         self.strategy_cfg = StrategyConfig()
         self.strategy_cfg.load_from_db()
         self.api = KiwoomRestClient()
         self.engine = AnalysisEngine(self.api, self.strategy_cfg)
 
+        if variants is None:
+            try:
+                variants = get_active_strategy_variants()
+            except Exception as e:
+                logger.warning(f"변형 전략 로드 실패, 기본 전략만 실행: {e}")
+                variants = {}
+        self.variant_engines: dict[str, AnalysisEngine] = {}
+        for label, overrides in variants.items():
+            cfg = copy.deepcopy(self.strategy_cfg)
+            cfg.apply(overrides)
+            self.variant_engines[label] = AnalysisEngine(self.api, cfg)
+        if self.variant_engines:
+            logger.info(f"섀도 변형 전략 {len(self.variant_engines)}개: {', '.join(self.variant_engines)}")
+
     def run(self):
         logger.info("=" * 60)
         logger.info("종가베팅 알고리즘 v2.0 (키움 REST API)")
@@ -128,7 +155,8 @@ class ClosingBetStrategy:
     # ── Phase 2: 수급 분석 ──
     def _phase2_supply_analysis(self, candidates: list[StockCandidate]) -> list[StockCandidate]:
         filtered = []
-        
+
+        # (a) 일봉 정배열 체크 (ka10081) — 통과 종목만 이후 단계 진행
         for c in candidates:
             is_aligned, near_high = self.engine.check_ma_alignment(c.code)
             if not is_aligned and not near_high:
@@ -136,23 +164,7 @@ class ClosingBetStrategy:
                 continue
             c.ma_aligned = is_aligned
             c.near_high = near_high
-
-            supply = self.engine.analyze_supply_demand(c.code, c.current_price)
-            c.inst_net_buy = supply["inst_net_buy"]
-            c.frgn_net_buy = supply["frgn_net_buy"]
-            c.indv_net_buy = supply["indv_net_buy"]
-            c.prog_net_buy = supply["prog_net_buy"]
-            c.supply_grade = supply["supply_grade"]
-            c.supply_score = supply.get("supply_score", 0.0)
-            c.supply_days = supply["supply_days"]
-            c.supply_history = supply.get("supply_history", [])
-
-            # 1시간봉 캔들 데이터 조회
-            c.hourly_candles = self.engine.fetch_hourly_candles(c.code)
-            logger.debug(f"[{c.name}] 1시간봉 {len(c.hourly_candles)}개 수집")
-
             filtered.append(c)
-            time.sleep(0.5)
 
         filtered = self.engine.identify_sector_leaders(filtered)
 
@@ -179,15 +191,24 @@ class ClosingBetStrategy:
             except Exception as e:
                 logger.warning(f"콘텐츠 분석 조회 실패 [{c.name}]: {e}")
 
+        # (b) 수급 정밀 분석 — 점수 상한으로 Top N 진입이 불가능한 종목은 수급 TR 생략
+        self._fetch_supply_with_pruning(filtered)
+
         for c in filtered:
             self.engine.score_candidate(c)
 
         filtered.sort(key=lambda x: x.score, reverse=True)
 
+        # (c) 1시간봉 캔들 데이터 조회 — 화면 표시용이므로 최종 Top N 만
+        for c in filtered[:REPORT_TOP_N]:
+            c.hourly_candles = self.engine.fetch_hourly_candles(c.code)
+            logger.debug(f"[{c.name}] 1시간봉 {len(c.hourly_candles)}개 수집")
+            time.sleep(0.3)
+
         logger.info("=" * 60)
         logger.info("Phase 2 결과 (점수순)")
         logger.info("-" * 60)
-        for i, c in enumerate(filtered[:10], 1):
+        for i, c in enumerate(filtered[:REPORT_TOP_N], 1):
             logger.info(
                 f"  {i:2d}. [{c.supply_grade.name}] {c.name:10s} "
                 f"점수={c.score:.0f}  수급={c.supply_score:.1f}  "
@@ -199,10 +220,66 @@ class ClosingBetStrategy:
             )
 
         # Phase 2 결과를 DB에 저장
-        self._save_phase2_reports(filtered[:10])
+        self._save_phase2_reports(filtered[:REPORT_TOP_N])
+        self._save_candidate_features(filtered)
+
+        # 섀도 변형 — 같은 피처를 변형 설정으로 재채점해 라벨별 랭킹 저장
+        for label, engine in self.variant_engines.items():
+            ranked = sorted(
+                (engine.rescore(c) for c in filtered),
+                key=lambda x: x.score, reverse=True,
+            )
+            self._save_variant_reports(label, ranked[:REPORT_TOP_N])
 
         return filtered
 
+    def _fetch_supply_with_pruning(self, candidates: list[StockCandidate]):
+        """점수 상한(score_upper_bound) 내림차순으로 수급 TR 을 조회한다.
+
+        score_candidate 는 가산식이므로 수급 조회 전 점수 + 수급 최대치가 곧 상한이다.
+        수급까지 확정된 Top N 의 최저 점수(컷오프)보다 상한이 낮은 종목은
+        Top N 에 들 수 없으므로 수급 TR(4건)을 건너뛴다(supply_checked=False).
+        섀도 변형이 있으면 모든 변형에서 컷오프 미달일 때만 건너뛴다.
+        """
+        engines = [self.engine, *self.variant_engines.values()]
+        ordered = sorted(candidates, key=self.engine.score_upper_bound, reverse=True)
+        top_scores: list[list[float]] = [[] for _ in engines]  # 엔진별 확정 점수 상위 N (min-heap, [0]=컷오프)
+        skipped = 0
+
+        for c in ordered:
+            if all(
+                len(heap) >= REPORT_TOP_N and engine.score_upper_bound(c) < heap[0]
+                for engine, heap in zip(engines, top_scores)
+            ):
+                skipped += 1
+                continue
+
+            supply = self.engine.analyze_supply_demand(c.code, c.current_price)
+            c.inst_net_buy = supply["inst_net_buy"]
+            c.frgn_net_buy = supply["frgn_net_buy"]
+            c.indv_net_buy = supply["indv_net_buy"]
+            c.prog_net_buy = supply["prog_net_buy"]
+            c.supply_grade = supply["supply_grade"]
+            c.supply_score = supply.get("supply_score", 0.0)
+            c.supply_days = supply["supply_days"]
+            c.supply_history = supply.get("supply_history", [])
+            c.foreign_brokers_buying = supply.get("foreign_brokers_buying", False)
+            c.supply_checked = True
+
+            for engine, heap in zip(engines, top_scores):
+                score = (
+                    self.engine.score_candidate(c) if engine is self.engine
+                    else engine.rescore(c).score
+                )
+                if len(heap) < REPORT_TOP_N:
+                    heapq.heappush(heap, score)
+                elif score > heap[0]:
+                    heapq.heapreplace(heap, score)
+            time.sleep(0.5)
+
+        if skipped:
+            logger.info(f"수급 조회 생략 {skipped}종목 (Top {REPORT_TOP_N} 점수 상한 미달)")
+
     # ── Phase 2 결과 저장 ──
     def _save_phase2_reports(self, candidates: list[StockCandidate]):
         """Phase 2 분석 결과를 daily_stock_report 테이블에 저장"""
@@ -239,6 +316,66 @@ class ClosingBetStrategy:
         except Exception as e:
             logger.error(f"Phase 2 리포트 DB 저장 실패: {e}")
 
+    def _save_candidate_features(self, candidates: list[StockCandidate]):
+        """Phase 2 에서 평가한 전체 후보(점수순)의 피처를 daily_candidate_feature 에 저장"""
+        features = []
+        for i, c in enumerate(candidates, 1):
+            features.append({
+                "stock_code": c.code.split("_")[0],
+                "stock_name": c.name,
+                "sector": c.sector,
+                "current_price": c.current_price,
+                "change_pct": c.change_pct,
+                "trading_value": c.trading_value,
+                "market_cap": c.market_cap,
+                "ma_aligned": c.ma_aligned,
+                "near_high": c.near_high,
+                "is_leader": c.is_leader,
+                "is_theme_stock": c.is_theme_stock,
+                "supply_checked": c.supply_checked,
+                "foreign_brokers_buying": c.foreign_brokers_buying,
+                "inst_net_buy": c.inst_net_buy,
+                "frgn_net_buy": c.frgn_net_buy,
+                "indv_net_buy": c.indv_net_buy,
+                "prog_net_buy": c.prog_net_buy,
+                "supply_days": c.supply_days,
+                "supply_history": c.supply_history,
+                "content_count": c.content_count,
+                "content_avg_score": c.content_avg_score,
+                "supply_score": c.supply_score,
+                "content_score": self._calc_content_score(c),
+                "score": c.score,
+                "rank_no": i if i <= REPORT_TOP_N else None,
+            })
+
+        try:
+            save_candidate_features(features)
+            logger.info(f"Phase 2 후보 피처 {len(features)}건 DB 저장 완료")
+        except Exception as e:
+            logger.error(f"Phase 2 후보 피처 DB 저장 실패: {e}")
+
+    def _save_variant_reports(self, label: str, candidates: list[StockCandidate]):
+        """섀도 변형 랭킹을 daily_variant_report 에 variant 라벨로 저장"""
+        reports = [
+            {
+                "stock_code": c.code.split("_")[0],
+                "stock_name": c.name,
+                "current_price": c.current_price,
+                "supply_score": c.supply_score,
+                "score": c.score,
+                "rank_no": i,
+            }
+            for i, c in enumerate(candidates, 1)
+        ]
+        try:
+            save_variant_reports(label, reports)
+            logger.info(
+                f"[변형 {label}] 리포트 {len(reports)}건 DB 저장 완료 "
+                f"(1위 {candidates[0].name if candidates else '-'})"
+            )
+        except Exception as e:
+            logger.error(f"[변형 {label}] 리포트 DB 저장 실패: {e}")
+
     # ── 관심 섹터 동적 로드 ──
     def _fetch_watchlist_sectors(self):
         """ka90001(테마그룹) + ka90002(테마구성종목)로 WATCHLIST_SECTORS 동적 구성 & DB 저장"""
@@ -351,4 +488,5 @@ if __name__ == "__main__":
     # cron: 0,30 9-18 * * 1-5. 휴장일·운영시간대(09~18시) 밖이면 종료.
     exit_if_outside_window(9, 18)
     strategy = ClosingBetStrategy()
-    strategy.run()
+    with query_scope("worker:closing_bet"):
+        strategy.run()
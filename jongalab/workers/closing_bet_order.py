@@ -0,0 +1,108 @@
+"""종가베팅 주문 실행 워커
+오늘 daily_stock_report 상위 ORDER_TOP_N 종목을 예약 시각(ORDER_TIME)에 분할 매수
+
+- 실행 즉시 주문 티켓(종목·수량·분할 수량)을 미리 계산해 두고,
+  예약 시각에 1차 분할을 전 종목 동시 발사 → ORDER_SPLIT_INTERVAL_SEC 간격으로 다음 분할.
+- 체결은 잔고(kt00018) 폴링으로 백그라운드 추적, 결과는 ADMIN 유저에게 전송.
+- --paper: 주문/계좌 TR 을 로컬 모의 체결(PaperOrderClient)로 대체 (실주문 없음).
+- --at HH:MM: 예약 시각 override.
+- 실주문은 하루 한 번만: 발사 직전 SENT_FILE 에 날짜를 기록하고, 같은 날 재실행(cron 재시도·
+  수동 실행)은 거부한다. --force 로만 다시 보낼 수 있다. (--paper 는 기록·검사하지 않음)
+"""
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from core.logging_setup import setup_logging
+from core.query_metrics import query_scope
+from core.kiwoom_client import KiwoomRestClient, PaperOrderClient
+from core.trading_engine import StrategyConfig, OrderExecutor
+from core.repository.stock_report import get_stock_reports_by_date
+from core.notifications import send_order_execution_alert
+
+setup_logging()
+logger = logging.getLogger("ClosingBetOrder")
+
+FILL_TIMEOUT_SEC = 600
+SENT_FILE = Path(__file__).resolve().parent.parent / ".closing_bet_order_sent.json"
+
+
+def _arg(name: str) -> str | None:
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return None
+
+
+def _already_sent(today: str) -> bool:
+    """오늘 실주문을 이미 발사했는지. 기록 파일을 읽을 수 없으면 안전하게 발사한 것으로 본다."""
+    if not SENT_FILE.exists():
+        return False
+    try:
+        return json.loads(SENT_FILE.read_text()).get("date") == today
+    except Exception as e:
+        logger.error(f"주문 기록 파일 읽기 실패 ({SENT_FILE.name}): {e}")
+        return True
+
+
+def _mark_sent(today: str, tickets: list):
+    SENT_FILE.write_text(json.dumps({
+        "date": today,
+        "sent_at": datetime.now().isoformat(timespec="seconds"),
+        "tickets": [{"code": t.code, "quantity": t.quantity, "splits": t.splits} for t in tickets],
+    }, ensure_ascii=False))
+
+
+def run(paper: bool = False, at: str | None = None, force: bool = False):
+    logger.info("=" * 60)
+    logger.info(f"종가베팅 주문 실행 시작{' (모의 체결)' if paper else ''}")
+    logger.info("=" * 60)
+
+    today = datetime.now().date().isoformat()
+    if not paper and not force and _already_sent(today):
+        logger.error(f"{today} 주문 이미 발사됨 ({SENT_FILE.name}) — 중복 매수 방지로 종료 (재발사는 --force)")
+        return
+
+    cfg = StrategyConfig()
+    cfg.load_from_db()
+    api = PaperOrderClient() if paper else KiwoomRestClient()
+    executor = OrderExecutor(api, cfg)
+
+    reports = get_stock_reports_by_date(today)
+    if not reports:
+        logger.info(f"{today} 리포트 없음 — 종료")
+        return
+
+    try:
+        tickets = executor.build_tickets(reports)
+    except RuntimeError as e:
+        logger.error(f"주문 티켓 계산 중단: {e}")
+        return
+    if not tickets:
+        logger.info("주문 티켓 없음 — 종료")
+        return
+    for t in tickets:
+        logger.info(f"  {t.name}({t.code}) {t.quantity}주 @ {t.ref_price:,} 분할 {t.splits}")
+
+    hh, mm = (at or cfg.ORDER_TIME).split(":")
+    fire_at = datetime.now().replace(hour=int(hh), minute=int(mm), second=0, microsecond=0)
+    logger.info(f"{fire_at:%H:%M:%S} 주문 예약 ({len(tickets)}종목)")
+
+    if not paper:
+        _mark_sent(today, tickets)
+    executor.execute(tickets, fire_at)
+    positions = executor.wait_fills(FILL_TIMEOUT_SEC)
+
+    send_order_execution_alert(today, tickets, positions, paper=paper)
+    logger.info("종가베팅 주문 실행 완료")
+
+
+if __name__ == "__main__":
+    from core.market_calendar import exit_if_outside_window
+    # cron: 10 15 * * 1-5. 휴장일·운영시간대(14~15시) 밖이면 종료.
+    exit_if_outside_window(14, 15)
+    with query_scope("worker:closing_bet_order"):
+        run(paper="--paper" in sys.argv, at=_arg("--at"), force="--force" in sys.argv)
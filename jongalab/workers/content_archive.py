@@ -0,0 +1,71 @@
+"""콘텐츠 본문 콜드 보관 워커 (매일 04:00)
+
+CONTENT_HOT_MONTHS(기본 3, 최소 1)개월 이전 달에 수집된 content_analysis 본문을
+압축해 content_archive 로 옮기고, content_archive 월 파티션을 다음 달까지 미리 만든다.
+
+- 기준: 이번 달 1일에서 CONTENT_HOT_MONTHS 개월 전 1일 (그 이전 created_at 만 보관)
+  → 피드(최근 7일)·언급 통계·일일 요약이 읽는 구간은 항상 hot 으로 남는다.
+- CONTENT_ARCHIVE_BATCH 건씩 끊어 한 배치 = 한 트랜잭션으로 처리 (수집 워커와 락 경합 최소화).
+- 여러 번 실행해도 이미 보관된 행은 건너뛴다.
+
+사용법:
+    python -m workers.content_archive              # 기본 기준으로 보관
+    python -m workers.content_archive --months 6   # 기준 개월 수 변경
+"""
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+
+from core.logging_setup import setup_logging
+from core.query_metrics import query_scope
+from core.repository.content_archive import (
+    archive_contents_before,
+    ensure_archive_partitions,
+    month_key,
+)
+
+setup_logging()
+logger = logging.getLogger("ContentArchive")
+
+HOT_MONTHS = max(int(os.getenv("CONTENT_HOT_MONTHS", "3")), 1)
+BATCH_SIZE = int(os.getenv("CONTENT_ARCHIVE_BATCH", "500"))
+BATCH_PAUSE_SEC = 0.2
+
+
+def _archive_cutoff(now: datetime, months: int) -> datetime:
+    """now 가 속한 달 1일에서 months 개월 전 1일 00:00"""
+    total = now.year * 12 + (now.month - 1) - months
+    return datetime(total // 12, total % 12 + 1, 1)
+
+
+def run(months: int = HOT_MONTHS) -> int:
+    now = datetime.now()
+    cutoff = _archive_cutoff(now, months)
+
+    # 다음 달 파티션까지 미리 준비 (월이 바뀌는 시점에 p_future 로 몰리지 않도록)
+    next_month = _archive_cutoff(now, -1)
+    added = ensure_archive_partitions(month_key(next_month))
+    if added:
+        logger.info(f"content_archive 파티션 추가: {', '.join(added)}")
+
+    logger.info(f"{cutoff:%Y-%m-%d} 이전 콘텐츠 본문 보관 시작 (배치 {BATCH_SIZE}건)")
+    total = 0
+    while True:
+        done = archive_contents_before(cutoff, BATCH_SIZE)
+        if not done:
+            break
+        total += done
+        time.sleep(BATCH_PAUSE_SEC)
+    logger.info(f"보관 완료: {total}건")
+    return total
+
+
+if __name__ == "__main__":
+    # cron: 0 4 * * *
+    parser = argparse.ArgumentParser(description="콘텐츠 본문 콜드 보관")
+    parser.add_argument("--months", type=int, default=HOT_MONTHS, help="hot 으로 남길 개월 수")
+    args = parser.parse_args()
+    with query_scope("worker:content_archive"):
+        run(max(args.months, 1))
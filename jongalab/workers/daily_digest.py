@@ -3,9 +3,8 @@ import json
 import logging
 from datetime import datetime
 
-from openai import OpenAI
-
 from core.logging_setup import setup_logging
+from core.query_metrics import query_scope
 from core.config import OPENAI_API_KEY, OPENAI_MODEL
 from core.prompts import DAILY_DIGEST_PROMPT
 from core.ai_utils import parse_ai_json
@@ -14,7 +13,16 @@ from core.notifications import send_daily_digest_alert
 
 setup_logging()
 
-_openai_client = OpenAI(api_key=OPENAI_API_KEY)
+_openai_client = None
+
+
+def _get_openai():
+    """OpenAI 클라이언트 (lazy init — openai 패키지는 리포트 생성 시점에 import)"""
+    global _openai_client
+    if _openai_client is None:
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
 
 
 def generate_daily_report():
@@ -50,7 +58,7 @@ def generate_daily_report():
 
         logging.info(f"ChatGPT 분석 시작 (모델: {OPENAI_MODEL}, 데이터 {len(rows)}건)...")
 
-        response = _openai_client.chat.completions.create(
+        response = _get_openai().chat.completions.create(
             model=OPENAI_MODEL,
             messages=[{'role': 'user', 'content': prompt}],
             temperature=0.1,
@@ -94,4 +102,5 @@ if __name__ == "__main__":
     from core.market_calendar import exit_if_outside_window
     # cron: 50 7 * * 1-5 (07:50). 휴장일·운영시간대(07~09시) 밖이면 종료.
     exit_if_outside_window(7, 9)
-    generate_daily_report()
+    with query_scope("worker:daily_digest"):
+        generate_daily_report()
@@ -1,19 +1,26 @@
 """갭상승 체크 워커
-전날 daily_stock_report Top 10의 '리포트 시각 → 현재가' 등락률을 ADMIN 유저에게 전송
+전날 daily_stock_report Top N(기본 10, GAP_CHECK_TOP_N)의 '리포트 시각 → 현재가' 등락률을 ADMIN 유저에게 전송
 
 - 평일 08:10: 기본 실행. NXT 가격 조회. 미지원 등으로 대기 중인 종목은
   state 파일에 저장하고 '⏳ 장 시작 대기' 섹션에 표시.
 - 평일 09:10: --retry 실행. 전체 종목을 KRX로 재조회.
   8:10 NXT 결과가 있는 종목은 [NXT]/[KRX] 두 줄로 표시하고,
   갭 상승/하락 분류는 리포트 → 9:10 KRX 최종 등락률 기준.
+- 평일 08:00: --track 실행. 09:30 까지 설정 간격(GAP_TRACK_INTERVAL_SEC)으로
+  NXT/KRX 시세를 폴링해 gap_tick 시계열로 일괄 저장 (갭상승 후 밀림 등 경로 포착).
+- 종목별 시세는 스레드 풀로 동시에 조회하고, 행마다 실제 포착 시각을 gap_checked_at 에 기록.
 """
 import json
 import logging
+import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dtime
 from pathlib import Path
 
 from core.logging_setup import setup_logging
+from core.query_metrics import query_scope
 from core.kiwoom_client import KiwoomRestClient
 from core.trading_engine import AnalysisEngine
 from core.repository.stock_report import (
@@ -21,13 +28,29 @@ from core.repository.stock_report import (
     get_stock_reports_by_date,
     save_gap_check_results,
 )
-from core.notifications import send_gap_check_alert
+from core.repository.gap_tick import save_gap_ticks
+from core.repository.strategy_variant import (
+    get_variant_reports_by_date,
+    save_variant_gap_results,
+)
+from core.notifications import send_gap_check_alert, send_variant_gap_alert
 
 setup_logging()
 logger = logging.getLogger("GapCheck")
 
 STATE_FILE = Path(__file__).resolve().parent.parent / ".gap_check_pending.json"
 
+# 갭 체크 대상 상위 종목 수 / 동시 시세 조회 스레드 수
+TOP_N = int(os.getenv("GAP_CHECK_TOP_N", "10"))
+_QUOTE_WORKERS = 10
+
+# --track 폴링 간격(초)·종료 시각 / KRX 정규장 시작 시각
+TRACK_INTERVAL_SEC = int(os.getenv("GAP_TRACK_INTERVAL_SEC", "60"))
+TRACK_END = dtime(9, 30)
+_KRX_OPEN = dtime(9, 0)
+
+_api: KiwoomRestClient | None = None
+
 
 def _most_recent_prior_date() -> str | None:
     dates = get_stock_report_dates(limit=5)
@@ -35,6 +58,49 @@ def _most_recent_prior_date() -> str | None:
     return next((d for d in dates if d < today), None)
 
 
+def _get_api() -> KiwoomRestClient:
+    """키움 HTTP 클라이언트 (lazy singleton) — 호출마다 새로 만들지 않고 연결을 재사용"""
+    global _api
+    if _api is None:
+        _api = KiwoomRestClient()
+        _api.ensure_token()
+    return _api
+
+
+def _query_one(api: KiwoomRestClient, r: dict, detect_pending: bool, stk_postfix: str) -> dict:
+    rank = r["rank_no"]
+    name = r["stock_name"]
+    code = r["stock_code"]
+    stk_cd = code.split(".")[0] + stk_postfix
+    report_price = abs(int(r.get("current_price") or 0))
+    score = int(r.get("score") or 0)
+    base = {"rank": rank, "name": name, "score": score}
+    try:
+        info = api.get_stock_basic_info(stk_cd)
+        # 응답 수신 직후 시각 — 종목별 실제 시세 포착 시각
+        captured_at = datetime.now().isoformat(timespec="milliseconds")
+        now_price = abs(AnalysisEngine.parse_price(info.get("cur_prc", "0")))
+        if report_price <= 0:
+            return {**base, "error": True}
+        if now_price <= 0:
+            if detect_pending:
+                return {**base, "code": code, "report_price": report_price, "pending": True}
+            return {**base, "error": True}
+        pct = (now_price - report_price) / report_price * 100
+        return {
+            **base,
+            "code": code,
+            "report_price": report_price, "now_price": now_price,
+            "pct": pct,
+            "captured_at": captured_at,
+        }
+    except Exception as e:
+        logger.warning(f"{name}({stk_cd}) 조회 실패: {e}")
+        if detect_pending:
+            return {**base, "code": code, "report_price": report_price, "pending": True}
+        return {**base, "error": True}
+
+
 def _query_stocks(
     reports: list[dict],
     detect_pending: bool,
@@ -43,54 +109,103 @@ def _query_stocks(
     """
     stk_postfix: ka10001 stk_cd 접미사 — ""=KRX, "_NX"=NXT, "_AL"=SOR
     detect_pending=True면 조회 실패/빈값을 pending으로 분류 (09:10 재조회 대상)
+
+    종목별 ka10001 을 동시에 조회하고, 성공 행에는 실제 포착 시각(captured_at)을 남긴다.
+    반환 순서는 입력(reports) 순서와 같다.
     """
-    api = KiwoomRestClient()
-    api.ensure_token()
-    rows = []
-    for r in reports:
-        rank = r["rank_no"]
-        name = r["stock_name"]
-        code = r["stock_code"]
-        stk_cd = code.split(".")[0] + stk_postfix
-        report_price = abs(int(r.get("current_price") or 0))
-        score = int(r.get("score") or 0)
-        base = {"rank": rank, "name": name, "score": score}
-        try:
-            info = api.get_stock_basic_info(stk_cd)
-            now_price = abs(AnalysisEngine.parse_price(info.get("cur_prc", "0")))
-            if report_price <= 0:
-                rows.append({**base, "error": True})
-                continue
-            if now_price <= 0:
-                if detect_pending:
-                    rows.append({**base, "code": code, "report_price": report_price, "pending": True})
-                else:
-                    rows.append({**base, "error": True})
+    if not reports:
+        return []
+    api = _get_api()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(len(reports), _QUOTE_WORKERS)) as pool:
+        rows = list(pool.map(
+            lambda r: _query_one(api, r, detect_pending, stk_postfix), reports,
+        ))
+    logger.info(f"시세 {len(rows)}건 조회 {time.perf_counter() - started:.2f}초")
+    return rows
+
+
+def _summarize(pcts: list[float]) -> dict:
+    """등락률 목록 → {wins, losses, flats, total, avg_pct}"""
+    return {
+        "wins": sum(1 for p in pcts if p > 0),
+        "losses": sum(1 for p in pcts if p < 0),
+        "flats": sum(1 for p in pcts if p == 0),
+        "total": len(pcts),
+        "avg_pct": sum(pcts) / len(pcts) if pcts else None,
+    }
+
+
+def _check_variants(
+    report_date: str,
+    live_pcts: list[float],
+    price_by_code: dict[str, int],
+    venue: str,
+    top_n: int = TOP_N,
+    is_retry: bool = False,
+):
+    """섀도 변형 전략의 갭 성과를 기본 전략(live)과 나란히 비교·저장·전송.
+
+    price_by_code 는 기본 전략 조회에서 이미 얻은 현재가 — 변형에만 있는 종목만 추가 조회한다.
+    venue: "nxt"(08:10, NXT) / "krx"(09:10, KRX)
+    """
+    try:
+        variants = get_variant_reports_by_date(report_date)
+    except Exception as e:
+        logger.warning(f"변형 전략 리포트 조회 실패: {e}")
+        return
+    if not variants:
+        return
+
+    extra = {
+        r["stock_code"]: r
+        for reports in variants.values()
+        for r in reports[:top_n]
+        if r["stock_code"] not in price_by_code
+    }
+    if extra:
+        stk_postfix = "_NX" if venue == "nxt" else ""
+        logger.info(f"변형 전략 전용 종목 {len(extra)}개 추가 조회 중...")
+        for row in _query_stocks(list(extra.values()), detect_pending=False, stk_postfix=stk_postfix):
+            if "now_price" in row:
+                price_by_code[row["code"]] = row["now_price"]
+
+    summaries = {"live": _summarize(live_pcts)}
+    updates = []
+    for label, reports in variants.items():
+        pcts = []
+        for r in reports[:top_n]:
+            report_price = abs(int(r.get("current_price") or 0))
+            now_price = price_by_code.get(r["stock_code"])
+            if not now_price or report_price <= 0:
                 continue
             pct = (now_price - report_price) / report_price * 100
-            rows.append({
-                **base,
-                "code": code,
-                "report_price": report_price, "now_price": now_price,
-                "pct": pct,
+            pcts.append(pct)
+            updates.append({
+                "variant": label,
+                "stock_code": r["stock_code"],
+                f"{venue}_price": now_price,
+                f"{venue}_pct": pct,
             })
-        except Exception as e:
-            logger.warning(f"{name}({stk_cd}) 조회 실패: {e}")
-            if detect_pending:
-                rows.append({**base, "code": code, "report_price": report_price, "pending": True})
-            else:
-                rows.append({**base, "error": True})
-    return rows
+        summaries[label] = _summarize(pcts)
+
+    try:
+        save_variant_gap_results(report_date, updates)
+    except Exception as e:
+        logger.warning(f"변형 갭 체크 결과 DB 저장 실패: {e}")
 
+    check_time = datetime.now().strftime("%m-%d %H:%M")
+    send_variant_gap_alert(report_date, check_time, summaries, is_retry=is_retry)
 
-def _save_state(report_date: str, rows: list[dict]):
+
+def _save_state(report_date: str, rows: list[dict], top_n: int = TOP_N):
     """retry에서 전체 종목을 KRX로 재조회하기 위해 항상 저장"""
     if not rows:
         STATE_FILE.unlink(missing_ok=True)
         return
     pending_count = sum(1 for r in rows if r.get("pending"))
     STATE_FILE.write_text(
-        json.dumps({"report_date": report_date, "rows": rows}, ensure_ascii=False)
+        json.dumps({"report_date": report_date, "top_n": top_n, "rows": rows}, ensure_ascii=False)
     )
     logger.info(f"state 저장 → 총 {len(rows)}건 (대기 {pending_count}건)")
 
@@ -105,7 +220,14 @@ def _load_state() -> dict | None:
         return None
 
 
-def run_initial():
+def _check_time(rows: list[dict]) -> str:
+    """알림 표기용 시각 — 가장 이른 실제 포착 시각, 없으면 현재 시각"""
+    captured = [r["captured_at"] for r in rows if r.get("captured_at")]
+    at = datetime.fromisoformat(min(captured)) if captured else datetime.now()
+    return at.strftime("%m-%d %H:%M:%S")
+
+
+def run_initial(top_n: int = TOP_N):
     logger.info("=" * 60)
     logger.info("갭상승 체크 시작")
     logger.info("=" * 60)
@@ -117,7 +239,7 @@ def run_initial():
         logger.info("전날 리포트 없음 — 종료")
         return
 
-    reports = get_stock_reports_by_date(report_date)[:10]
+    reports = get_stock_reports_by_date(report_date)[:top_n]
     if not reports:
         logger.info(f"{report_date} 리포트 데이터 없음 — 종료")
         return
@@ -125,15 +247,22 @@ def run_initial():
     logger.info(f"{report_date} Top {len(reports)} 종목의 NXT 현재가 조회 중...")
 
     rows = _query_stocks(reports, detect_pending=True, stk_postfix="_NX")
-    _save_state(report_date, rows)
+    _save_state(report_date, rows, top_n)
 
     try:
         save_gap_check_results(report_date, rows)
     except Exception as e:
         logger.warning(f"갭 체크 결과 DB 저장 실패: {e}")
 
-    check_time = datetime.now().strftime("%m-%d %H:%M")
-    send_gap_check_alert(report_date, check_time, rows)
+    send_gap_check_alert(report_date, _check_time(rows), rows)
+
+    _check_variants(
+        report_date,
+        [r["pct"] for r in rows if "pct" in r],
+        {r["code"]: r["now_price"] for r in rows if "now_price" in r},
+        venue="nxt",
+        top_n=top_n,
+    )
     logger.info("갭상승 체크 완료")
 
 
@@ -148,6 +277,7 @@ def run_retry():
         return
 
     report_date = state["report_date"]
+    top_n = state.get("top_n", TOP_N)
     all_rows = state["rows"]
     candidates = [r for r in all_rows if not r.get("error")]
     if not candidates:
@@ -158,7 +288,7 @@ def run_retry():
 
     code_by_rank = {
         r["rank_no"]: r["stock_code"]
-        for r in get_stock_reports_by_date(report_date)[:10]
+        for r in get_stock_reports_by_date(report_date)[:top_n]
     }
 
     krx_inputs = [{
@@ -196,9 +326,11 @@ def run_retry():
         if nxt_ok:
             out["nxt_price"] = r["now_price"]
             out["nxt_pct"] = r["pct"]
+            out["nxt_captured_at"] = r.get("captured_at")
         if krx_ok:
             out["krx_price"] = krx["now_price"]
             out["krx_pct"] = krx["pct"]
+            out["captured_at"] = krx["captured_at"]
             if nxt_ok and r["now_price"] > 0:
                 out["krx_from_nxt_pct"] = (
                     (krx["now_price"] - r["now_price"]) / r["now_price"] * 100
@@ -210,17 +342,80 @@ def run_retry():
     except Exception as e:
         logger.warning(f"갭 체크 결과 DB 저장 실패: {e}")
 
-    check_time = datetime.now().strftime("%m-%d %H:%M")
-    send_gap_check_alert(report_date, check_time, merged, is_retry=True)
+    send_gap_check_alert(report_date, _check_time(krx_rows), merged, is_retry=True)
+
+    _check_variants(
+        report_date,
+        [r.get("krx_pct", r.get("nxt_pct")) for r in merged if "krx_pct" in r or "nxt_pct" in r],
+        {k["code"]: k["now_price"] for k in krx_rows if "now_price" in k},
+        venue="krx",
+        top_n=top_n,
+        is_retry=True,
+    )
     STATE_FILE.unlink(missing_ok=True)
     logger.info("갭상승 체크 재조회 완료")
 
 
+def run_track(top_n: int = TOP_N, interval_sec: int = TRACK_INTERVAL_SEC, until: dtime = TRACK_END):
+    """전날 Top N 의 장전·개장 시세를 until 까지 interval_sec 간격으로 폴링해 gap_tick 에 저장.
+
+    라운드마다 NXT 를 조회하고, KRX 정규장(09:00) 이후에는 KRX 도 함께 조회한다.
+    한 라운드의 틱은 ts 하나로 묶어 한 번에 INSERT 한다.
+    """
+    logger.info("=" * 60)
+    logger.info(f"갭 추적 시작 (간격 {interval_sec}초, ~{until.strftime('%H:%M')})")
+    logger.info("=" * 60)
+
+    report_date = _most_recent_prior_date()
+    if not report_date:
+        logger.info("전날 리포트 없음 — 종료")
+        return
+
+    reports = get_stock_reports_by_date(report_date)[:top_n]
+    if not reports:
+        logger.info(f"{report_date} 리포트 데이터 없음 — 종료")
+        return
+
+    rounds = 0
+    while datetime.now().time() < until:
+        started = time.monotonic()
+        ts = datetime.now().replace(microsecond=0)
+        ticks = {
+            r["code"]: {"stock_code": r["code"], "ts": ts, "nxt_price": r["now_price"]}
+            for r in _query_stocks(reports, detect_pending=False, stk_postfix="_NX")
+            if "now_price" in r
+        }
+        if ts.time() >= _KRX_OPEN:
+            for r in _query_stocks(reports, detect_pending=False, stk_postfix=""):
+                if "now_price" in r:
+                    ticks.setdefault(r["code"], {"stock_code": r["code"], "ts": ts})["krx_price"] = r["now_price"]
+
+        try:
+            save_gap_ticks(report_date, list(ticks.values()))
+        except Exception as e:
+            logger.warning(f"갭 틱 DB 저장 실패: {e}")
+        rounds += 1
+
+        time.sleep(max(0.0, interval_sec - (time.monotonic() - started)))
+
+    logger.info(f"갭 추적 완료 — {rounds}회 폴링")
+
+
 if __name__ == "__main__":
     from core.market_calendar import exit_if_outside_window
     # cron: 5 8(초기) / 5 9(--retry) * * 1-5. 휴장일·운영시간대(08~09시) 밖이면 종료.
+    # cron: 0 8 * * 1-5 --track [--interval SEC] (09:30 까지 상주)
     exit_if_outside_window(8, 9)
-    if "--retry" in sys.argv:
-        run_retry()
-    else:
-        run_initial()
+    # --top N: 대상 종목 수 지정 (재조회는 초기 실행 시 state 에 저장한 값을 따른다)
+    top_n = int(sys.argv[sys.argv.index("--top") + 1]) if "--top" in sys.argv else TOP_N
+    with query_scope("worker:gap_check"):
+        if "--retry" in sys.argv:
+            run_retry()
+        elif "--track" in sys.argv:
+            interval = (
+                int(sys.argv[sys.argv.index("--interval") + 1])
+                if "--interval" in sys.argv else TRACK_INTERVAL_SEC
+            )
+            run_track(top_n, interval)
+        else:
+            run_initial(top_n)
@@ -9,6 +9,7 @@ from telethon import TelegramClient, events
 from telethon.tl.types import MessageMediaWebPage, WebPage
 
 from core.logging_setup import setup_logging
+from core.query_metrics import query_scope
 from core.config import TELEGRAM_API_ID, TELEGRAM_API_HASH
 from core.prompts import TELEGRAM_ANALYSIS_PROMPT
 from core.ai_service import analyze_content
@@ -127,21 +128,23 @@ while True:
                 logging.warning(f"[{channel_name}] 환각 감지 - 저장하지 않습니다.")
                 return
 
-            tickers = get_tickers(result.related_companies)
-
-            if not should_save_content(result.sentiment_score, tickers, skip_neutral=True, allow_no_ticker=False):
-                return
-
-            save_content_analysis(
-                external_id=msg_link,
-                source_name=channel_name,
-                title=result.title,
-                content=result.content,
-                score=result.sentiment_score,
-                source_url=msg_link,
-                related_tickers=tickers,
-                platform='telegram',
-            )
+            # 메시지 1건 = 쿼리 집계 범위 1개 (종목 조회 N+1 감지용)
+            with query_scope("worker:telegram_listener"):
+                tickers = get_tickers(result.related_companies)
+
+                if not should_save_content(result.sentiment_score, tickers, skip_neutral=True, allow_no_ticker=False):
+                    return
+
+                save_content_analysis(
+                    external_id=msg_link,
+                    source_name=channel_name,
+                    title=result.title,
+                    content=result.content,
+                    score=result.sentiment_score,
+                    source_url=msg_link,
+                    related_tickers=tickers,
+                    platform='telegram',
+                )
 
             if result.sentiment_score is not None and 30 <= result.sentiment_score <= 80:
                 logging.info(f"[알림 스킵] 점수 {result.sentiment_score}점(30~80 구간)으로 텔레그램 전송 생략")
@@ -6,6 +6,7 @@ import feedparser
 from youtube_transcript_api import YouTubeTranscriptApi
 
 from core.logging_setup import setup_logging
+from core.query_metrics import query_scope
 from core.config import OLLAMA_MODEL
 from core.prompts import YOUTUBE_ANALYSIS_PROMPT
 from core.ai_service import analyze_content
@@ -108,4 +109,5 @@ class StockYoutubeAgent:
 
 if __name__ == "__main__":
     agent = StockYoutubeAgent()
-    agent.run_once()
+    with query_scope("worker:youtube_collector"):
+        agent.run_once()
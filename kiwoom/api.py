@@ -4,6 +4,7 @@ Kiwoom Data API — 키움 REST 데이터 조회 전용 FastAPI 서버 (localhos
 jongalab 메인 앱이 core.kiwoom_client.KiwoomRestClient 를 통해 HTTP 로 호출한다.
 각 엔드포인트는 요청마다 ensure_token() 으로 토큰을 보장한 뒤 키움 응답 dict 를
 그대로 반환한다(소비자가 원본 필드를 그대로 읽으므로 가공하지 않는다).
+주문·계좌 TR(kt10000/kt10001/kt00001/kt00018)도 jongalab OrderExecutor 용으로 중계한다.
 """
 import logging
 
@@ -11,6 +12,7 @@ from fastapi import FastAPI
 from pydantic import BaseModel
 
 from core.config import DB_CONFIG  # noqa: F401  (import 시 루트 .env 로드)
+from core.db import get_pool_stats
 from core.logging_setup import setup_logging
 from core.kiwoom_api import KiwoomConfig, KiwoomRestAPI
 from core.repository import kiwoom_token as token_repo
@@ -35,6 +37,10 @@ class StkCd(BaseModel):
     stk_cd: str
 
 
+class StkCds(BaseModel):
+    stk_cds: list[str]
+
+
 class DailyChart(BaseModel):
     stk_cd: str
     dt: str = ""
@@ -68,10 +74,17 @@ class ThemeStocks(BaseModel):
     stex_tp: str = "3"
 
 
+class Order(BaseModel):
+    stk_cd: str
+    qty: int
+    price: int = 0
+    trde_tp: str = "0"
+
+
 # ── 헬스 ──
 @app.get("/health")
 def health():
-    """DB 연결·토큰 보유 여부 점검."""
+    """DB 연결·토큰 보유 여부·커넥션 풀 지표 점검."""
     has_token = False
     db_ok = True
     try:
@@ -80,7 +93,10 @@ def health():
     except Exception as e:
         db_ok = False
         logger.warning("health: DB 점검 실패: %s", e)
-    return {"status": "ok", "service": "kiwoom", "db": db_ok, "has_token": has_token}
+    return {
+        "status": "ok", "service": "kiwoom", "db": db_ok, "has_token": has_token,
+        "db_pool": get_pool_stats(),
+    }
 
 
 @app.get("/")
@@ -88,12 +104,17 @@ def root():
     return {"status": "ok", "service": "Kiwoom Data API"}
 
 
-# ── 데이터 엔드포인트 (소비자가 실제 사용하는 11종) ──
+# ── 데이터 엔드포인트 (소비자가 실제 사용하는 12종) ──
 @app.post("/stock/basic-info")
 def stock_basic_info(b: StkCd):
     return api().get_stock_basic_info(b.stk_cd)
 
 
+@app.post("/stock/watchlist-info")
+def stock_watchlist_info(b: StkCds):
+    return api().get_watchlist_info(b.stk_cds)
+
+
 @app.post("/stock/detail-info")
 def stock_detail_info(b: StkCd):
     return api().get_stock_detail_info(b.stk_cd)
@@ -148,3 +169,24 @@ def theme_stocks(b: ThemeStocks):
     return api().get_theme_stocks(
         thema_grp_cd=b.thema_grp_cd, date_tp=b.date_tp, stex_tp=b.stex_tp
     )
+
+
+# ── 주문·계좌 (kt10000 / kt10001 / kt00001 / kt00018) ──
+@app.post("/order/buy")
+def order_buy(b: Order):
+    return api().place_buy_order(b.stk_cd, b.qty, b.price, trde_tp=b.trde_tp)
+
+
+@app.post("/order/sell")
+def order_sell(b: Order):
+    return api().place_sell_order(b.stk_cd, b.qty, b.price, trde_tp=b.trde_tp)
+
+
+@app.post("/account/deposit")
+def account_deposit():
+    return api().get_deposit()
+
+
+@app.post("/account/balance")
+def account_balance():
+    return api().get_evaluation_balance()
@@ -216,6 +216,16 @@ class KiwoomRestAPI:
             "stk_cd": stk_cd,
         })
 
+    def get_watchlist_info(self, stk_cds: list[str]) -> dict:
+        """
+        ka10095 — 관심종목정보요청 (여러 종목 시세를 한 번에)
+        stk_cd: 종목코드를 '|' 로 연결 (최대 100개)
+        응답: atn_stk_infr (LIST) — stk_cd, stk_nm, cur_prc, pred_pre, flu_rt, trde_qty 등
+        """
+        return self._post(self.cfg.URL_STKINFO, "ka10095", {
+            "stk_cd": "|".join(stk_cds),
+        })
+
     def get_stock_detail_info(self, stk_cd: str) -> dict:
         """
         ka10100 — 종목정보조회
@@ -0,0 +1,53 @@
+-- ============================================================
+-- mention_hourly: 섹터/종목 언급 통계 시간 단위 롤업 (트리맵용)
+-- get_mention_stats 가 매 호출 창 내 콘텐츠 전체를 읽고 JSON 을 파싱하던 것을
+-- (bucket, sector, ticker) 집계 행 조회로 대체한다.
+--   bucket : 콘텐츠 created_at 의 정시 절삭 ('YYYY-MM-DD HH:00:00')
+--   sector : '' = 섹터 미해석 종목 (통계에서 제외, dropped_unmapped_count 로만 집계)
+--   name   : 최초 언급 시 related_tickers 의 종목명
+-- save_content_analysis 가 콘텐츠 INSERT 와 같은 트랜잭션에서 증분 갱신한다.
+-- 콘텐츠 1건 내 동일 종목은 1회만 더한다.
+-- ============================================================
+CREATE TABLE IF NOT EXISTS mention_hourly (
+    bucket        DATETIME NOT NULL,
+    sector        VARCHAR(100) NOT NULL DEFAULT '',
+    ticker        VARCHAR(20) NOT NULL,
+    name          VARCHAR(100) NOT NULL DEFAULT '',
+    mention_count INT NOT NULL DEFAULT 0,
+    sentiment_sum INT NOT NULL DEFAULT 0,
+    sentiment_n   INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, sector, ticker)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- total_contents 집계(창 내 콘텐츠 수)용 기간 인덱스
+CREATE INDEX IF NOT EXISTS idx_created_at ON content_analysis (created_at);
+
+-- 최근 7일 백필 (content_ticker 기준, 9번 마이그레이션 이후 실행). 멱등: 집계값으로 덮어쓴다.
+-- 섹터 매핑(ticker_sectors)이 아예 없는 콘텐츠는 기존 집계와 같이 제외한다.
+INSERT INTO mention_hourly
+    (bucket, sector, ticker, name, mention_count, sentiment_sum, sentiment_n)
+SELECT DATE_FORMAT(ct.created_at, '%Y-%m-%d %H:00:00'),
+       COALESCE(ct.sector, ''),
+       ct.ticker,
+       COALESCE(MAX((SELECT TRIM(t.name)
+                       FROM JSON_TABLE(
+                                ca.related_tickers, '$[*]'
+                                COLUMNS (ticker VARCHAR(20) PATH '$.ticker',
+                                         name VARCHAR(100) PATH '$.name')
+                            ) t
+                      WHERE UPPER(SUBSTRING_INDEX(SUBSTRING_INDEX(TRIM(t.ticker), '.', 1), '_', 1)) = ct.ticker
+                      LIMIT 1)), ''),
+       COUNT(*),
+       COALESCE(SUM(ca.sentiment_score), 0),
+       COUNT(ca.sentiment_score)
+  FROM content_ticker ct
+  JOIN content_analysis ca ON ca.id = ct.content_id
+ WHERE ct.created_at >= NOW() - INTERVAL 7 DAY
+   AND ca.ticker_sectors IS NOT NULL
+   AND JSON_VALID(ca.related_tickers)
+ GROUP BY 1, 2, 3
+ON DUPLICATE KEY UPDATE
+    name          = VALUES(name),
+    mention_count = VALUES(mention_count),
+    sentiment_sum = VALUES(sentiment_sum),
+    sentiment_n   = VALUES(sentiment_n);
@@ -0,0 +1,8 @@
+-- ============================================================
+-- content_analysis: 피드 키셋 페이지네이션 인덱스
+-- get_contents_paginated 의 ORDER BY created_at DESC, id DESC 와
+-- (created_at, id) < (커서) 조건을 인덱스 역순 스캔 한 번으로 처리한다.
+-- 10번의 idx_created_at 는 이 인덱스의 접두사이므로 제거한다.
+-- ============================================================
+CREATE INDEX IF NOT EXISTS idx_created_id ON content_analysis (created_at, id);
+DROP INDEX IF EXISTS idx_created_at ON content_analysis;
@@ -0,0 +1,19 @@
+-- ============================================================
+-- daily_stock_report: supply_history / hourly_candles compact 저장
+-- 행마다 반복되는 키와 문자열 시각을 담은 JSON 대신 필드별 정수 배열을
+-- 델타 인코딩한 바이너리(core/repository/series_codec.py)로 보관한다.
+--   *_bin 이 있으면 조회 시 그 값을 쓰고, 없으면 기존 JSON 컬럼을 파싱한다.
+--   저장 시에는 둘 중 하나만 채운다 (REPORT_SERIES_ENCODING=json 이면 JSON 만).
+-- 기존 행 변환은 인코딩이 SQL 로 표현되지 않으므로 스크립트로 한다:
+--   cd jongalab && python scripts/migrate_report_series.py
+-- 컬럼은 BLOB(최대 64KB). 분봉은 ka10080 최대 3페이지를 그대로 담아 수 KB 가 될 수 있다
+-- (100봉 ≈ 1.6KB, 200봉 ≈ 3.2KB). 64KB 를 넘는 값은 series_codec.encode 가 None 을 돌려 JSON 으로 저장된다.
+-- ============================================================
+ALTER TABLE daily_stock_report
+    ADD COLUMN IF NOT EXISTS supply_history_bin BLOB DEFAULT NULL AFTER supply_history,
+    ADD COLUMN IF NOT EXISTS hourly_candles_bin BLOB DEFAULT NULL AFTER hourly_candles;
+
+-- 이전 버전(VARBINARY(255)/VARBINARY(2048))으로 이미 추가된 경우 크기 제한 해제
+ALTER TABLE daily_stock_report
+    MODIFY COLUMN supply_history_bin BLOB DEFAULT NULL,
+    MODIFY COLUMN hourly_candles_bin BLOB DEFAULT NULL;
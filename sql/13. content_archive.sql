@@ -0,0 +1,26 @@
+-- ============================================================
+-- content_analysis hot/cold 분리 — 오래된 analysis_content 를 압축 보관
+-- content_analysis 는 external_id UNIQUE(중복 수집 방지)와 content_ticker FK 때문에
+-- created_at 기준 파티셔닝을 할 수 없다 (파티션 키가 모든 UNIQUE 키에 포함돼야 하고,
+-- 파티션 테이블은 FK 를 지원하지 않음). 대신:
+--   - 메타데이터 행(제목·점수·종목 등)은 content_analysis 에 그대로 두고
+--   - CONTENT_HOT_MONTHS 개월이 지난 본문은 COMPRESS() 해 content_archive 로 옮긴 뒤
+--     content_analysis.analysis_content 를 NULL, archived_at 을 채운다.
+--   content_archive 는 month_key(YYYYMM) 월 단위 RANGE 파티션.
+--   p_future 만 만들어 두고 workers/content_archive.py 가 월 파티션을 앞으로 늘린다.
+-- 조회: get_content_by_stock_and_date 가 UNCOMPRESS 로 본문을 함께 읽는다.
+-- ============================================================
+ALTER TABLE content_analysis
+    ADD COLUMN IF NOT EXISTS archived_at TIMESTAMP NULL DEFAULT NULL;
+CREATE INDEX IF NOT EXISTS idx_archived_created ON content_analysis (archived_at, created_at);
+
+CREATE TABLE IF NOT EXISTS content_archive (
+    content_id   INT NOT NULL,
+    month_key    INT NOT NULL,                -- EXTRACT(YEAR_MONTH FROM 콘텐츠 created_at)
+    body         LONGBLOB NOT NULL,           -- COMPRESS(analysis_content)
+    archived_at  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_id, month_key)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+PARTITION BY RANGE (month_key) (
+    PARTITION p_future VALUES LESS THAN MAXVALUE
+);
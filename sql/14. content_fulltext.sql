@@ -0,0 +1,9 @@
+-- ============================================================
+-- content_analysis: 제목 + 분석 본문 전문 검색 인덱스 (search_contents)
+-- MariaDB 는 MySQL 의 ngram 파서를 지원하지 않으므로 기본 파서(공백 단위 어절)를 쓰고,
+-- 검색 측에서 BOOLEAN MODE 접두 일치('삼성전자*')로 조사가 붙은 어절을 찾는다.
+-- 한국어 2글자 단어(예: 증권, 금리)를 색인하려면 서버 설정에서
+--   innodb_ft_min_token_size = 2
+-- 로 낮춘 뒤 이 인덱스를 만들어야 한다 (이미 있으면 DROP 후 재생성).
+-- ============================================================
+CREATE FULLTEXT INDEX IF NOT EXISTS ft_title_content ON content_analysis (title, analysis_content);
@@ -0,0 +1,35 @@
+-- ============================================================
+-- 섀도 전략 변형(variant) — 한 번의 closing_bet 실행에서 수집한 후보 피처를
+-- 변형 설정마다 재채점해 라벨별 랭킹을 남기고, gap_check 가 변형별 갭 성과를 비교
+-- ============================================================
+
+-- 변형 설정: strategy_config 와 동일한 키 중 덮어쓸 항목만 저장
+-- 예) INSERT INTO strategy_variant (name, config) VALUES ('theme_heavy', '{"THEME_STOCK_BONUS": 25}');
+CREATE TABLE IF NOT EXISTS strategy_variant (
+    name       VARCHAR(50) PRIMARY KEY,
+    config     JSON NOT NULL,
+    is_active  BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 변형별 일간 랭킹 (Top N) + 다음날 갭 체크 결과
+CREATE TABLE IF NOT EXISTS daily_variant_report (
+    id             INT AUTO_INCREMENT PRIMARY KEY,
+    report_date    DATE NOT NULL,
+    variant        VARCHAR(50) NOT NULL,
+    stock_code     VARCHAR(20) NOT NULL,
+    stock_name     VARCHAR(100) NOT NULL,
+    current_price  INT DEFAULT 0,
+    supply_score   FLOAT DEFAULT 0.0,
+    score          FLOAT DEFAULT 0.0,
+    rank_no        INT DEFAULT 0,
+    gap_nxt_price  INT DEFAULT NULL,
+    gap_nxt_pct    FLOAT DEFAULT NULL,
+    gap_krx_price  INT DEFAULT NULL,
+    gap_krx_pct    FLOAT DEFAULT NULL,
+    gap_checked_at TIMESTAMP NULL DEFAULT NULL,
+    created_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_date_variant_code (report_date, variant, stock_code),
+    INDEX idx_report_date (report_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
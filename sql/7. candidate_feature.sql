@@ -0,0 +1,32 @@
+-- ============================================================
+-- Phase 2 후보 피처 저장소 — Top 10 밖 후보까지 일자별 전체 보관
+-- 재채점(what-if)·백테스트가 키움 재조회 없이 동작하도록 원시 피처를 남긴다.
+--   flags          : bit0 정배열, bit1 신고가근처, bit2 대장주, bit3 테마주,
+--                    bit4 수급조회여부(점수상한 가지치기 시 0), bit5 외국계거래원 매수우위
+--   supply_history : 바이너리 패킹 (헤더 2B + 일별 16B: YYYYMMDD, 기관/외국인/개인 백만원)
+--   rank_no        : Top N 밖이면 NULL
+-- ============================================================
+CREATE TABLE IF NOT EXISTS daily_candidate_feature (
+    report_date       DATE NOT NULL,
+    stock_code        VARCHAR(20) NOT NULL,
+    stock_name        VARCHAR(100) NOT NULL,
+    sector            VARCHAR(50) DEFAULT NULL,
+    current_price     INT DEFAULT 0,
+    change_pct        FLOAT DEFAULT 0.0,
+    trading_value     BIGINT DEFAULT 0,
+    market_cap        BIGINT DEFAULT 0,
+    flags             TINYINT UNSIGNED NOT NULL DEFAULT 0,
+    inst_net_buy      BIGINT DEFAULT 0,
+    frgn_net_buy      BIGINT DEFAULT 0,
+    indv_net_buy      BIGINT DEFAULT 0,
+    prog_net_buy      BIGINT DEFAULT 0,
+    supply_days       SMALLINT DEFAULT 0,
+    supply_history    VARBINARY(255) DEFAULT NULL,
+    content_count     SMALLINT DEFAULT 0,
+    content_avg_score FLOAT DEFAULT 0.0,
+    supply_score      FLOAT DEFAULT 0.0,
+    content_score     FLOAT DEFAULT 0.0,
+    score             FLOAT DEFAULT 0.0,
+    rank_no           SMALLINT DEFAULT NULL,
+    PRIMARY KEY (report_date, stock_code)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
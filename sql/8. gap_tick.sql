@@ -0,0 +1,15 @@
+-- ============================================================
+-- 갭 추적 시계열 — 전날 Top N 종목의 장전·개장 구간(08:00~09:30) 시세 틱
+-- gap_check --track 이 설정 간격으로 폴링해 라운드마다 일괄 INSERT 한다.
+--   ts        : 폴링 라운드 시각 (초 단위)
+--   nxt_price : NXT 현재가 (미지원/조회 실패 시 NULL)
+--   krx_price : KRX 현재가 (09:00 이전·조회 실패 시 NULL)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS gap_tick (
+    report_date DATE NOT NULL,
+    stock_code  VARCHAR(20) NOT NULL,
+    ts          DATETIME NOT NULL,
+    nxt_price   INT DEFAULT NULL,
+    krx_price   INT DEFAULT NULL,
+    PRIMARY KEY (report_date, stock_code, ts)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,44 @@
+-- ============================================================
+-- content_ticker: 콘텐츠 ↔ 언급 종목 정규화 매핑
+-- related_tickers(VARCHAR JSON) LIKE '%코드%' 전체 스캔(부분 문자열 오매칭 포함)을
+-- (ticker, created_at) 인덱스 조인으로 대체한다.
+--   sector     : ticker_sectors 의 같은 종목 섹터 (미해석 시 NULL)
+--   created_at : content_analysis.created_at 복사 (기간 필터를 조인 전에 인덱스로 처리)
+-- save_content_analysis 가 콘텐츠 INSERT 와 같은 트랜잭션에서 채운다.
+-- ============================================================
+CREATE TABLE IF NOT EXISTS content_ticker (
+    content_id  INT NOT NULL,
+    ticker      VARCHAR(20) NOT NULL,
+    sector      VARCHAR(100) DEFAULT NULL,
+    created_at  TIMESTAMP NOT NULL,
+    PRIMARY KEY (content_id, ticker),
+    INDEX idx_ticker_created (ticker, created_at),
+    INDEX idx_created (created_at),
+    CONSTRAINT fk_content_ticker_content
+        FOREIGN KEY (content_id) REFERENCES content_analysis (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 기존 콘텐츠 백필 (JSON_TABLE, MariaDB 10.6+). 멱등: INSERT IGNORE.
+-- 잘린/깨진 JSON 행은 JSON_VALID 로 건너뛴다.
+-- 티커는 save_content_analysis 의 _ticker_code 와 같이 정규화한다
+-- (TRIM → '.KS'/'_NX' 등 접미사 제거 → UPPER). 섹터 매칭도 같은 형태로 비교.
+INSERT IGNORE INTO content_ticker (content_id, ticker, sector, created_at)
+SELECT ca.id,
+       UPPER(SUBSTRING_INDEX(SUBSTRING_INDEX(TRIM(t.ticker), '.', 1), '_', 1)),
+       (SELECT s.sector
+          FROM JSON_TABLE(
+                   IF(JSON_VALID(ca.ticker_sectors), ca.ticker_sectors, '[]'), '$[*]'
+                   COLUMNS (ticker VARCHAR(20) PATH '$.ticker',
+                            sector VARCHAR(100) PATH '$.sector')
+               ) s
+         WHERE UPPER(SUBSTRING_INDEX(SUBSTRING_INDEX(TRIM(s.ticker), '.', 1), '_', 1)) = UPPER(SUBSTRING_INDEX(SUBSTRING_INDEX(TRIM(t.ticker), '.', 1), '_', 1))
+         LIMIT 1),
+       ca.created_at
+  FROM content_analysis ca
+  JOIN JSON_TABLE(
+           ca.related_tickers, '$[*]'
+           COLUMNS (ticker VARCHAR(20) PATH '$.ticker')
+       ) t
+ WHERE ca.related_tickers IS NOT NULL
+   AND JSON_VALID(ca.related_tickers)
+   AND TRIM(t.ticker) != '';